@@ -0,0 +1,125 @@
+"""Helpers shared by the benchmarks.
+
+The benchmarks talk to the ASGI app in-process, so the numbers contain the
+routing, dependency injection and database work but no network stack.
+They run against the database configured by the tap_ settings.
+"""
+import json
+import statistics
+import time
+from contextlib import asynccontextmanager, contextmanager
+from typing import Any, AsyncIterator, Awaitable, Callable, Iterator
+from urllib.parse import urlencode
+
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import AsyncEngine
+
+
+class AsgiClient:
+    """Minimal in-process HTTP client calling the ASGI app directly."""
+
+    def __init__(self, app: Any):
+        self.app = app
+
+    async def request(
+        self,
+        method: str,
+        path: str,
+        json_body: Any = None,
+        form: dict[str, str] | None = None,
+        params: dict[str, Any] | None = None,
+        headers: dict[str, str] | None = None,
+    ) -> tuple[int, dict[str, str], bytes]:
+        body = b""
+        request_headers = {k.lower(): v for k, v in (headers or {}).items()}
+        if json_body is not None:
+            body = json.dumps(json_body).encode()
+            request_headers["content-type"] = "application/json"
+        elif form is not None:
+            body = urlencode(form).encode()
+            request_headers["content-type"] = "application/x-www-form-urlencoded"
+        request_headers["content-length"] = str(len(body))
+
+        scope = {
+            "type": "http",
+            "asgi": {"version": "3.0"},
+            "http_version": "1.1",
+            "method": method,
+            "scheme": "http",
+            "path": path,
+            "raw_path": path.encode(),
+            "query_string": urlencode(params or {}).encode(),
+            "headers": [(k.encode(), v.encode()) for k, v in request_headers.items()],
+            "client": ("127.0.0.1", 50000),
+            "server": ("testserver", 80),
+        }
+        sent = False
+        status = 0
+        response_headers: dict[str, str] = {}
+        chunks: list[bytes] = []
+
+        async def receive() -> dict[str, Any]:
+            nonlocal sent
+            if sent:
+                return {"type": "http.disconnect"}
+            sent = True
+            return {"type": "http.request", "body": body, "more_body": False}
+
+        async def send(message: dict[str, Any]) -> None:
+            nonlocal status
+            if message["type"] == "http.response.start":
+                status = message["status"]
+                response_headers.update((k.decode(), v.decode()) for k, v in message.get("headers", []))
+            elif message["type"] == "http.response.body":
+                chunks.append(message.get("body", b""))
+
+        await self.app(scope, receive, send)
+        return status, response_headers, b"".join(chunks)
+
+
+@asynccontextmanager
+async def running_app(app: Any) -> AsyncIterator[AsgiClient]:
+    """Runs the app lifespan around the benchmark."""
+    async with app.router.lifespan_context(app):
+        yield AsgiClient(app)
+
+
+class StatementCounter:
+    count = 0
+
+
+@contextmanager
+def count_statements(engine: AsyncEngine) -> Iterator[StatementCounter]:
+    """Counts the statements sent to the database, i.e. the round-trips paid on a real network."""
+    counter = StatementCounter()
+
+    def on_execute(*args: Any) -> None:
+        counter.count += 1
+
+    event.listen(engine.sync_engine, "before_cursor_execute", on_execute)
+    try:
+        yield counter
+    finally:
+        event.remove(engine.sync_engine, "before_cursor_execute", on_execute)
+
+
+async def measure(call: Callable[[int], Awaitable[Any]], iterations: int) -> list[float]:
+    """Calls call(i) sequentially and returns the latency of each call in milliseconds."""
+    latencies = []
+    for i in range(iterations):
+        started = time.perf_counter()
+        await call(i)
+        latencies.append((time.perf_counter() - started) * 1000)
+    return latencies
+
+
+def report(name: str, latencies: list[float], statements: int | None = None) -> None:
+    ordered = sorted(latencies)
+    p95 = ordered[min(len(ordered) - 1, int(len(ordered) * 0.95))]
+    line = (
+        f"{name:<40} n={len(ordered):<6} mean={statistics.fmean(ordered):8.3f}ms "
+        f"p50={statistics.median(ordered):8.3f}ms p95={p95:8.3f}ms"
+    )
+    if statements is not None:
+        line += f" statements/op={statements / len(ordered):.1f}"
+    print(line)
@@ -0,0 +1,84 @@
+"""Cost of authenticating a request, from the JWT signature check to the endpoint.
+
+Usage:
+    python -m benchmarks.auth_dependency [--iterations 5000]
+
+Measured steps:
+    JWTKeySet.decode          - signature and claims verification alone
+    AuthService.decode_token  - with the verified-token cache warm
+    get_current_user          - token and user caches warm, no database access
+    GET /v1/users/me          - the whole request through the ASGI app
+
+A superuser is created for the run and removed at the end.
+"""
+import argparse
+import asyncio
+import json
+import uuid
+
+from sqlmodel import delete
+
+from benchmarks._common import count_statements, measure, report, running_app
+from src.core.api.v1.dependencies.common_dependencies import get_current_user
+from src.core.domain.models.user import User
+from src.core.infrastructure.security.password import get_password_hash
+from src.main import create_app
+
+
+async def main(iterations: int) -> None:
+    app = create_app()
+    prefix = f"bench{uuid.uuid4().hex[:8]}"
+    async with running_app(app) as client:
+        db = app.container.db()
+        user_repository = app.container.users.user_repository()
+        user_service = app.container.users.user_service()
+        auth_service = app.container.auth.auth_service()
+        try:
+            password = "Bench1234"
+            await user_repository.create(record=User(
+                username=f"{prefix}admin",
+                email=f"{prefix}admin@example.com",
+                hashed_password=get_password_hash(password),
+                is_superuser=True,
+            ))
+            status, _, body = await client.request(
+                "POST", "/v1/login/access-token",
+                form={"username": f"{prefix}admin@example.com", "password": password}
+            )
+            if status != 200:
+                raise RuntimeError(f"Login failed: {status} {body!r}")
+            token = json.loads(body)["access_token"]
+            headers = {"Authorization": f"Bearer {token}"}
+
+            async def jwt_decode(i: int) -> None:
+                auth_service.jwt_keys.decode(token)
+
+            async def decode_token(i: int) -> None:
+                await auth_service.decode_token(token)
+
+            async def current_user(i: int) -> None:
+                await get_current_user(token, user_service=user_service, auth_service=auth_service)
+
+            async def users_me(i: int) -> None:
+                await client.request("GET", "/v1/users/me", headers=headers)
+
+            await users_me(0)
+            for name, call in (
+                ("JWTKeySet.decode", jwt_decode),
+                ("AuthService.decode_token (cached)", decode_token),
+                ("get_current_user (cached)", current_user),
+                ("GET /v1/users/me", users_me),
+            ):
+                with count_statements(db.engine) as statements:
+                    latencies = await measure(call, iterations)
+                report(name, latencies, statements.count)
+        finally:
+            async with db.session() as session:
+                await session.exec(delete(User).where(User.username.startswith(prefix)))
+                await session.commit()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--iterations", type=int, default=5000)
+    asyncio.run(main(parser.parse_args().iterations))
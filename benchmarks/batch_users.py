@@ -0,0 +1,100 @@
+"""Latency of updating many users one request each versus in one /v1/batch request.
+
+Usage:
+    python -m benchmarks.batch_users [--iterations 50] [--size 50]
+
+Measured steps, each iteration renames size users:
+    PATCH /v1/users/{id} x size      - a request, authentication and transaction per user
+    POST /v1/batch                   - one request and transaction, a savepoint per user
+    POST /v1/batch (all_or_nothing)  - one request and transaction, a single savepoint
+
+The benchmark inserts size users, plus a superuser to update them, and removes
+them at the end.
+"""
+import argparse
+import asyncio
+import json
+import uuid
+
+from sqlmodel import delete
+
+from benchmarks._common import count_statements, measure, report, running_app
+from src.core.domain.models.user import User
+from src.core.infrastructure.security.password import get_password_hash
+from src.main import create_app
+
+
+async def main(iterations: int, size: int) -> None:
+    app = create_app()
+    prefix = f"bench{uuid.uuid4().hex[:8]}"
+    async with running_app(app) as client:
+        db = app.container.db()
+        user_repository = app.container.users.user_repository()
+        try:
+            password = "Bench1234"
+            users = [
+                User(username=f"{prefix}u{i}", email=f"{prefix}u{i}@example.com", hashed_password="x")
+                for i in range(size)
+            ]
+            async with db.session() as session:
+                session.add_all(users)
+                await session.commit()
+            user_ids = [str(user.id) for user in users]
+            await user_repository.create(record=User(
+                username=f"{prefix}admin",
+                email=f"{prefix}admin@example.com",
+                hashed_password=get_password_hash(password),
+                is_superuser=True,
+            ))
+            status, _, body = await client.request(
+                "POST", "/v1/login/access-token",
+                form={"username": f"{prefix}admin@example.com", "password": password}
+            )
+            if status != 200:
+                raise RuntimeError(f"Login failed: {status} {body!r}")
+            headers = {"Authorization": f"Bearer {json.loads(body)['access_token']}"}
+
+            async def single_requests(i: int) -> None:
+                for n, user_id in enumerate(user_ids):
+                    status, _, body = await client.request(
+                        "PATCH", f"/v1/users/{user_id}",
+                        json_body={"username": f"{prefix}s{i}n{n}"}, headers=headers
+                    )
+                    if status != 200:
+                        raise RuntimeError(f"PATCH /v1/users failed: {status} {body!r}")
+
+            def batch(all_or_nothing: bool, step: str):
+                async def call(i: int) -> None:
+                    operations = [
+                        {"op": "update_user", "user_id": user_id, "command": {"username": f"{prefix}{step}{i}n{n}"}}
+                        for n, user_id in enumerate(user_ids)
+                    ]
+                    status, _, body = await client.request(
+                        "POST", "/v1/batch",
+                        json_body={"operations": operations, "all_or_nothing": all_or_nothing}, headers=headers
+                    )
+                    if status != 200 or not json.loads(body)["committed"]:
+                        raise RuntimeError(f"POST /v1/batch failed: {status} {body!r}")
+                return call
+
+            for name, call in (
+                (f"PATCH /v1/users/{{id}} x {size}", single_requests),
+                (f"POST /v1/batch ({size} updates)", batch(False, "b")),
+                (f"POST /v1/batch ({size}, all_or_nothing)", batch(True, "a")),
+            ):
+                await call(iterations)
+                with count_statements(db.engine) as statements:
+                    latencies = await measure(call, iterations)
+                report(name, latencies, statements.count)
+        finally:
+            async with db.session() as session:
+                await session.exec(delete(User).where(User.email.startswith(prefix)))
+                await session.commit()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--iterations", type=int, default=50)
+    parser.add_argument("--size", type=int, default=50)
+    args = parser.parse_args()
+    asyncio.run(main(args.iterations, args.size))
@@ -0,0 +1,109 @@
+"""Latency of user creation: check-then-insert against a single guarded INSERT.
+
+Usage:
+    python -m benchmarks.create_user [--iterations 200]
+
+The repository part compares the previous flow (fetch_by_username, fetch_by_email,
+then an ORM insert) with UserRepository.create, which is one
+INSERT ... ON CONFLICT DO NOTHING RETURNING. The endpoint part measures
+POST /v1/users end to end, password hashing included. All users created by
+the benchmark are removed at the end.
+
+Next to the latencies the number of statements per operation is printed.
+On a local database the commit dominates, every saved statement is worth
+one network round-trip to a remote one.
+"""
+import argparse
+import asyncio
+import json
+import uuid
+
+from sqlmodel import delete
+
+from benchmarks._common import count_statements, measure, report, running_app
+from src.core.domain.models.user import CreateUserDBData, User
+from src.core.infrastructure.repositories.common_repository import BaseRepository
+from src.core.infrastructure.security.password import get_password_hash
+from src.main import create_app
+
+
+async def main(iterations: int) -> None:
+    app = create_app()
+    prefix = f"bench{uuid.uuid4().hex[:8]}"
+    async with running_app(app) as client:
+        db = app.container.db()
+        unit_of_work = app.container.unit_of_work()
+        user_repository = app.container.users.user_repository()
+
+        def user_data(kind: str, i: int) -> CreateUserDBData:
+            return CreateUserDBData(
+                username=f"{prefix}{kind}{i}", email=f"{prefix}{kind}{i}@example.com", hashed_password="x"
+            )
+
+        async def check_then_insert(i: int) -> None:
+            data = user_data("a", i)
+            async with unit_of_work.begin():
+                await user_repository.fetch_by_username(username=data.username)
+                await user_repository.fetch_by_email(email=data.email)
+                await BaseRepository.create(user_repository, record=data)
+
+        async def guarded_insert(i: int) -> None:
+            async with unit_of_work.begin():
+                await user_repository.create(record=user_data("b", i))
+
+        try:
+            for name, call in (
+                ("repository: check, check, insert", check_then_insert),
+                ("repository: INSERT ... ON CONFLICT", guarded_insert),
+            ):
+                with count_statements(db.engine) as statements:
+                    latencies = await measure(call, iterations)
+                report(name, latencies, statements.count)
+
+            password = "Bench1234"
+            await user_repository.create(record=User(
+                username=f"{prefix}admin",
+                email=f"{prefix}admin@example.com",
+                hashed_password=get_password_hash(password),
+                is_superuser=True,
+            ))
+            status, _, body = await client.request(
+                "POST", "/v1/login/access-token",
+                form={"username": f"{prefix}admin@example.com", "password": password}
+            )
+            if status != 200:
+                raise RuntimeError(f"Login failed: {status} {body!r}")
+            headers = {"Authorization": f"Bearer {json.loads(body)['access_token']}"}
+
+            async def post_user(i: int) -> None:
+                status, _, body = await client.request("POST", "/v1/users/", json_body={
+                    "username": f"{prefix}c{i}", "email": f"{prefix}c{i}@example.com", "password": "Passw0rdX"
+                }, headers=headers)
+                if status != 200:
+                    raise RuntimeError(f"POST /v1/users failed: {status} {body!r}")
+
+            async def post_duplicate(i: int) -> None:
+                status, _, _ = await client.request("POST", "/v1/users/", json_body={
+                    "username": f"{prefix}c0", "email": f"{prefix}c0@example.com", "password": "Passw0rdX"
+                }, headers=headers)
+                if status != 409:
+                    raise RuntimeError(f"Expected 409 for a duplicate, got {status}")
+
+            endpoint_iterations = max(1, iterations // 10)
+            for name, call in (
+                ("POST /v1/users (created)", post_user),
+                ("POST /v1/users (409 conflict)", post_duplicate),
+            ):
+                with count_statements(db.engine) as statements:
+                    latencies = await measure(call, endpoint_iterations)
+                report(name, latencies, statements.count)
+        finally:
+            async with db.session() as session:
+                await session.exec(delete(User).where(User.username.startswith(prefix)))
+                await session.commit()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--iterations", type=int, default=200)
+    asyncio.run(main(parser.parse_args().iterations))
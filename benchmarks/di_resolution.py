@@ -0,0 +1,71 @@
+"""Cost of resolving the injected dependencies of every endpoint.
+
+Usage:
+    python -m benchmarks.di_resolution [--iterations 20000] [--path /v1/users]
+
+For every route the providers behind its Provide[...] markers, those of nested
+dependencies such as get_current_user included, are collected from the FastAPI
+dependency tree and called the way @inject calls them on each request. Next to
+the latency the number of objects built per request is printed - factories
+rebuild their whole graph every time, singletons are built once.
+
+Only the object graph is resolved, the database is not touched.
+"""
+import argparse
+import asyncio
+import gc
+from typing import Any
+
+from dependency_injector import providers
+from dependency_injector.wiring import Provide, ProvidersMap
+
+from benchmarks._common import measure, report
+from src.main import create_app
+
+
+def _injected_providers(dependant: Any, providers_map: ProvidersMap, found: list[providers.Provider]) -> list[providers.Provider]:
+    """Providers of the container instance behind the Provide markers, as @inject resolves them."""
+    for dependency in dependant.dependencies:
+        if isinstance(dependency.call, Provide):
+            found.append(providers_map.resolve_provider(dependency.call.provider, dependency.call.modifier))
+        _injected_providers(dependency, providers_map, found)
+    return found
+
+
+def _count_built(provider: providers.Provider) -> int:
+    """Number of objects the provider and its dependencies build on one call."""
+    if isinstance(provider, providers.BaseSingleton):
+        return 0
+    built = int(isinstance(provider, providers.Factory))
+    return built + sum(_count_built(related) for related in provider.related)
+
+
+async def main(iterations: int, path: str | None) -> None:
+    app = create_app()
+    providers_map = ProvidersMap(app.container)
+    for route in app.routes:
+        dependant = getattr(route, "dependant", None)
+        if dependant is None or (path and route.path != path):
+            continue
+        injected = _injected_providers(dependant, providers_map, [])
+        if not injected:
+            continue
+
+        async def resolve(i: int) -> None:
+            for provider in injected:
+                provider()
+
+        await resolve(0)
+        gc.collect()
+        latencies = await measure(resolve, iterations)
+        method = ",".join(sorted(route.methods))
+        report(f"{method} {route.path}", latencies)
+        print(f"{'':<40} providers={len(injected)} objects built/request={sum(map(_count_built, injected))}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--iterations", type=int, default=20000)
+    parser.add_argument("--path", default=None)
+    args = parser.parse_args()
+    asyncio.run(main(args.iterations, args.path))
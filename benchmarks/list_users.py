@@ -0,0 +1,126 @@
+"""Latency of GET /v1/users?limit=100 and of the serialization of its response.
+
+Usage:
+    python -m benchmarks.list_users [--iterations 500] [--limit 100] [--fields id,username]
+
+Measured steps:
+    UserService.get_users      - the page query and the validation of its rows
+    response_model path        - what FastAPI does with a returned model: dump it,
+                                 validate the dump against response_model, encode it
+    ModelResponse.render       - the validated model encoded once with orjson
+    GET /v1/users?limit=N      - the whole request through the ASGI app
+    ... (304 Not Modified)     - the same request revalidating the ETag of an unchanged page
+
+With --fields the page is restricted to those fields, as with fields= on the
+endpoint. The benchmark inserts limit users, plus a superuser to list them, and removes
+them at the end.
+"""
+import argparse
+import asyncio
+import json
+import uuid
+
+from fastapi.encoders import jsonable_encoder
+from fastapi.routing import serialize_response
+from fastapi.utils import create_model_field
+from sqlmodel import delete
+
+from benchmarks._common import count_statements, measure, report, running_app
+from src.core.api.responses import ModelResponse
+from src.core.application.queries.user.get_users_query import GetUsersQueryRequest, GetUsersQueryResponse
+from src.core.application.queries.common_queries import PaginationMeta
+from src.core.domain.models.user import User
+from src.core.infrastructure.security.password import get_password_hash
+from src.main import create_app
+
+
+async def main(iterations: int, limit: int, fields: str | None) -> None:
+    app = create_app()
+    prefix = f"bench{uuid.uuid4().hex[:8]}"
+    async with running_app(app) as client:
+        db = app.container.db()
+        unit_of_work = app.container.unit_of_work()
+        user_repository = app.container.users.user_repository()
+        user_service = app.container.users.user_service()
+        try:
+            password = "Bench1234"
+            async with db.session() as session:
+                session.add_all(
+                    User(username=f"{prefix}u{i}", email=f"{prefix}u{i}@example.com", hashed_password="x")
+                    for i in range(limit)
+                )
+                await session.commit()
+            await user_repository.create(record=User(
+                username=f"{prefix}admin",
+                email=f"{prefix}admin@example.com",
+                hashed_password=get_password_hash(password),
+                is_superuser=True,
+            ))
+            status, _, body = await client.request(
+                "POST", "/v1/login/access-token",
+                form={"username": f"{prefix}admin@example.com", "password": password}
+            )
+            if status != 200:
+                raise RuntimeError(f"Login failed: {status} {body!r}")
+            headers = {"Authorization": f"Bearer {json.loads(body)['access_token']}"}
+
+            params = {"search": prefix, "limit": limit} | ({"fields": fields} if fields else {})
+            query = GetUsersQueryRequest(**params)
+            page, etag = await user_service.get_users(query=query)
+            response = GetUsersQueryResponse.success_response(
+                query_id=query.query_id,
+                users=page.items,
+                next_cursor=page.next_cursor,
+                pagination=PaginationMeta(limit=query.limit, count=query.count, total=page.total)
+            )
+            response_field = create_model_field("response", GetUsersQueryResponse, mode="serialization")
+
+            async def get_users(i: int) -> None:
+                async with unit_of_work.begin(pin_primary=False):
+                    await user_service.get_users(query=query)
+
+            async def response_model_path(i: int) -> None:
+                content = await serialize_response(field=response_field, response_content=response)
+                json.dumps(jsonable_encoder(content), ensure_ascii=False, separators=(",", ":")).encode()
+
+            async def model_response(i: int) -> None:
+                ModelResponse(response)
+
+            async def get_users_endpoint(i: int) -> None:
+                status, _, body = await client.request(
+                    "GET", "/v1/users/", params=params, headers=headers
+                )
+                if status != 200:
+                    raise RuntimeError(f"GET /v1/users failed: {status} {body!r}")
+
+            async def get_users_not_modified(i: int) -> None:
+                status, _, body = await client.request(
+                    "GET", "/v1/users/", params=params, headers=headers | {"If-None-Match": etag}
+                )
+                if status != 304:
+                    raise RuntimeError(f"Expected 304 for an unchanged page, got {status}")
+
+            await get_users_endpoint(0)
+            for name, call in (
+                ("UserService.get_users", get_users),
+                ("response_model path", response_model_path),
+                ("ModelResponse.render", model_response),
+                (f"GET /v1/users?limit={limit}", get_users_endpoint),
+                (f"GET /v1/users?limit={limit} (304)", get_users_not_modified),
+            ):
+                with count_statements(db.engine) as statements:
+                    latencies = await measure(call, iterations)
+                report(name, latencies, statements.count)
+        finally:
+            async with db.session() as session:
+                await session.exec(delete(User).where(User.username.startswith(prefix)))
+                await session.commit()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--iterations", type=int, default=500)
+    parser.add_argument("--limit", type=int, default=100)
+    parser.add_argument("--fields", default=None)
+    args = parser.parse_args()
+    asyncio.run(main(args.iterations, args.limit, args.fields))
@@ -0,0 +1,70 @@
+"""Cost of a log call on the request path, queued versus written synchronously.
+
+Usage:
+    python -m benchmarks.logging_overhead [--iterations 20000] [--write-delay-ms 1.0]
+
+The output stream sleeps write-delay-ms on every write to stand in for a slow or
+blocked stdout (a full pipe, a stalled log collector). With the synchronous
+StreamHandler the caller waits for every write, with the queue handler of
+config.settings it only enqueues the record and the listener thread writes it.
+The database is not touched.
+"""
+import argparse
+import asyncio
+import io
+import logging
+import logging.handlers
+import queue
+import time
+
+from benchmarks._common import measure, report
+from src.utils.logging import JsonFormatter, LocalQueueHandler
+
+
+class SlowStream(io.StringIO):
+    def __init__(self, delay: float):
+        super().__init__()
+        self.delay = delay
+
+    def write(self, text: str) -> int:
+        time.sleep(self.delay)
+        return len(text)
+
+
+def _logger(name: str, handler: logging.Handler) -> logging.Logger:
+    logger = logging.getLogger(f"benchmarks.logging_overhead.{name}")
+    logger.handlers = [handler]
+    logger.propagate = False
+    logger.setLevel(logging.INFO)
+    return logger
+
+
+async def main(iterations: int, write_delay_ms: float) -> None:
+    stream_handler = logging.StreamHandler(SlowStream(write_delay_ms / 1000))
+    stream_handler.setFormatter(JsonFormatter())
+
+    records: queue.Queue = queue.Queue()
+    listener = logging.handlers.QueueListener(records, stream_handler)
+    pipelines = {
+        "sync StreamHandler": _logger("sync", stream_handler),
+        "LocalQueueHandler": _logger("queue", LocalQueueHandler(records)),
+    }
+
+    listener.start()
+    try:
+        for name, logger in pipelines.items():
+            async def log(i: int) -> None:
+                logger.info("User %s fetched", i, extra={"user_id": i})
+
+            latencies = await measure(log, iterations)
+            report(name, latencies)
+    finally:
+        listener.stop()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--iterations", type=int, default=20000)
+    parser.add_argument("--write-delay-ms", type=float, default=1.0)
+    args = parser.parse_args()
+    asyncio.run(main(args.iterations, args.write_delay_ms))
@@ -0,0 +1,84 @@
+"""Throughput of password hashing for each scheme and cost setting.
+
+Usage:
+    python -m benchmarks.password_hashing [--bcrypt-rounds 10 12] [--argon2 2:19456:1 3:65536:4]
+                                          [--seconds 2] [--sla-ms 250]
+
+For every setting the hash is timed on one thread (hashes per second per core)
+and on one thread per CPU, which shows how well it scales on this machine.
+argon2 settings are given as time_cost:memory_cost_kib:parallelism and need argon2-cffi.
+With --sla-ms the settings whose single hash fits the login latency budget are marked.
+"""
+import argparse
+import os
+import statistics
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from passlib.context import CryptContext
+
+from src.core.infrastructure.security.password import build_crypt_context
+
+PASSWORD = "Benchmark-Passw0rd"
+
+
+def hash_for(context: CryptContext, seconds: float) -> list[float]:
+    """Hashes repeatedly for about the given time and returns each duration in seconds."""
+    durations = []
+    deadline = time.perf_counter() + seconds
+    while time.perf_counter() < deadline or len(durations) < 3:
+        started = time.perf_counter()
+        context.hash(PASSWORD)
+        durations.append(time.perf_counter() - started)
+    return durations
+
+
+def run(name: str, context: CryptContext, seconds: float, cpus: int, sla_ms: float | None) -> None:
+    context.hash(PASSWORD)  # warm-up, loads the backend
+    single = hash_for(context, seconds)
+    per_core = len(single) / sum(single)
+
+    started = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=cpus) as executor:
+        parallel = sum(len(result) for result in executor.map(lambda _: hash_for(context, seconds), range(cpus)))
+    total = parallel / (time.perf_counter() - started)
+
+    hash_ms = statistics.median(single) * 1000
+    line = (
+        f"{name:<28} {hash_ms:9.1f} ms/hash {per_core:9.2f} hashes/s/core "
+        f"{total:9.2f} hashes/s on {cpus} threads ({total / per_core / cpus:5.0%} scaling)"
+    )
+    if sla_ms is not None:
+        line += "  fits SLA" if hash_ms <= sla_ms else "  exceeds SLA"
+    print(line)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--bcrypt-rounds", type=int, nargs="*", default=[10, 11, 12])
+    parser.add_argument("--argon2", nargs="*", default=["2:19456:1", "3:65536:4"], metavar="T:M:P")
+    parser.add_argument("--seconds", type=float, default=2.0, help="Measuring time of each run")
+    parser.add_argument("--sla-ms", type=float, default=None, help="Latency budget of a single hash")
+    args = parser.parse_args()
+    cpus = os.cpu_count() or 1
+
+    for rounds in args.bcrypt_rounds:
+        run(f"bcrypt rounds={rounds}", build_crypt_context(["bcrypt"], bcrypt_rounds=rounds), args.seconds, cpus, args.sla_ms)
+
+    for setting in args.argon2:
+        time_cost, memory_cost, parallelism = (int(value) for value in setting.split(":"))
+        try:
+            context = build_crypt_context(
+                ["argon2"],
+                argon2_time_cost=time_cost,
+                argon2_memory_cost=memory_cost,
+                argon2_parallelism=parallelism,
+            )
+        except RuntimeError as e:
+            print(f"argon2id {setting}: skipped, {e}")
+            continue
+        run(f"argon2id t={time_cost} m={memory_cost} p={parallelism}", context, args.seconds, cpus, args.sla_ms)
+
+
+if __name__ == "__main__":
+    main()
@@ -20,28 +20,62 @@ class Settings(BaseSettings):
             "standard": {
                 "format": "%(asctime)s [%(levelname)s] %(name)s: %(message)s",
             },
+            "json": {
+                "()": "src.utils.logging.JsonFormatter",
+            },
+        },
+        "filters": {
+            # per logger, a flood of one message cannot starve the others
+            "rate_limit": {
+                "()": "src.utils.logging.RateLimitFilter",
+                "rate": 100,
+                "burst": 200,
+            },
+            "sample": {
+                "()": "src.utils.logging.SamplingFilter",
+                "rate": 0.1,
+                "level": "WARNING",
+            },
         },
         "handlers": {
             "stdout": {
                 "level": "INFO",
-                "formatter": "standard",
+                "formatter": "json",
                 "class": "logging.StreamHandler",
                 "stream": "ext://sys.stdout",  # Default is stderr
             },
+            # the caller only enqueues, formatting and the stdout write run on the listener thread
+            "queue": {
+                "class": "src.utils.logging.LocalQueueHandler",
+                "handlers": ["stdout"],
+                "filters": ["rate_limit"],
+                "respect_handler_level": True,
+            },
         },
         "loggers": {
             "": {  # root logger
-                "handlers": ["stdout"],
+                "handlers": ["queue"],
                 "level": "WARNING",
                 "propagate": False,
             },
+            "src": {
+                "handlers": ["queue"],
+                "level": "INFO",
+                "propagate": False,
+            },
+            "uvicorn.access": {
+                "handlers": ["queue"],
+                "level": "INFO",
+                "filters": ["sample"],
+                "propagate": False,
+            },
             "apolonia": {
-                "handlers": ["stdout"],
+                "handlers": ["queue"],
                 "level": "INFO",
                 "propagate": False,
             },
             "__main__": {  # if __name__ == '__main__'
-                "handlers": ["stdout"],
+                "handlers": ["queue"],
                 "level": "DEBUG",
                 "propagate": False,
             },
@@ -50,6 +84,46 @@ class Settings(BaseSettings):
 
     title: str = "Vinted Automation API"
     db_url: str
+    db_pool_size: int = 10
+    db_max_overflow: int = 20
+    db_pool_timeout: float = 30.0
+    db_pool_recycle: int = 1800
+    db_pool_pre_ping: bool = True
+    db_statement_cache_size: int = 100
+    db_prepared_statement_cache_size: int = 100
+    db_replica_urls: list[str] = []
+    # first scheme hashes new passwords, the others are rehashed on login
+    password_schemes: list[str] = ["bcrypt"]
+    password_bcrypt_rounds: int = 12
+    password_argon2_time_cost: int = 3
+    password_argon2_memory_cost: int = 65536
+    password_argon2_parallelism: int = 4
+    password_hash_workers: Optional[int] = None
+    password_hash_max_pending: int = 64
+    password_hash_acquire_timeout: float = 5.0
+    user_cache_size: int = 10000
+    user_cache_ttl: float = 30.0
+    token_cache_size: int = 10000
+    # lifetime of cached tokens without an exp claim, the others are kept until they expire
+    token_cache_ttl: float = 300.0
+    # revoked tokens are checked against a bloom filter rebuilt from the database every interval
+    token_revocation_capacity: int = 100000
+    token_revocation_error_rate: float = 0.01
+    token_revocation_refresh_interval: float = 60.0
+    # failed logins allowed per email and per client address, "postgres" shares the counts between workers
+    login_throttle_backend: Literal["memory", "postgres"] = "memory"
+    login_throttle_window: float = 300.0
+    login_throttle_max_attempts_per_email: int = 5
+    login_throttle_max_attempts_per_ip: int = 50
+    login_throttle_max_keys: int = 100000
     ALGORITHM: str = "HS256"
     SECRET_KEY: str = "HS256"
-    ACCESS_TOKEN_EXPIRE_MINUTES: Optional[int] = 30
\ No newline at end of file
+    ACCESS_TOKEN_EXPIRE_MINUTES: Optional[int] = 30
+    REFRESH_TOKEN_EXPIRE_DAYS: int = 30
+    # modules of src/modules and the automation_hub.modules entry points to mount, all when None
+    modules_enabled: Optional[list[str]] = None
+    # import every module at startup instead of on its first request
+    modules_preload: bool = False
+    # PEM private keys or paths to them for the asymmetric algorithms, the first one signs
+    # and all of them are published in /.well-known/jwks.json
+    jwt_private_keys: list[str] = []
\ No newline at end of file
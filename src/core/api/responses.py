@@ -0,0 +1,35 @@
+from typing import Any, Mapping
+
+import orjson
+from fastapi.responses import ORJSONResponse
+from pydantic import BaseModel
+
+
+class ModelResponse(ORJSONResponse):
+    """JSON response of a model the handler already validated.
+
+    FastAPI sends a returned Response as is, so the model skips the response_model
+    round trip (dumped, validated again, encoded) and is encoded once: pydantic
+    dumps it to JSON compatible objects in its serializer, orjson encodes them.
+    Endpoints keep their response_model for the OpenAPI schema. The etag, by default
+    the one the model carries, is sent as the ETag header with the client told to
+    revalidate it before reusing the response.
+    """
+
+    def __init__(
+        self,
+        content: Any,
+        status_code: int = 200,
+        headers: Mapping[str, str] | None = None,
+        etag: str | None = None,
+        **kwargs: Any
+    ):
+        etag = etag or getattr(content, "etag", None)
+        if etag:
+            headers = {"ETag": etag, "Cache-Control": "private, no-cache", **(headers or {})}
+        super().__init__(content, status_code, headers, **kwargs)
+
+    def render(self, content: Any) -> bytes:
+        if isinstance(content, BaseModel):
+            content = content.model_dump(mode="json")
+        return orjson.dumps(content, option=orjson.OPT_NON_STR_KEYS)
@@ -3,10 +3,15 @@ from typing import Annotated
 from dependency_injector.wiring import Provide
 from src.core.infrastructure.containers.user_container import UserContainer
 from src.core.application.handlers.auth.login_user_handler import LoginUserHandler
+from src.core.application.handlers.auth.refresh_token_handler import RefreshTokenHandler
+from src.core.application.handlers.auth.logout_user_handler import LogoutUserHandler
 from src.core.infrastructure.containers.common_container import AutomationHubContainer
 from fastapi.security import OAuth2PasswordBearer
 
 
 oauth2_scheme = OAuth2PasswordBearer(tokenUrl="/v1/login/access-token")
+optional_oauth2_scheme = OAuth2PasswordBearer(tokenUrl="/v1/login/access-token", auto_error=False)
 
 LoginUserHandlerDep = Annotated[LoginUserHandler, Depends(Provide[AutomationHubContainer.auth.login_user_handler])]
+RefreshTokenHandlerDep = Annotated[RefreshTokenHandler, Depends(Provide[AutomationHubContainer.auth.refresh_token_handler])]
+LogoutUserHandlerDep = Annotated[LogoutUserHandler, Depends(Provide[AutomationHubContainer.auth.logout_user_handler])]
\ No newline at end of file
@@ -0,0 +1,8 @@
+from fastapi import Depends
+from typing import Annotated
+from dependency_injector.wiring import Provide
+from src.core.application.handlers.batch.batch_handler import BatchHandler
+from src.core.infrastructure.containers.common_container import AutomationHubContainer
+
+
+BatchHandlerDep = Annotated[BatchHandler, Depends(Provide[AutomationHubContainer.batch.batch_handler])]
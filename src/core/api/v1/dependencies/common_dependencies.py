@@ -1,12 +1,19 @@
 from fastapi import Depends, HTTPException, status
-from typing import Annotated
-from datetime import datetime, timezone
+from typing import Annotated, AsyncIterator
 from pydantic import ValidationError
 
 from src.core.application.services.user_service import UserService
 from src.core.application.services.auth_service import AuthService
-from src.core.domain.models.user import User
+from src.core.domain.models.user import UserResponse
+from src.core.infrastructure.cache.ttl_cache import LRUTTLCache
 from src.core.domain.models.auth import TokenPayload
+from src.core.infrastructure.database.unit_of_work import UnitOfWork
+from src.core.infrastructure.database.db import Database
+from src.core.infrastructure.security.password import PasswordHasher
+from src.core.infrastructure.security.revocation import TokenRevocationStore
+from src.core.infrastructure.security.login_throttle import LoginThrottle
+from src.core.infrastructure.security.jwt_keys import JWTKeySet
+from src.core.infrastructure.modules.registry import ModuleRegistry
 from src.core.infrastructure.containers.common_container import AutomationHubContainer
 from jose import JWTError
 from dependency_injector.wiring import Provide, inject
@@ -16,16 +23,41 @@ from src.core.api.v1.dependencies.auth_dependencies import oauth2_scheme
 TokenDep = Annotated[str, Depends(oauth2_scheme)]
 UserServiceDep = Annotated[UserService, Depends(Provide[AutomationHubContainer.users.user_service])]
 AuthServiceDep = Annotated[AuthService, Depends(Provide[AutomationHubContainer.auth.auth_service])]
+UnitOfWorkDep = Annotated[UnitOfWork, Depends(Provide[AutomationHubContainer.unit_of_work])]
+DatabaseDep = Annotated[Database, Depends(Provide[AutomationHubContainer.db])]
+TokenCacheDep = Annotated[LRUTTLCache, Depends(Provide[AutomationHubContainer.token_cache])]
+UserCacheDep = Annotated[LRUTTLCache, Depends(Provide[AutomationHubContainer.user_cache])]
+PasswordHasherDep = Annotated[PasswordHasher, Depends(Provide[AutomationHubContainer.password_hasher])]
+TokenRevocationStoreDep = Annotated[TokenRevocationStore, Depends(Provide[AutomationHubContainer.token_revocation_store])]
+LoginThrottleDep = Annotated[LoginThrottle, Depends(Provide[AutomationHubContainer.login_throttle])]
+JWTKeySetDep = Annotated[JWTKeySet, Depends(Provide[AutomationHubContainer.jwt_keys])]
+ModuleRegistryDep = Annotated[ModuleRegistry, Depends(Provide[AutomationHubContainer.module_registry])]
+
+@inject
+async def get_unit_of_work(unit_of_work: UnitOfWorkDep) -> UnitOfWork:
+    return unit_of_work
+
+
+async def request_unit_of_work(
+    unit_of_work: Annotated[UnitOfWork, Depends(get_unit_of_work)],
+) -> AsyncIterator[None]:
+    """Binds one unit of work to the whole request.
+
+    Reads stay on the replicas until a command pins the request to the primary.
+    Kept outside of the wiring on purpose - an injected async generator does not
+    receive the endpoint's exception, so the transaction would never roll back.
+    """
+    async with unit_of_work.begin(pin_primary=False):
+        yield
 
 @inject
 async def get_current_user(
     token: TokenDep,
     user_service: UserServiceDep,
     auth_service: AuthServiceDep,
-) -> User:
+) -> UserResponse:
     try:
         payload = await auth_service.decode_token(token)
-        print(payload)
         if not isinstance(payload, dict):
             raise HTTPException(
                 status_code=status.HTTP_401_UNAUTHORIZED,
@@ -38,15 +70,7 @@ async def get_current_user(
             detail="Could not validate credentials",
         )
 
-    if token_data.exp is not None:
-        now = datetime.now(timezone.utc).timestamp()
-        if now > token_data.exp:
-            raise HTTPException(
-                status_code=status.HTTP_401_UNAUTHORIZED,
-                detail="Token has expired",
-            )
-
-    user = await user_service.get_user_by_id(user_id=token_data.sub)
+    user = await user_service.get_authenticated_user(user_id=token_data.sub)
 
     if user is None:
         raise HTTPException(status_code=404, detail="User not found")
@@ -56,9 +80,9 @@ async def get_current_user(
 
     return user
 
-CurrentUser = Annotated[User, Depends(get_current_user)]
+CurrentUser = Annotated[UserResponse, Depends(get_current_user)]
 
-async def get_current_active_superuser(current_user: CurrentUser) -> User:
+async def get_current_active_superuser(current_user: CurrentUser) -> UserResponse:
     if not current_user.is_superuser:
         raise HTTPException(
             status_code=status.HTTP_403_FORBIDDEN,
@@ -66,4 +90,4 @@ async def get_current_active_superuser(current_user: CurrentUser) -> User:
         )
     return current_user
 
-CurrentSuperuser = Annotated[User, Depends(get_current_active_superuser)]
\ No newline at end of file
+CurrentSuperuser = Annotated[UserResponse, Depends(get_current_active_superuser)]
\ No newline at end of file
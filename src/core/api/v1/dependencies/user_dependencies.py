@@ -4,6 +4,8 @@ from src.core.infrastructure.containers.user_container import UserContainer
 from src.core.application.handlers.user.create_user_handler import CreateUserHandler
 from src.core.application.handlers.user.get_user_by_id_handler import GetUserByIdHandler
 from src.core.application.handlers.user.get_users_handler import GetUsersHandler
+from src.core.application.handlers.user.export_users_handler import ExportUsersHandler
+from src.core.application.handlers.user.import_users_handler import ImportUsersHandler
 from src.core.application.handlers.user.deactivate_user_handler import DeactivateUserHandler
 from src.core.application.handlers.user.update_user_handler import UpdateUserHandler
 from src.core.application.handlers.user.delete_user_handler import DeleteUserHandler
@@ -15,6 +17,8 @@ from src.core.infrastructure.containers.common_container import AutomationHubCon
 CreateUserHandlerDep = Annotated[CreateUserHandler, Depends(Provide[AutomationHubContainer.users.create_user_handler])]
 GetUserByIdHandlerDep = Annotated[GetUserByIdHandler, Depends(Provide[AutomationHubContainer.users.get_user_by_id_handler])]
 GetUsersHandlerDep = Annotated[GetUsersHandler, Depends(Provide[AutomationHubContainer.users.get_users_handler])]
+ExportUsersHandlerDep = Annotated[ExportUsersHandler, Depends(Provide[AutomationHubContainer.users.export_users_handler])]
+ImportUsersHandlerDep = Annotated[ImportUsersHandler, Depends(Provide[AutomationHubContainer.users.import_users_handler])]
 DeactivateUserHandlerDep = Annotated[DeactivateUserHandler, Depends(Provide[AutomationHubContainer.users.deactivate_user_handler])]
 UpdateUserHandlerDep = Annotated[UpdateUserHandler, Depends(Provide[AutomationHubContainer.users.update_user_handler])]
 DeleteUserHandlerDep = Annotated[DeleteUserHandler, Depends(Provide[AutomationHubContainer.users.delete_user_handler])]
@@ -1,10 +1,21 @@
-from fastapi import APIRouter, Depends
+from fastapi import APIRouter, Body, Depends, Request
 from src.core.application.commands.auth.login_user_command import LoginUserCommandResponse, LoginUserCommandRequest
+from src.core.application.commands.auth.refresh_token_command import RefreshTokenCommandRequest, RefreshTokenCommandResponse
+from src.core.application.commands.auth.logout_user_command import LogoutUserCommandRequest, LogoutUserCommandResponse
 from dependency_injector.wiring import inject
 from src.core.decorators.exception_handler import handle_exceptions
 from typing import Annotated
-from src.core.api.v1.dependencies.auth_dependencies import LoginUserHandlerDep
+from src.core.api.v1.dependencies.auth_dependencies import LoginUserHandlerDep, RefreshTokenHandlerDep, LogoutUserHandlerDep, optional_oauth2_scheme
 from fastapi.security import OAuth2PasswordRequestForm
+from src.core.domain.exceptions.auth import (
+    InvalidCredentialsError,
+    PasswordHasherBusyError,
+    TooManyLoginAttemptsError,
+    InvalidRefreshTokenError,
+    RefreshTokenReusedError
+)
+from src.core.domain.exceptions.user import InactiveUserError
+from src.utils.utils import generate_openapi_responses
 
 
 tags = [
@@ -20,10 +31,12 @@ router = APIRouter(
 
 
 @router.post("/login/access-token",
-             response_model=LoginUserCommandResponse)
+             response_model=LoginUserCommandResponse,
+             responses=generate_openapi_responses(InvalidCredentialsError, InactiveUserError, PasswordHasherBusyError, TooManyLoginAttemptsError))
 @inject
 @handle_exceptions
 async def login_access_token(
+    request: Request,
     form_data: Annotated[OAuth2PasswordRequestForm, Depends()],
     handler: LoginUserHandlerDep
 ) -> LoginUserCommandResponse:
@@ -31,17 +44,37 @@ async def login_access_token(
         email=form_data.username,
         password=form_data.password
     )
-    return await handler(command_request)
+    client_ip = request.client.host if request.client else None
+    return await handler(command_request, client_ip=client_ip)
 
 
 
-@router.post("/logout")
-async def logut_user():
-    ...
+@router.post("/logout",
+             response_model=LogoutUserCommandResponse)
+@inject
+@handle_exceptions
+async def logout_user(
+    command_request: Annotated[LogoutUserCommandRequest, Body()],
+    handler: LogoutUserHandlerDep,
+    access_token: Annotated[str | None, Depends(optional_oauth2_scheme)] = None
+) -> LogoutUserCommandResponse:
+    """Revoke the session of the refresh token, including every token rotated from it.
 
-@router.post("/token/refresh")
-async def refresh_access_token():
-    ...
+    The bearer access token sent with the request, if any, is revoked as well.
+    """
+    return await handler(command_request, access_token=access_token)
+
+@router.post("/token/refresh",
+             response_model=RefreshTokenCommandResponse,
+             responses=generate_openapi_responses(InvalidRefreshTokenError, RefreshTokenReusedError, InactiveUserError))
+@inject
+@handle_exceptions
+async def refresh_access_token(
+    command_request: Annotated[RefreshTokenCommandRequest, Body()],
+    handler: RefreshTokenHandlerDep
+) -> RefreshTokenCommandResponse:
+    """Exchange a refresh token for a new access token and the next refresh token."""
+    return await handler(command_request)
 
 @router.post("/login/verify")
 async def verify_login_code():
@@ -0,0 +1,40 @@
+from src.core.application.commands.batch.batch_command import BatchCommandRequest, BatchCommandResponse
+from src.core.api.v1.dependencies.common_dependencies import CurrentSuperuser
+from src.core.api.v1.dependencies.batch_dependencies import BatchHandlerDep
+from src.core.decorators.exception_handler import handle_exceptions
+from src.core.api.responses import ModelResponse
+
+from fastapi import APIRouter, Body
+from typing import Annotated
+from dependency_injector.wiring import inject
+
+
+tags = [
+    {
+        "name": "Batch",
+        "description": "Endpoints running several operations in one request.",
+    }
+]
+
+router = APIRouter(
+    tags=["Batch"],
+    prefix="/batch"
+)
+
+
+@router.post("",
+             response_model=BatchCommandResponse)
+@inject
+@handle_exceptions
+async def execute_batch(
+    command_request: Annotated[BatchCommandRequest, Body()],
+    handler: BatchHandlerDep,
+    current_superuser: CurrentSuperuser
+) -> ModelResponse:
+    """Run user commands and queries in order, in one transaction.
+
+    Every operation gets the status code and error its own endpoint would answer.
+    A failed operation is rolled back alone, or with all_or_nothing the whole batch
+    is rolled back and the remaining operations are skipped (424).
+    """
+    return ModelResponse(await handler(command_request))
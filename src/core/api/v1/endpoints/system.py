@@ -0,0 +1,90 @@
+from fastapi import APIRouter
+from dependency_injector.wiring import inject
+
+from src.core.api.v1.dependencies.common_dependencies import CurrentSuperuser, DatabaseDep, LoginThrottleDep, ModuleRegistryDep, PasswordHasherDep, TokenCacheDep, TokenRevocationStoreDep, UserCacheDep
+from src.core.infrastructure.cache.ttl_cache import CacheStats
+from src.core.infrastructure.database.pool import DatabasePoolStats
+from src.core.infrastructure.security.password import PasswordHasherStats
+from src.core.infrastructure.security.revocation import TokenRevocationStats
+from src.core.infrastructure.security.login_throttle import LoginThrottleStats
+from src.core.infrastructure.modules.registry import ModuleStats
+
+
+tags = [
+    {
+        "name": "System",
+        "description": "Endpoints exposing runtime metrics of the hub.",
+    }
+]
+
+router = APIRouter(
+    tags=["System"],
+    prefix="/system"
+)
+
+
+@router.get("/db/pool",
+            response_model=DatabasePoolStats)
+@inject
+async def get_db_pool_stats(
+    db: DatabaseDep,
+    current_superuser: CurrentSuperuser
+) -> DatabasePoolStats:
+    """Get connection pool usage and acquisition wait metrics of the primary and replicas."""
+    return db.pool_stats()
+
+
+@router.get("/password-hasher",
+            response_model=PasswordHasherStats)
+@inject
+async def get_password_hasher_stats(
+    password_hasher: PasswordHasherDep,
+    current_superuser: CurrentSuperuser
+) -> PasswordHasherStats:
+    """Get queue depth, rejections and latency of the password hashing pool."""
+    return password_hasher.stats()
+
+
+@router.get("/caches",
+            response_model=dict[str, CacheStats])
+@inject
+async def get_cache_stats(
+    user_cache: UserCacheDep,
+    token_cache: TokenCacheDep,
+    current_superuser: CurrentSuperuser
+) -> dict[str, CacheStats]:
+    """Get size, hit/miss, eviction and invalidation metrics of the in-process caches."""
+    return {"users": user_cache.stats(), "tokens": token_cache.stats()}
+
+
+@router.get("/token-revocation",
+            response_model=TokenRevocationStats)
+@inject
+async def get_token_revocation_stats(
+    token_revocation_store: TokenRevocationStoreDep,
+    current_superuser: CurrentSuperuser
+) -> TokenRevocationStats:
+    """Get filter size, database lookups and false positives of the token revocation denylist."""
+    return token_revocation_store.stats()
+
+
+@router.get("/login-throttle",
+            response_model=LoginThrottleStats)
+@inject
+async def get_login_throttle_stats(
+    login_throttle: LoginThrottleDep,
+    current_superuser: CurrentSuperuser
+) -> LoginThrottleStats:
+    """Get limits, checks and rejected login attempts of the login throttle."""
+    return login_throttle.stats()
+
+
+@router.get("/modules",
+            response_model=list[ModuleStats])
+@inject
+async def get_module_stats(
+    module_registry: ModuleRegistryDep,
+    current_superuser: CurrentSuperuser
+) -> list[ModuleStats]:
+    """Get the discovered modules, whether they are loaded yet and how long loading took."""
+    return module_registry.stats()
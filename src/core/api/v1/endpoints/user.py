@@ -9,10 +9,17 @@ from src.core.application.commands.user.update_user_command import (
     UpdateUserByAdminCommandRequest,
     UpdateUserByAdminCommandResponse
 )
+from src.core.application.commands.user.import_users_command import (
+    ImportUsersCommandRequest,
+    ImportUsersCommandResponse,
+    IMPORT_MEDIA_TYPES
+)
 from src.core.application.commands.user.change_password_comand import ChangePasswordCommandRequest, ChangePasswordCommandResponse
 #queries
 from src.core.application.queries.user.get_user_by_id_query import GetUserByIdQueryRequest, GetUserByIdQueryResponse
 from src.core.application.queries.user.get_users_query import GetUsersQueryRequest, GetUsersQueryResponse
+from src.core.application.queries.user.export_users_query import ExportUsersQueryRequest, EXPORT_MEDIA_TYPES
+from src.core.application.queries.common_queries import UserFieldsQuery
 
 #deps
 from src.core.api.v1.dependencies.common_dependencies import CurrentUser, CurrentSuperuser
@@ -20,13 +27,16 @@ from src.core.api.v1.dependencies.user_dependencies import (
     GetUserByIdHandlerDep,
     CreateUserHandlerDep,
     GetUsersHandlerDep,
+    ExportUsersHandlerDep,
+    ImportUsersHandlerDep,
     DeactivateUserHandlerDep,
     UpdateUserHandlerDep,
     DeleteUserHandlerDep,
     ChangePasswordHandlerDep,
 )
 from src.core.domain.exceptions.user import (
-    UserAlreadyExistsError,
+    UsernameAlreadyTakenError,
+    EmailAlreadyTakenError,
     UserNotFoundError,
     InvalidUserDataError,
     UsersNotFoundError,
@@ -34,13 +44,22 @@ from src.core.domain.exceptions.user import (
     NoPermissionError,
     InvalidPasswordError,
     PasswordReuseError,
+    UnsupportedImportFormatError,
+    StaleUserVersionError,
 )
+from src.core.domain.exceptions.pagination import InvalidCursorError
+from src.core.domain.exceptions.conditional import NotModifiedError
+from src.core.domain.exceptions.auth import PasswordHasherBusyError
 
 from src.core.domain.models.user import UserResponse, UserId
 from src.core.decorators.exception_handler import handle_exceptions
-from src.utils.utils import generate_openapi_responses
+from src.core.api.responses import ModelResponse
+from src.core.application.services.user_service import user_etag
+from src.utils.exceptions import CommandExecutionError
+from src.utils.utils import etag_matches, generate_openapi_responses
 
-from fastapi import APIRouter, Body, Query
+from fastapi import APIRouter, Body, Header, Query, Request, Response
+from fastapi.responses import StreamingResponse
 from typing import Annotated
 from dependency_injector.wiring import inject
 
@@ -59,15 +78,23 @@ router = APIRouter(
 
 @handle_exceptions
 @router.get("/me",
-            response_model=UserResponse)
-async def read_users_me(current_user: CurrentUser) -> UserResponse:
+            response_model=UserResponse,
+            responses=generate_openapi_responses(NotModifiedError))
+async def read_users_me(
+    current_user: CurrentUser,
+    if_none_match: Annotated[str | None, Header()] = None
+) -> Response:
     """Get current user details."""
-    return UserResponse.model_validate(current_user)
+    etag = user_etag(current_user.id, current_user.version)
+    if etag_matches(if_none_match, etag):
+        not_modified = NotModifiedError(etag)
+        return Response(status_code=not_modified.status_code, headers=not_modified.headers)
+    return ModelResponse(current_user, etag=etag)
 
 
 @router.post("/",
              response_model=CreateUserCommandResponse,
-             responses=generate_openapi_responses(UserAlreadyExistsError, InvalidUserDataError))
+             responses=generate_openapi_responses(UsernameAlreadyTakenError, EmailAlreadyTakenError, InvalidUserDataError, PasswordHasherBusyError))
 @inject
 @handle_exceptions
 async def create_user(
@@ -78,32 +105,78 @@ async def create_user(
     return await handler(command_request)
 
 
+@router.get("/export",
+            response_class=StreamingResponse,
+            responses={200: {"content": {media_type: {} for media_type in EXPORT_MEDIA_TYPES.values()}}})
+@inject
+@handle_exceptions
+async def export_users(
+    query_request: Annotated[ExportUsersQueryRequest, Query()],
+    handler: ExportUsersHandlerDep,
+    current_superuser: CurrentSuperuser
+) -> StreamingResponse:
+    """Stream all matching users as NDJSON or CSV without loading them into memory."""
+    chunks = await handler(query_request)
+    return StreamingResponse(
+        chunks,
+        media_type=EXPORT_MEDIA_TYPES[query_request.format],
+        headers={"Content-Disposition": f'attachment; filename="users.{query_request.format}"'}
+    )
+
+
+@router.post("/import",
+             response_model=ImportUsersCommandResponse,
+             responses=generate_openapi_responses(UnsupportedImportFormatError, InvalidUserDataError),
+             openapi_extra={"requestBody": {
+                 "required": True,
+                 "content": {media_type: {"schema": {"type": "string"}} for media_type in IMPORT_MEDIA_TYPES}
+             }})
+@inject
+@handle_exceptions
+async def import_users(
+    request: Request,
+    handler: ImportUsersHandlerDep,
+    current_superuser: CurrentSuperuser,
+    batch_size: Annotated[int, Query(ge=1, le=10000, description="Rows validated, hashed and loaded at once")] = 1000
+) -> ImportUsersCommandResponse:
+    """Import users from a streamed CSV (username,email,password header) or NDJSON upload."""
+    media_type = request.headers.get("content-type", "").split(";")[0].strip().lower()
+    if media_type not in IMPORT_MEDIA_TYPES:
+        error = UnsupportedImportFormatError()
+        raise CommandExecutionError(error.message, cause=error)
+    command_request = ImportUsersCommandRequest(format=IMPORT_MEDIA_TYPES[media_type], batch_size=batch_size)
+    return await handler(command_request, request.stream())
+
+
 @router.get("/{user_id}",
             response_model=GetUserByIdQueryResponse,
-            responses=generate_openapi_responses(UserNotFoundError))
+            responses=generate_openapi_responses(UserNotFoundError, NotModifiedError))
 @inject
 @handle_exceptions
 async def get_user(
     user_id: UserId,
+    fields_query: Annotated[UserFieldsQuery, Query()],
     handler: GetUserByIdHandlerDep,
-    current_superuser: CurrentSuperuser
- ) -> GetUserByIdQueryResponse:
-    query = GetUserByIdQueryRequest(user_id=user_id)
-    return await handler(query)
+    current_superuser: CurrentSuperuser,
+    if_none_match: Annotated[str | None, Header()] = None
+ ) -> ModelResponse:
+    query = GetUserByIdQueryRequest(user_id=user_id, fields=fields_query.fields)
+    return ModelResponse(await handler(query, if_none_match=if_none_match))
 
 
 @router.get("/",
             response_model=GetUsersQueryResponse,
-            responses=generate_openapi_responses(UsersNotFoundError)
+            responses=generate_openapi_responses(UsersNotFoundError, InvalidCursorError, NotModifiedError)
             )
 @inject
 @handle_exceptions
 async def get_users(
     query_request: Annotated[GetUsersQueryRequest, Query()],
     handler: GetUsersHandlerDep,
-    current_superuser: CurrentSuperuser
-) -> GetUsersQueryResponse:
-    return await handler(query_request)
+    current_superuser: CurrentSuperuser,
+    if_none_match: Annotated[str | None, Header()] = None
+) -> ModelResponse:
+    return ModelResponse(await handler(query_request, if_none_match=if_none_match))
 
 
 
@@ -123,7 +196,7 @@ async def deactivate_current_user(
 
 @router.patch("/me",
               response_model=UpdateCurrentUserCommandResponse,
-              responses=generate_openapi_responses(UserNotFoundError, UserAlreadyInactiveError))
+              responses=generate_openapi_responses(UserNotFoundError, UserAlreadyInactiveError, StaleUserVersionError, UsernameAlreadyTakenError, EmailAlreadyTakenError))
 @inject
 @handle_exceptions
 async def update_user(
@@ -136,7 +209,7 @@ async def update_user(
 
 @router.patch("/{user_id}",
               response_model=UpdateUserByAdminCommandResponse,
-              responses=generate_openapi_responses(UserNotFoundError, UserAlreadyInactiveError))
+              responses=generate_openapi_responses(UserNotFoundError, UserAlreadyInactiveError, StaleUserVersionError, UsernameAlreadyTakenError, EmailAlreadyTakenError))
 @inject
 @handle_exceptions
 async def update_user_by_admin(
@@ -150,7 +223,7 @@ async def update_user_by_admin(
 
 @router.post("/me/change-password",
              response_model=ChangePasswordCommandResponse,
-             responses=generate_openapi_responses(InvalidPasswordError, UserNotFoundError, PasswordReuseError))
+             responses=generate_openapi_responses(InvalidPasswordError, UserNotFoundError, PasswordReuseError, StaleUserVersionError, PasswordHasherBusyError))
 @inject
 @handle_exceptions
 async def change_own_password(
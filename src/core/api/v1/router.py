@@ -1,6 +1,9 @@
-from fastapi import APIRouter
-from .endpoints import user, auth
+from fastapi import APIRouter, Depends
+from .endpoints import user, auth, system, batch
+from .dependencies.common_dependencies import request_unit_of_work
 
-router = APIRouter()
+router = APIRouter(dependencies=[Depends(request_unit_of_work)])
 router.include_router(user.router)
-router.include_router(auth.router)
\ No newline at end of file
+router.include_router(auth.router)
+router.include_router(system.router)
+router.include_router(batch.router)
\ No newline at end of file
@@ -0,0 +1,31 @@
+from typing import Any
+
+from fastapi import APIRouter, Response
+from dependency_injector.wiring import inject
+from pydantic import BaseModel
+
+from src.core.api.v1.dependencies.common_dependencies import JWTKeySetDep
+
+
+class JSONWebKeySet(BaseModel):
+    """Public keys verifying the access tokens, in the RFC 7517 format."""
+    keys: list[dict[str, Any]]
+
+
+router = APIRouter(
+    tags=["General"],
+    prefix="/.well-known"
+)
+
+
+@router.get("/jwks.json",
+            response_model=JSONWebKeySet)
+@inject
+async def get_jwks(
+    response: Response,
+    jwt_keys: JWTKeySetDep
+) -> JSONWebKeySet:
+    """Get the public keys module services use to verify access tokens locally."""
+    # short enough for a rotated key to be picked up before it starts signing
+    response.headers["Cache-Control"] = "public, max-age=300"
+    return JSONWebKeySet(**jwt_keys.jwks())
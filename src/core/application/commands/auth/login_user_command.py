@@ -11,5 +11,5 @@ class LoginUserCommandResponse(Token, CommandResponse):
     """Response model for user login command."""
     
     @classmethod
-    def success(cls, access_token: str):
-        return cls(status="success", access_token=access_token, token_type="bearer")
\ No newline at end of file
+    def success(cls, access_token: str, refresh_token: str | None = None):
+        return cls(status="success", access_token=access_token, refresh_token=refresh_token, token_type="bearer")
\ No newline at end of file
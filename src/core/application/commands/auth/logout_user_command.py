@@ -0,0 +1,10 @@
+from src.core.application.commands.common_commands import CommandRequest, CommandResponse
+
+
+class LogoutUserCommandRequest(CommandRequest):
+    """Request model for logout, revoking the session of the refresh token."""
+    refresh_token: str
+
+class LogoutUserCommandResponse(CommandResponse):
+    """Response model for logout command."""
+    pass
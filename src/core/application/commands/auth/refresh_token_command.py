@@ -0,0 +1,14 @@
+from src.core.domain.models.auth import Token
+from src.core.application.commands.common_commands import CommandRequest, CommandResponse
+
+
+class RefreshTokenCommandRequest(CommandRequest):
+    """Request model for exchanging a refresh token for a new token pair."""
+    refresh_token: str
+
+class RefreshTokenCommandResponse(Token, CommandResponse):
+    """Response model for refresh token command with the rotated token pair."""
+
+    @classmethod
+    def success(cls, access_token: str, refresh_token: str):
+        return cls(status="success", access_token=access_token, refresh_token=refresh_token, token_type="bearer")
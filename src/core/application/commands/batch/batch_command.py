@@ -0,0 +1,84 @@
+from typing import Annotated, Literal, Optional, Union
+from uuid import UUID
+
+from pydantic import BaseModel, Field, SerializeAsAny
+
+from src.core.application.commands.common_commands import CommandRequest, CommandResponse
+from src.core.application.commands.user.create_user_command import CreateUserCommandRequest
+from src.core.application.commands.user.update_user_command import UpdateUserByAdminCommandRequest
+from src.core.application.commands.user.deactivate_user_command import DeactivateUserCommandRequest
+from src.core.application.commands.user.delete_user_command import DeleteUserCommandRequest
+from src.core.application.queries.user.get_user_by_id_query import GetUserByIdQueryRequest, GetUserByIdQueryResponse
+from src.core.application.queries.user.get_users_query import GetUsersQueryRequest, GetUsersQueryResponse
+
+
+MAX_BATCH_OPERATIONS = 100
+
+
+class CreateUserOperation(BaseModel):
+    op: Literal["create_user"]
+    command: CreateUserCommandRequest
+
+
+class UpdateUserOperation(BaseModel):
+    op: Literal["update_user"]
+    user_id: UUID
+    command: UpdateUserByAdminCommandRequest
+
+
+class DeactivateUserOperation(BaseModel):
+    op: Literal["deactivate_user"]
+    command: DeactivateUserCommandRequest
+
+
+class DeleteUserOperation(BaseModel):
+    op: Literal["delete_user"]
+    command: DeleteUserCommandRequest
+
+
+class GetUserOperation(BaseModel):
+    op: Literal["get_user"]
+    query: GetUserByIdQueryRequest
+
+
+class GetUsersOperation(BaseModel):
+    op: Literal["get_users"]
+    query: GetUsersQueryRequest
+
+
+BatchOperation = Annotated[
+    Union[
+        CreateUserOperation,
+        UpdateUserOperation,
+        DeactivateUserOperation,
+        DeleteUserOperation,
+        GetUserOperation,
+        GetUsersOperation,
+    ],
+    Field(discriminator="op")
+]
+
+
+class BatchCommandRequest(CommandRequest):
+    """Request model for running several user commands and queries in one transaction."""
+    operations: list[BatchOperation] = Field(..., min_length=1, max_length=MAX_BATCH_OPERATIONS)
+    all_or_nothing: bool = Field(
+        default=False,
+        description="Roll back every operation and skip the remaining ones when one fails. "
+                    "Otherwise only the failed operation is rolled back."
+    )
+
+
+class BatchOperationResult(BaseModel):
+    """Outcome of one operation, with the status code its own endpoint would answer."""
+    index: int
+    op: str
+    status_code: int
+    response: Optional[SerializeAsAny[GetUsersQueryResponse | GetUserByIdQueryResponse | CommandResponse]] = None
+    error: Optional[str] = None
+
+
+class BatchCommandResponse(CommandResponse):
+    """Response model for batch command, results are in the order of the operations."""
+    committed: bool
+    results: list[BatchOperationResult]
@@ -0,0 +1,44 @@
+from src.core.application.commands.common_commands import CommandRequest, CommandResponse
+from pydantic import BaseModel, Field
+from typing import Literal, Optional
+
+
+ImportFormat = Literal["csv", "ndjson"]
+
+IMPORT_MEDIA_TYPES: dict[str, ImportFormat] = {
+    "text/csv": "csv",
+    "application/x-ndjson": "ndjson",
+}
+
+
+class ImportUserRowResult(BaseModel):
+    """Outcome of importing a single row of the upload."""
+    row: int
+    status: Literal["created", "conflict", "invalid"]
+    username: Optional[str] = None
+    email: Optional[str] = None
+    message: Optional[str] = None
+
+
+class ImportUsersCommandRequest(CommandRequest):
+    """Request model for importing users from a CSV or NDJSON upload."""
+    format: ImportFormat
+    batch_size: int = Field(default=1000, ge=1, le=10000)
+
+
+class ImportUsersCommandResponse(CommandResponse):
+    """Response model for users import command with per-row results."""
+    created: int = 0
+    conflicts: int = 0
+    invalid: int = 0
+    results: list[ImportUserRowResult] = []
+
+    @classmethod
+    def from_results(cls, results: list[ImportUserRowResult]):
+        return cls(
+            status="success",
+            created=sum(result.status == "created" for result in results),
+            conflicts=sum(result.status == "conflict" for result in results),
+            invalid=sum(result.status == "invalid" for result in results),
+            results=results,
+        )
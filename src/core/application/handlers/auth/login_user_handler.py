@@ -2,45 +2,69 @@ from src.core.application.services.auth_service import AuthService
 from src.core.application.commands.auth.login_user_command import LoginUserCommandResponse, LoginUserCommandRequest
 from src.core.application.handlers.common_handlers import CommandHandler
 from src.utils.exceptions import CommandExecutionError
-from src.core.domain.exceptions.auth import InvalidCredentialsError
+from src.core.infrastructure.database.unit_of_work import UnitOfWork
+from src.core.domain.exceptions.auth import InvalidCredentialsError, TooManyLoginAttemptsError
+from src.core.infrastructure.security.login_throttle import LoginThrottle
 from src.core.domain.exceptions.user import InactiveUserError
 
 
 class LoginUserHandler(CommandHandler[LoginUserCommandRequest, LoginUserCommandResponse]):
     """Handler for login user with access token based on LoginUserCommandRequest."""
 
-    def __init__(self, auth_service: AuthService):
-        """Initialize the handler with a AuthService dependency.
+    def __init__(self, auth_service: AuthService, unit_of_work: UnitOfWork, login_throttle: LoginThrottle):
+        """Initialize the handler with AuthService, UnitOfWork and LoginThrottle dependencies.
         
         Args:
             auth_service: Service responsible for auth-related business logic.
+            unit_of_work: Unit of work sharing one transaction between repositories.
+            login_throttle: Limiter of failed logins per email and client address.
         """
         self._auth_service = auth_service
+        self._unit_of_work = unit_of_work
+        self._login_throttle = login_throttle
     
 
-    async def handle(self, command: LoginUserCommandRequest) -> LoginUserCommandResponse:
+    async def handle(self, command: LoginUserCommandRequest, client_ip: str | None = None) -> LoginUserCommandResponse:
         """Handle the login a user.
         
         Args:
             command: The command containing user login data (email, password).
+            client_ip: Address of the client, throttled together with the email.
         
         Returns:
             LoginUserCommandResponse with the status of the operation and access token.
         
         Raises:
             CommandExecutionError: If authentication fails (e.g. invalid credentials)
+                or the email or address is throttled
         """
 
         try:
-            user = await self._auth_service.authenticate(command) #TODO: Sprawdzić pprzesyłanie tokenu w success
-            access_token = await self._auth_service.create_access_token(user.id)
-            return LoginUserCommandResponse.success(access_token=access_token)
+            # before anything is hashed, a throttled burst costs no CPU
+            await self._login_throttle.check(command.email, client_ip)
+        except TooManyLoginAttemptsError as e:
+            raise CommandExecutionError("Too many failed login attempts", cause=e) from e
+        except Exception as e:
+            raise CommandExecutionError("Unexpected error during authenticate user", cause=e) from e
+
+        try:
+            async with self._unit_of_work.begin():
+                user = await self._auth_service.authenticate(command) #TODO: Sprawdzić pprzesyłanie tokenu w success
+                access_token = await self._auth_service.create_access_token(user.id)
+                refresh_token = await self._auth_service.create_refresh_token(user.id)
+            return LoginUserCommandResponse.success(access_token=access_token, refresh_token=refresh_token)
         except InvalidCredentialsError as e:
+            # the login transaction is rolled back, a shared attempt log needs its own
+            async with self._unit_of_work.begin(requires_new=True):
+                await self._login_throttle.record_failure(command.email, client_ip)
             raise CommandExecutionError("Invalid credentials", cause=e) from e
         except InactiveUserError as e:
             raise CommandExecutionError("Inactive user", cause=e) from e
         except Exception as e:
             raise CommandExecutionError("Unexpected error during authenticate user", cause=e) from e
+        finally:
+            # after a failure is recorded, so the attempt is counted all along
+            self._login_throttle.release(command.email, client_ip)
     
-    async def __call__(self, command: LoginUserCommandRequest) -> LoginUserCommandResponse:
-        return await self.handle(command)
\ No newline at end of file
+    async def __call__(self, command: LoginUserCommandRequest, client_ip: str | None = None) -> LoginUserCommandResponse:
+        return await self.handle(command, client_ip=client_ip)
\ No newline at end of file
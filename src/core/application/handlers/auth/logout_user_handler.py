@@ -0,0 +1,42 @@
+from src.core.application.services.auth_service import AuthService
+from src.core.application.commands.auth.logout_user_command import LogoutUserCommandRequest, LogoutUserCommandResponse
+from src.core.application.handlers.common_handlers import CommandHandler
+from src.utils.exceptions import CommandExecutionError
+from src.core.infrastructure.database.unit_of_work import UnitOfWork
+
+
+class LogoutUserHandler(CommandHandler[LogoutUserCommandRequest, LogoutUserCommandResponse]):
+    """Handler revoking the session of a refresh token."""
+
+    def __init__(self, auth_service: AuthService, unit_of_work: UnitOfWork):
+        """Initialize the handler with AuthService and UnitOfWork dependencies.
+        
+        Args:
+            auth_service: Service responsible for auth-related business logic.
+            unit_of_work: Unit of work sharing one transaction between repositories.
+        """
+        self._auth_service = auth_service
+        self._unit_of_work = unit_of_work
+
+    async def handle(self, command: LogoutUserCommandRequest, access_token: str | None = None) -> LogoutUserCommandResponse:
+        """Handle the logout of a session.
+        
+        Args:
+            command: The command containing the refresh token of the session.
+            access_token: Bearer token of the request, revoked until it expires.
+        
+        Returns:
+            LogoutUserCommandResponse with the status of the operation.
+        
+        Raises:
+            CommandExecutionError: If the session cannot be revoked.
+        """
+        try:
+            async with self._unit_of_work.begin():
+                await self._auth_service.logout(command.refresh_token, access_token=access_token)
+            return LogoutUserCommandResponse.success(message="Successfully logged out")
+        except Exception as e:
+            raise CommandExecutionError("Unexpected error during logout", cause=e) from e
+
+    async def __call__(self, command: LogoutUserCommandRequest, access_token: str | None = None) -> LogoutUserCommandResponse:
+        return await self.handle(command, access_token=access_token)
@@ -0,0 +1,53 @@
+from src.core.application.services.auth_service import AuthService
+from src.core.application.commands.auth.refresh_token_command import RefreshTokenCommandRequest, RefreshTokenCommandResponse
+from src.core.application.handlers.common_handlers import CommandHandler
+from src.utils.exceptions import CommandExecutionError
+from src.core.infrastructure.database.unit_of_work import UnitOfWork
+from src.core.domain.exceptions.auth import InvalidRefreshTokenError, RefreshTokenReusedError
+from src.core.domain.exceptions.user import InactiveUserError
+
+
+class RefreshTokenHandler(CommandHandler[RefreshTokenCommandRequest, RefreshTokenCommandResponse]):
+    """Handler rotating a refresh token into a new access and refresh token pair."""
+
+    def __init__(self, auth_service: AuthService, unit_of_work: UnitOfWork):
+        """Initialize the handler with AuthService and UnitOfWork dependencies.
+        
+        Args:
+            auth_service: Service responsible for auth-related business logic.
+            unit_of_work: Unit of work sharing one transaction between repositories.
+        """
+        self._auth_service = auth_service
+        self._unit_of_work = unit_of_work
+
+    async def handle(self, command: RefreshTokenCommandRequest) -> RefreshTokenCommandResponse:
+        """Handle the refresh of a session.
+        
+        Args:
+            command: The command containing the refresh token.
+        
+        Returns:
+            RefreshTokenCommandResponse with the new access and refresh tokens.
+        
+        Raises:
+            CommandExecutionError: If the token is invalid, reused or the user is inactive.
+        """
+        try:
+            async with self._unit_of_work.begin():
+                user, refresh_token = await self._auth_service.rotate_refresh_token(command.refresh_token)
+                access_token = await self._auth_service.create_access_token(user.id)
+            return RefreshTokenCommandResponse.success(access_token=access_token, refresh_token=refresh_token)
+        except RefreshTokenReusedError as e:
+            # the request transaction is rolled back, the revocation has to be committed on its own
+            async with self._unit_of_work.begin(requires_new=True):
+                await self._auth_service.revoke_refresh_token_family(e.family_id)
+            raise CommandExecutionError("Refresh token reuse detected", cause=e) from e
+        except InvalidRefreshTokenError as e:
+            raise CommandExecutionError("Invalid refresh token", cause=e) from e
+        except InactiveUserError as e:
+            raise CommandExecutionError("Inactive user", cause=e) from e
+        except Exception as e:
+            raise CommandExecutionError("Unexpected error during token refresh", cause=e) from e
+
+    async def __call__(self, command: RefreshTokenCommandRequest) -> RefreshTokenCommandResponse:
+        return await self.handle(command)
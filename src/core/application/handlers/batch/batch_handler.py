@@ -0,0 +1,176 @@
+import logging
+from pydantic import BaseModel
+from src.core.application.commands.batch.batch_command import (
+    BatchCommandRequest,
+    BatchCommandResponse,
+    BatchOperation,
+    BatchOperationResult,
+    CreateUserOperation,
+    UpdateUserOperation,
+    DeactivateUserOperation,
+    DeleteUserOperation,
+    GetUserOperation,
+    GetUsersOperation
+)
+from src.core.application.handlers.common_handlers import CommandHandler
+from src.core.application.handlers.user.create_user_handler import CreateUserHandler
+from src.core.application.handlers.user.update_user_handler import UpdateUserHandler
+from src.core.application.handlers.user.deactivate_user_handler import DeactivateUserHandler
+from src.core.application.handlers.user.delete_user_handler import DeleteUserHandler
+from src.core.application.handlers.user.get_user_by_id_handler import GetUserByIdHandler
+from src.core.application.handlers.user.get_users_handler import GetUsersHandler
+from src.utils.exceptions import CommandExecutionError, HttpAwareException
+from src.core.infrastructure.database.unit_of_work import UnitOfWork
+
+
+logger = logging.getLogger(__name__)
+
+
+class _BatchRolledBack(Exception):
+    """Rolls back the savepoint of an all-or-nothing batch after a failed operation."""
+
+
+class BatchHandler(CommandHandler[BatchCommandRequest, BatchCommandResponse]):
+    """Handler running the operations of a BatchCommandRequest in one unit of work.
+
+    Every operation is dispatched to the handler of its own endpoint, so it is
+    validated and fails the same way. Each one runs in a savepoint, a failed one is
+    rolled back alone and reported with the status code of its endpoint. With
+    all_or_nothing the whole batch shares one savepoint, rolled back on the first
+    failure, and the remaining operations are skipped.
+    """
+
+    def __init__(self,
+                 unit_of_work: UnitOfWork,
+                 create_user_handler: CreateUserHandler,
+                 update_user_handler: UpdateUserHandler,
+                 deactivate_user_handler: DeactivateUserHandler,
+                 delete_user_handler: DeleteUserHandler,
+                 get_user_by_id_handler: GetUserByIdHandler,
+                 get_users_handler: GetUsersHandler):
+        """Initialize the handler with the UnitOfWork and the handlers of the operations.
+
+        Args:
+            unit_of_work: Unit of work sharing one transaction between the operations.
+            create_user_handler: Handler of create_user operations.
+            update_user_handler: Handler of update_user operations.
+            deactivate_user_handler: Handler of deactivate_user operations.
+            delete_user_handler: Handler of delete_user operations.
+            get_user_by_id_handler: Handler of get_user operations.
+            get_users_handler: Handler of get_users operations.
+        """
+        self._unit_of_work = unit_of_work
+        self._create_user_handler = create_user_handler
+        self._update_user_handler = update_user_handler
+        self._deactivate_user_handler = deactivate_user_handler
+        self._delete_user_handler = delete_user_handler
+        self._get_user_by_id_handler = get_user_by_id_handler
+        self._get_users_handler = get_users_handler
+
+
+    async def handle(self, command: BatchCommandRequest) -> BatchCommandResponse:
+        """Handle the batch.
+
+        Args:
+            command: The operations to run, in order, and whether they succeed only together.
+
+        Returns:
+            BatchCommandResponse with the result of every operation and whether they were committed.
+
+        Raises:
+            CommandExecutionError: If the transaction itself fails.
+        """
+        try:
+            async with self._unit_of_work.begin():
+                if command.all_or_nothing:
+                    results = await self._run_all_or_nothing(command.operations)
+                else:
+                    results = [
+                        await self._run_in_savepoint(index, operation)
+                        for index, operation in enumerate(command.operations)
+                    ]
+        except Exception as e:
+            logger.exception("Unexpected error during batch")
+            raise CommandExecutionError("Unexpected error during batch", cause=e) from e
+
+        failed = sum(result.error is not None for result in results)
+        committed = not (command.all_or_nothing and failed)
+        if not failed:
+            message = f"All {len(results)} operations succeeded"
+        elif committed:
+            message = f"{failed} of {len(results)} operations failed and were rolled back"
+        else:
+            message = "An operation failed, the batch was rolled back"
+        return BatchCommandResponse(
+            status="success" if not failed else "failed",
+            message=message,
+            committed=committed,
+            results=results
+        )
+
+    async def _run_all_or_nothing(self, operations: list[BatchOperation]) -> list[BatchOperationResult]:
+        results = []
+        try:
+            async with self._unit_of_work.savepoint():
+                for index, operation in enumerate(operations):
+                    try:
+                        results.append(self._success(index, operation, await self._execute(operation)))
+                    except Exception as e:
+                        results.append(self._failure(index, operation, e))
+                        raise _BatchRolledBack() from e
+        except _BatchRolledBack:
+            results.extend(
+                BatchOperationResult(
+                    index=index,
+                    op=operation.op,
+                    status_code=424,
+                    error="Not run, an earlier operation of the batch failed"
+                )
+                for index, operation in enumerate(operations[len(results):], start=len(results))
+            )
+        return results
+
+    async def _run_in_savepoint(self, index: int, operation: BatchOperation) -> BatchOperationResult:
+        try:
+            async with self._unit_of_work.savepoint():
+                response = await self._execute(operation)
+            return self._success(index, operation, response)
+        except Exception as e:
+            return self._failure(index, operation, e)
+
+    async def _execute(self, operation: BatchOperation) -> BaseModel:
+        match operation:
+            case CreateUserOperation(command=command):
+                return await self._create_user_handler(command)
+            case UpdateUserOperation(user_id=user_id, command=command):
+                return await self._update_user_handler(user_id=user_id, command=command)
+            case DeactivateUserOperation(command=command):
+                return await self._deactivate_user_handler(command)
+            case DeleteUserOperation(command=command):
+                return await self._delete_user_handler(command)
+            case GetUserOperation(query=query):
+                return await self._get_user_by_id_handler(query)
+            case GetUsersOperation(query=query):
+                return await self._get_users_handler(query)
+        raise TypeError(f"Unsupported batch operation {operation.op}")
+
+    @staticmethod
+    def _success(index: int, operation: BatchOperation, response: BaseModel) -> BatchOperationResult:
+        return BatchOperationResult(index=index, op=operation.op, status_code=200, response=response)
+
+    @staticmethod
+    def _failure(index: int, operation: BatchOperation, error: Exception) -> BatchOperationResult:
+        """Maps the error to the status code handle_exceptions gives it on the endpoint."""
+        cause = error.cause if isinstance(error, CommandExecutionError) else None
+        if isinstance(cause, HttpAwareException):
+            status_code, message = cause.status_code, cause.message
+        elif isinstance(error, CommandExecutionError):
+            logger.warning("Batch operation %s (%s) failed: %s", index, operation.op, error, exc_info=cause)
+            status_code, message = 400, str(error)
+        else:
+            logger.exception("Unhandled error in batch operation %s (%s)", index, operation.op)
+            status_code, message = 500, f"Internal server error: {error}"
+        return BatchOperationResult(index=index, op=operation.op, status_code=status_code, error=message)
+
+    async def __call__(self, command: BatchCommandRequest) -> BatchCommandResponse:
+        return await self.handle(command)
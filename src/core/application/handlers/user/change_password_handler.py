@@ -1,20 +1,27 @@
+import logging
 from src.core.application.services.user_service import UserService
 from src.core.application.commands.user.change_password_comand import ChangePasswordCommandResponse, ChangePasswordCommandRequest
 from src.core.application.handlers.common_handlers import CommandHandler
 from src.core.domain.exceptions.user import UserAlreadyExistsError, InvalidUserDataError, UserNotFoundError, UserAlreadyInactiveError, InvalidPasswordError, PasswordReuseError
 from src.utils.exceptions import CommandExecutionError
+from src.core.infrastructure.database.unit_of_work import UnitOfWork
 from uuid import UUID
 
+
+logger = logging.getLogger(__name__)
+
 class ChangePasswordHandler(CommandHandler[ChangePasswordCommandRequest, ChangePasswordCommandResponse]):
     """Handler for changing password based on ChangePasswordCommandRequest."""
 
-    def __init__(self, user_service: UserService):
-        """Initialize the handler with a UserService dependency.
+    def __init__(self, user_service: UserService, unit_of_work: UnitOfWork):
+        """Initialize the handler with UserService and UnitOfWork dependencies.
         
         Args:
             user_service: Service responsible for user-related business logic.
+            unit_of_work: Unit of work sharing one transaction between repositories.
         """
         self._user_service = user_service
+        self._unit_of_work = unit_of_work
     
 
     async def handle(self, user_id: UUID, command: ChangePasswordCommandRequest) -> ChangePasswordCommandResponse:
@@ -30,7 +37,8 @@ class ChangePasswordHandler(CommandHandler[ChangePasswordCommandRequest, ChangeP
             CommandExecutionError:
         """
         try:
-            await self._user_service.change_user_password(user_id=user_id, command=command)
+            async with self._unit_of_work.begin():
+                await self._user_service.change_user_password(user_id=user_id, command=command)
             return ChangePasswordCommandResponse.success(message="The password has been successfully changed")
         except UserNotFoundError as e:
             raise CommandExecutionError("User not found", cause=e) from e
@@ -39,7 +47,7 @@ class ChangePasswordHandler(CommandHandler[ChangePasswordCommandRequest, ChangeP
         except PasswordReuseError as e:
             raise CommandExecutionError("New password must be different from the old password.", cause=e) from e
         except Exception as e:
-            print(e)
+            logger.exception("Unexpected error during changing password")
             raise CommandExecutionError("Unexpected error during changing password", cause=e) from e
     
     async def __call__(self, user_id: UUID, command: ChangePasswordCommandRequest) -> ChangePasswordCommandResponse:
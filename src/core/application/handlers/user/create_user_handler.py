@@ -1,20 +1,28 @@
 from src.core.application.services.user_service import UserService
 from src.core.application.commands.user.create_user_command import CreateUserCommandResponse, CreateUserCommandRequest
 from src.core.application.handlers.common_handlers import CommandHandler
-from src.core.domain.exceptions.user import UserAlreadyExistsError, InvalidUserDataError
+from src.core.domain.exceptions.user import (
+    UserAlreadyExistsError,
+    InvalidUserDataError,
+    EmailAlreadyTakenError,
+    UsernameAlreadyTakenError
+)
 from src.utils.exceptions import CommandExecutionError
+from src.core.infrastructure.database.unit_of_work import UnitOfWork
 
 
 class CreateUserHandler(CommandHandler[CreateUserCommandRequest, CreateUserCommandResponse]):
     """Handler for creating a new user based on CreateUserCommandRequest."""
 
-    def __init__(self, user_service: UserService):
-        """Initialize the handler with a UserService dependency.
+    def __init__(self, user_service: UserService, unit_of_work: UnitOfWork):
+        """Initialize the handler with UserService and UnitOfWork dependencies.
         
         Args:
             user_service: Service responsible for user-related business logic.
+            unit_of_work: Unit of work sharing one transaction between repositories.
         """
         self._user_service = user_service
+        self._unit_of_work = unit_of_work
     
 
     async def handle(self, command: CreateUserCommandRequest) -> CreateUserCommandResponse:
@@ -27,12 +35,13 @@ class CreateUserHandler(CommandHandler[CreateUserCommandRequest, CreateUserComma
             CreateUserCommandResponse with the status of the operation.
         
         Raises:
-            CommandExecutionError: If user creation fails (e.g., duplicate email).
+            CommandExecutionError: If user creation fails (e.g., duplicate email or username).
         """
         try:
-            await self._user_service.create_user(command)
+            async with self._unit_of_work.begin():
+                await self._user_service.create_user(command)
             return CreateUserCommandResponse.success()
-        except UserAlreadyExistsError as e:
+        except (UserAlreadyExistsError, UsernameAlreadyTakenError, EmailAlreadyTakenError) as e:
             raise CommandExecutionError("User already exists", cause=e) from e
         except InvalidUserDataError as e:
             raise CommandExecutionError("Invalid user data", cause=e) from e
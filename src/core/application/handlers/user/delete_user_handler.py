@@ -3,18 +3,21 @@ from src.core.application.commands.user.delete_user_command import DeleteUserCom
 from src.core.application.handlers.common_handlers import CommandHandler
 from src.core.domain.exceptions.user import UserAlreadyExistsError, InvalidUserDataError, UserNotFoundError, UserAlreadyInactiveError, NoPermissionError
 from src.utils.exceptions import CommandExecutionError
+from src.core.infrastructure.database.unit_of_work import UnitOfWork
 
 
 class DeleteUserHandler(CommandHandler[DeleteUserCommandRequest, DeleteUserCommandResponse]):
     """Handler for Delete user based on DeleteUserCommandRequest."""
 
-    def __init__(self, user_service: UserService):
-        """Initialize the handler with a UserService dependency.
+    def __init__(self, user_service: UserService, unit_of_work: UnitOfWork):
+        """Initialize the handler with UserService and UnitOfWork dependencies.
         
         Args:
             user_service: Service responsible for user-related business logic.
+            unit_of_work: Unit of work sharing one transaction between repositories.
         """
         self._user_service = user_service
+        self._unit_of_work = unit_of_work
     
 
     async def handle(self, command: DeleteUserCommandRequest) -> DeleteUserCommandResponse:
@@ -30,7 +33,8 @@ class DeleteUserHandler(CommandHandler[DeleteUserCommandRequest, DeleteUserComma
             CommandExecutionError:
         """
         try:
-            await self._user_service.delete_user(command.user_id)
+            async with self._unit_of_work.begin():
+                await self._user_service.delete_user(command.user_id)
             return DeleteUserCommandResponse.success(message=f"The user {command.user_id} has been successfully deleted.")
         except UserNotFoundError as e:
             raise CommandExecutionError("User not found", cause=e) from e
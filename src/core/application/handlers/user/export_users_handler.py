@@ -0,0 +1,52 @@
+import csv
+import io
+import json
+from typing import Any, AsyncIterator
+
+from src.core.application.handlers.common_handlers import CommandHandler
+from src.core.application.queries.user.export_users_query import ExportUsersQueryRequest
+from src.core.application.services.user_service import UserService
+from src.core.domain.models.user import UserResponse
+
+
+class ExportUsersHandler(CommandHandler[ExportUsersQueryRequest, AsyncIterator[bytes]]):
+    """Handler streaming users as NDJSON or CSV based on ExportUsersQueryRequest."""
+
+    def __init__(self, user_service: UserService):
+        self._user_service = user_service
+
+    async def handle(self, query: ExportUsersQueryRequest) -> AsyncIterator[bytes]:
+        """Handle the export of users.
+
+        Nothing is read until the returned iterator is consumed, and every batch
+        is encoded and released before the next one is fetched.
+
+        Args:
+            query: The query containing the export format and filters.
+
+        Returns:
+            Iterator of encoded chunks, one per fetched batch.
+        """
+        if query.format == "csv":
+            return self._encode_csv(query)
+        return self._encode_ndjson(query)
+
+    async def _encode_ndjson(self, query: ExportUsersQueryRequest) -> AsyncIterator[bytes]:
+        async for batch in self._user_service.export_users(query):
+            yield "".join(json.dumps(row, default=str) + "\n" for row in batch).encode()
+
+    async def _encode_csv(self, query: ExportUsersQueryRequest) -> AsyncIterator[bytes]:
+        fields = list(UserResponse.model_fields)
+        yield self._csv_chunk([dict(zip(fields, fields))], fields)
+        async for batch in self._user_service.export_users(query):
+            yield self._csv_chunk(batch, fields)
+
+    @staticmethod
+    def _csv_chunk(rows: list[dict[str, Any]], fields: list[str]) -> bytes:
+        buffer = io.StringIO()
+        writer = csv.DictWriter(buffer, fieldnames=fields)
+        writer.writerows(rows)
+        return buffer.getvalue().encode()
+
+    async def __call__(self, query: ExportUsersQueryRequest) -> AsyncIterator[bytes]:
+        return await self.handle(query)
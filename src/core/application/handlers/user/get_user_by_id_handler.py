@@ -3,6 +3,7 @@ from src.core.application.handlers.common_handlers import CommandHandler
 from src.core.application.queries.user.get_user_by_id_query import GetUserByIdQueryRequest, GetUserByIdQueryResponse
 from src.core.application.services.user_service import UserService
 from src.core.domain.exceptions.user import UserNotFoundError
+from src.core.domain.exceptions.conditional import NotModifiedError
 from src.utils.exceptions import CommandExecutionError
 
 
@@ -10,18 +11,25 @@ class GetUserByIdHandler(CommandHandler[GetUserByIdQueryRequest, GetUserByIdQuer
     def __init__(self, user_service: UserService):
         self._user_service = user_service
     
-    async def handle(self, query: GetUserByIdQueryRequest) -> GetUserByIdQueryResponse:
+    async def handle(self, query: GetUserByIdQueryRequest, if_none_match: str | None = None) -> GetUserByIdQueryResponse:
         try:
-            user = await self._user_service.get_user_by_id(user_id=query.user_id)
+            user, etag = await self._user_service.get_user_by_id(
+                user_id=query.user_id,
+                fields=query.fields,
+                if_none_match=if_none_match
+            )
             return GetUserByIdQueryResponse.success_response(
                 query_id=query.query_id,
-                user=user
+                user=user,
+                etag=etag
             )
+        except NotModifiedError as e:
+            raise CommandExecutionError(message="User not modified", cause=e) from e
         except UserNotFoundError as e:
             raise CommandExecutionError(message="User not found", cause=e) from e
         except Exception as e:
             raise CommandExecutionError("Unexpected error during fetching user", cause=e) from e
         
 
-    async def __call__(self, query: GetUserByIdQueryRequest) -> GetUserByIdQueryResponse:
-        return await self.handle(query)
\ No newline at end of file
+    async def __call__(self, query: GetUserByIdQueryRequest, if_none_match: str | None = None) -> GetUserByIdQueryResponse:
+        return await self.handle(query, if_none_match=if_none_match)
\ No newline at end of file
@@ -1,28 +1,41 @@
-
+import logging
 from src.core.application.handlers.common_handlers import CommandHandler
 from src.core.application.queries.user.get_users_query import GetUsersQueryRequest, GetUsersQueryResponse
+from src.core.application.queries.common_queries import PaginationMeta
 from src.core.application.services.user_service import UserService
 from src.core.domain.exceptions.user import UsersNotFoundError
+from src.core.domain.exceptions.pagination import InvalidCursorError
+from src.core.domain.exceptions.conditional import NotModifiedError
 from src.utils.exceptions import CommandExecutionError
 
 
+logger = logging.getLogger(__name__)
+
+
 class GetUsersHandler(CommandHandler[GetUsersQueryRequest, GetUsersQueryResponse]):
     def __init__(self, user_service: UserService):
         self._user_service = user_service
     
-    async def handle(self, query: GetUsersQueryRequest) -> GetUsersQueryResponse:
+    async def handle(self, query: GetUsersQueryRequest, if_none_match: str | None = None) -> GetUsersQueryResponse:
         try:
-            users = await self._user_service.get_users(query=query)
+            page, etag = await self._user_service.get_users(query=query, if_none_match=if_none_match)
             return GetUsersQueryResponse.success_response(
                 query_id=query.query_id,
-                users=users
+                users=page.items,
+                next_cursor=page.next_cursor,
+                pagination=PaginationMeta(limit=query.limit, count=query.count, total=page.total),
+                etag=etag
             )
+        except NotModifiedError as e:
+            raise CommandExecutionError(message="Users not modified", cause=e) from e
         except UsersNotFoundError as e:
             raise CommandExecutionError(message="Users not found", cause=e) from e
+        except InvalidCursorError as e:
+            raise CommandExecutionError(message="Invalid cursor", cause=e) from e
         except Exception as e:
-            print(e)
+            logger.exception("Unexpected error during fetching users")
             raise CommandExecutionError("Unexpected error during fetching user", cause=e) from e
         
 
-    async def __call__(self, query: GetUsersQueryRequest) -> GetUsersQueryResponse:
-        return await self.handle(query)
\ No newline at end of file
+    async def __call__(self, query: GetUsersQueryRequest, if_none_match: str | None = None) -> GetUsersQueryResponse:
+        return await self.handle(query, if_none_match=if_none_match)
\ No newline at end of file
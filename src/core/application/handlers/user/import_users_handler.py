@@ -0,0 +1,112 @@
+import codecs
+import csv
+import json
+from typing import Any, AsyncIterator
+
+from src.core.application.commands.user.import_users_command import ImportUsersCommandRequest, ImportUsersCommandResponse
+from src.core.application.handlers.common_handlers import CommandHandler
+from src.core.application.services.user_service import UserService
+from src.core.domain.exceptions.user import InvalidUserDataError
+from src.core.infrastructure.database.unit_of_work import UnitOfWork
+from src.utils.exceptions import CommandExecutionError
+
+
+class ImportUsersHandler(CommandHandler[ImportUsersCommandRequest, ImportUsersCommandResponse]):
+    """Handler importing users from a streamed CSV or NDJSON upload."""
+
+    def __init__(self, user_service: UserService, unit_of_work: UnitOfWork):
+        """Initialize the handler with UserService and UnitOfWork dependencies.
+
+        Args:
+            user_service: Service responsible for user-related business logic.
+            unit_of_work: Unit of work sharing one transaction between repositories.
+        """
+        self._user_service = user_service
+        self._unit_of_work = unit_of_work
+
+    async def handle(self, command: ImportUsersCommandRequest, source: AsyncIterator[bytes]) -> ImportUsersCommandResponse:
+        """Handle the import of users.
+
+        The upload is decoded line by line while it arrives, so only one batch of
+        rows is held in memory at a time.
+
+        Args:
+            command: The command containing the upload format and batch size.
+            source: Chunks of the uploaded file.
+
+        Returns:
+            ImportUsersCommandResponse with the outcome of every row.
+
+        Raises:
+            CommandExecutionError: If the upload cannot be read or the import fails.
+        """
+        records = self._parse_csv(source) if command.format == "csv" else self._parse_ndjson(source)
+        try:
+            async with self._unit_of_work.begin():
+                results = await self._user_service.import_users(records, batch_size=command.batch_size)
+            return ImportUsersCommandResponse.from_results(results)
+        except InvalidUserDataError as e:
+            raise CommandExecutionError("Invalid users file", cause=e) from e
+        except Exception as e:
+            raise CommandExecutionError("Unexpected error during users import", cause=e) from e
+
+    @staticmethod
+    async def _lines(source: AsyncIterator[bytes]) -> AsyncIterator[str]:
+        decoder = codecs.getincrementaldecoder("utf-8-sig")()
+        pending = ""
+        async for chunk in source:
+            pending += decoder.decode(chunk)
+            *lines, pending = pending.split("\n")
+            for line in lines:
+                yield line.rstrip("\r")
+        pending += decoder.decode(b"", final=True)
+        if pending:
+            yield pending.rstrip("\r")
+
+    async def _parse_ndjson(self, source: AsyncIterator[bytes]) -> AsyncIterator[tuple[int, dict[str, Any] | None]]:
+        row_no = 0
+        async for line in self._lines(source):
+            if not line.strip():
+                continue
+            row_no += 1
+            try:
+                row = json.loads(line)
+            except ValueError:
+                row = None
+            yield row_no, row if isinstance(row, dict) else None
+
+    @classmethod
+    async def _csv_records(cls, source: AsyncIterator[bytes]) -> AsyncIterator[list[str]]:
+        """Parses the CSV records of the upload, a quoted field may span several lines.
+
+        Quotes inside a field are doubled, so a record is complete once it holds an
+        even number of them; until then the following lines are part of it.
+        """
+        pending: list[str] = []
+        quotes = 0
+        async for line in cls._lines(source):
+            if not pending and not line.strip():
+                continue
+            pending.append(line)
+            quotes += line.count('"')
+            if quotes % 2 == 0:
+                yield next(csv.reader(part + "\n" for part in pending))
+                pending, quotes = [], 0
+        if pending:
+            # unterminated quoted field at the end of the upload, parsed as far as it goes
+            yield next(csv.reader(part + "\n" for part in pending))
+
+    async def _parse_csv(self, source: AsyncIterator[bytes]) -> AsyncIterator[tuple[int, dict[str, Any] | None]]:
+        header: list[str] | None = None
+        row_no = 0
+        async for values in self._csv_records(source):
+            if header is None:
+                header = [value.strip() for value in values]
+                if not {"username", "email", "password"} <= set(header):
+                    raise InvalidUserDataError("CSV header must contain username, email and password columns")
+                continue
+            row_no += 1
+            yield row_no, dict(zip(header, values)) if len(values) == len(header) else None
+
+    async def __call__(self, command: ImportUsersCommandRequest, source: AsyncIterator[bytes]) -> ImportUsersCommandResponse:
+        return await self.handle(command, source)
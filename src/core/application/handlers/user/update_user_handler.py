@@ -1,3 +1,4 @@
+import logging
 from src.core.application.services.user_service import UserService
 from src.core.application.commands.user.update_user_command import (
     UpdateUserCommandRequest,
@@ -8,15 +9,27 @@ from src.core.application.commands.user.update_user_command import (
     UpdateUserByAdminCommandResponse
 )
 from src.core.application.handlers.common_handlers import CommandHandler
-from src.core.domain.exceptions.user import UserAlreadyExistsError, InvalidUserDataError, UserAlreadyInactiveError, UserNotFoundError
+from src.core.domain.exceptions.user import (
+    UserAlreadyExistsError,
+    InvalidUserDataError,
+    UserAlreadyInactiveError,
+    UserNotFoundError,
+    StaleUserVersionError,
+    EmailAlreadyTakenError,
+    UsernameAlreadyTakenError
+)
 from src.utils.exceptions import CommandExecutionError
+from src.core.infrastructure.database.unit_of_work import UnitOfWork
 from uuid import UUID
 
 
+logger = logging.getLogger(__name__)
+
 
 class UpdateUserHandler(CommandHandler[UpdateUserCommandRequest, UpdateUserCommandResponse]):
-    def __init__(self, user_service: UserService):
+    def __init__(self, user_service: UserService, unit_of_work: UnitOfWork):
         self._user_service = user_service
+        self._unit_of_work = unit_of_work
     
 
     async def handle(self,
@@ -24,7 +37,8 @@ class UpdateUserHandler(CommandHandler[UpdateUserCommandRequest, UpdateUserComma
                      command: UpdateUserCommandRequest
     ) -> UpdateUserCommandResponse:
         try:
-            await self._user_service.update_user(user_id=user_id, data=command)
+            async with self._unit_of_work.begin():
+                await self._user_service.update_user(user_id=user_id, data=command)
             if isinstance(command, UpdateUserByAdminCommandRequest):
                 return UpdateUserByAdminCommandResponse.success(message="Successfully updated the user")
             return UpdateCurrentUserCommandResponse.success("Successfully updated the user")
@@ -32,8 +46,12 @@ class UpdateUserHandler(CommandHandler[UpdateUserCommandRequest, UpdateUserComma
             raise CommandExecutionError("User is already inactive.", cause=e) from e
         except UserNotFoundError as e:
             raise CommandExecutionError(message="Users not found", cause=e) from e
+        except (EmailAlreadyTakenError, UsernameAlreadyTakenError) as e:
+            raise CommandExecutionError("Email or username is already in use.", cause=e) from e
+        except StaleUserVersionError as e:
+            raise CommandExecutionError("User was modified concurrently.", cause=e) from e
         except Exception as e:
-            print(e)
+            logger.exception("Unexpected error during update user")
             raise CommandExecutionError("Unexpected error during update user", cause=e) from e
     
     async def __call__(self,
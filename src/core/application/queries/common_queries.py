@@ -1,10 +1,10 @@
 
-from pydantic import BaseModel, Field
-from typing import Optional
+from pydantic import BaseModel, Field, field_validator
+from typing import Any, Optional, Literal
 from uuid import UUID, uuid4
 from datetime import datetime, timezone
 
-from src.core.domain.models.user import UserResponse
+from src.core.domain.models.user import UserResponse, UserField
 
 
 
@@ -17,20 +17,53 @@ class QueryResponse(BaseModel):
     query_id: UUID
     success: bool
     error: Optional[str] = None
+    # sent as the ETag header, not part of the body
+    etag: Optional[str] = Field(default=None, exclude=True)
 
     @classmethod
-    def success_response(cls, query_id: str, user: UserResponse):
+    def success_response(cls, query_id: str, user: UserResponse, etag: Optional[str] = None):
         return cls(
             query_id=query_id,
             success=True,
             error=None,
-            user=user
+            user=user,
+            etag=etag
         )
 
+CountStrategy = Literal["exact", "estimated", "none"]
+
+
+class PaginationMeta(BaseModel):
+    limit: int
+    count: CountStrategy
+    total: Optional[int] = None
+
+
 class PaginationFilterQuery(BaseModel):
     skip: int = 0
     limit: int = 100
+    cursor: Optional[str] = Field(default=None, description="Opaque cursor from next_cursor; replaces skip")
+    count: CountStrategy = Field(
+        default="none",
+        description="exact: counted in the page query, estimated: planner statistics, none: no total"
+    )
     search: Optional[str] = None
     is_active: Optional[bool] = None
     sort_by: Optional[str] = None
-    sort_order: Optional[str] = "asc"
\ No newline at end of file
+    sort_order: Optional[str] = "asc"
+
+
+class UserFieldsQuery(BaseModel):
+    fields: Optional[list[UserField]] = Field(
+        default=None,
+        description="Comma separated user fields to return, e.g. id,username. All fields when omitted"
+    )
+
+    @field_validator("fields", mode="before")
+    @classmethod
+    def split_fields(cls, value: Any) -> Any:
+        if value is None:
+            return None
+        values = [value] if isinstance(value, str) else value
+        fields = [name.strip() for item in values for name in item.split(",") if name.strip()]
+        return fields or None
@@ -0,0 +1,17 @@
+from src.core.application.queries.common_queries import QueryRequest
+from typing import Optional, Literal
+
+
+ExportFormat = Literal["ndjson", "csv"]
+
+EXPORT_MEDIA_TYPES: dict[str, str] = {
+    "ndjson": "application/x-ndjson",
+    "csv": "text/csv",
+}
+
+
+class ExportUsersQueryRequest(QueryRequest):
+    format: ExportFormat = "ndjson"
+    search: Optional[str] = None
+    is_active: Optional[bool] = None
+    is_superuser: Optional[bool] = None
@@ -1,13 +1,14 @@
-from src.core.application.queries.common_queries import QueryResponse, QueryRequest
-from src.core.domain.models.user import UserResponse, UserId
+from src.core.application.queries.common_queries import QueryResponse, QueryRequest, UserFieldsQuery
+from src.core.domain.models.user import UserResponse, PartialUserResponse, UserId
+from pydantic import SerializeAsAny
 from typing import Optional
 
 
-class GetUserByIdQueryRequest(QueryRequest):
+class GetUserByIdQueryRequest(QueryRequest, UserFieldsQuery):
     user_id: UserId
 
 
 class GetUserByIdQueryResponse(QueryResponse):
-    user: UserResponse
+    user: SerializeAsAny[PartialUserResponse] | UserResponse
 
 
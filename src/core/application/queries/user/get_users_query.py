@@ -1,22 +1,43 @@
-from src.core.application.queries.common_queries import QueryResponse, QueryRequest, PaginationFilterQuery
-from src.core.domain.models.user import UserResponse, UserId
-from typing import Optional
+from src.core.application.queries.common_queries import (
+    QueryResponse,
+    QueryRequest,
+    PaginationFilterQuery,
+    PaginationMeta,
+    UserFieldsQuery
+)
+from src.core.domain.models.user import UserResponse, PartialUserResponse, UserId
+from pydantic import SerializeAsAny
+from typing import Optional, Literal
 
 
-class GetUsersQueryRequest(QueryRequest, PaginationFilterQuery):
+UserSortField = Literal["id", "username", "email", "created_at", "updated_at", "is_active", "is_superuser"]
+
+
+class GetUsersQueryRequest(QueryRequest, PaginationFilterQuery, UserFieldsQuery):
     is_superuser: Optional[bool] = None
+    sort_by: Optional[UserSortField] = None
 
 
 class GetUsersQueryResponse(QueryResponse):
-    users: list[UserResponse]
+    users: list[SerializeAsAny[PartialUserResponse] | UserResponse]
+    next_cursor: Optional[str] = None
+    pagination: Optional[PaginationMeta] = None
 
     @classmethod
-    def success_response(cls, query_id: str, users: UserResponse):
+    def success_response(cls,
+                         query_id: str,
+                         users: list[UserResponse | PartialUserResponse],
+                         next_cursor: Optional[str] = None,
+                         pagination: Optional[PaginationMeta] = None,
+                         etag: Optional[str] = None):
         return cls(
             query_id=query_id,
             success=True,
             error=None,
-            users=users
+            users=users,
+            next_cursor=next_cursor,
+            pagination=pagination,
+            etag=etag
         )
 
 
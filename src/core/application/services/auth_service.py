@@ -1,50 +1,166 @@
 from src.core.infrastructure.repositories.user_repository import UserRepository
+from src.core.application.services.user_service import UserService
+from src.core.infrastructure.repositories.refresh_token_repository import RefreshTokenRepository
 from src.core.application.commands.auth.login_user_command import LoginUserCommandRequest
-from src.core.domain.exceptions.auth import InvalidCredentialsError
+from src.core.domain.exceptions.auth import InvalidCredentialsError, InvalidRefreshTokenError, RefreshTokenReusedError
+from src.core.domain.models.auth import RefreshToken
+from src.core.domain.models.user import User
 from src.core.domain.exceptions.user import InactiveUserError
-from src.core.infrastructure.security.password import verify_password
+from src.core.infrastructure.security.password import PasswordHasher
+from src.core.infrastructure.cache.ttl_cache import LRUTTLCache
+from src.core.infrastructure.security.revocation import TokenRevocationStore
+from src.core.infrastructure.security.jwt_keys import JWTKeySet
 from typing import Optional
 from datetime import timedelta
-from config.settings import Settings
 from datetime import datetime, timedelta
-from jose import JWTError, jwt
-from config.settings import Settings
+from jose import JWTError
 from datetime import datetime, timedelta, timezone
 from typing import Any
+from uuid import UUID, uuid4
+import hashlib
+import secrets
+import time
 
 
-settings = Settings()
-
 class AuthService:
-    def __init__(self, user_repository: UserRepository):
+    def __init__(
+        self,
+        user_repository: UserRepository,
+        user_service: UserService,
+        password_hasher: PasswordHasher,
+        token_cache: LRUTTLCache[bytes, dict[str, Any]],
+        refresh_token_repository: RefreshTokenRepository,
+        token_revocation_store: TokenRevocationStore,
+        jwt_keys: JWTKeySet,
+        access_token_expire_minutes: int = 30,
+        refresh_token_expire_days: int = 30
+    ):
         self.user_repository = user_repository
-        self.secret_key = settings.SECRET_KEY
-        self.algorithm = settings.ALGORITHM
-        self.access_token_expire_minutes = settings.ACCESS_TOKEN_EXPIRE_MINUTES
+        self.user_service = user_service
+        self.refresh_token_repository = refresh_token_repository
+        self.password_hasher = password_hasher
+        self.token_cache = token_cache
+        self.token_revocation_store = token_revocation_store
+        self.jwt_keys = jwt_keys
+        self.access_token_expire_minutes = access_token_expire_minutes
+        self.refresh_token_expire_days = refresh_token_expire_days
 
     async def authenticate(self, command: LoginUserCommandRequest):
         user = await self.user_repository.fetch_by_email(email=command.email)
-        if not user or not verify_password(command.password, user.hashed_password):
+        if not user:
+            raise InvalidCredentialsError("The login credentials entered are not valid")
+
+        valid, new_hash = await self.password_hasher.verify_and_update(command.password, user.hashed_password)
+        if not valid:
             raise InvalidCredentialsError("The login credentials entered are not valid")
         
         if not user.is_active:
             raise InactiveUserError("Inactive user")
+
+        if new_hash:
+            # outdated scheme or cost - the only moment the plain password is known;
+            # a concurrent change of the user wins and the rehash is retried next login
+            await self.user_service.rehash_password(
+                user_id=user.id,
+                hashed_password=new_hash,
+                expected_version=user.version
+            )
         return user
 
     async def create_access_token(self, subject: str | Any, expires_delta: Optional[timedelta] = None) -> str:
         expire = datetime.now(timezone.utc) + (expires_delta or timedelta(minutes=self.access_token_expire_minutes))
-        to_encode = {"exp": expire, "sub": str(subject)}
-        encoded_jwt = jwt.encode(to_encode, self.secret_key, algorithm=self.algorithm)
+        to_encode = {"exp": expire, "sub": str(subject), "jti": uuid4().hex}
+        encoded_jwt = self.jwt_keys.encode(to_encode)
         return encoded_jwt
 
     async def decode_token(self, token: str) -> dict[str, Any] | None:
-        try:
-            payload = jwt.decode(token, self.secret_key, algorithms=[self.algorithm])
-            exp = payload.get("exp")
-            if exp and datetime.fromtimestamp(exp, tz=timezone.utc) < datetime.now(timezone.utc):
+        """Verify the token and return its claims, or None if it is invalid, expired or revoked.
+
+        Verified payloads are cached under the digest of the token until the token
+        expires, so a client reusing its token pays for the signature check once.
+        Revocation is checked on every call, cached or not.
+        """
+        digest = hashlib.sha256(token.encode()).digest()
+        payload = self.token_cache.get(digest)
+        if payload is None:
+            try:
+                # jose rejects an expired token itself
+                payload = self.jwt_keys.decode(token)
+            except JWTError:
                 return None
-            return payload
-        except JWTError:
+
+            exp = payload.get("exp")
+            ttl = exp - time.time() if isinstance(exp, (int, float)) else None
+            self.token_cache.set(digest, payload, ttl=ttl)
+
+        jti = payload.get("jti")
+        if jti and await self.token_revocation_store.is_revoked(jti):
             return None
+        return payload
+
+    async def revoke_access_token(self, token: str) -> None:
+        """Revoke the access token until it expires. Invalid or already expired tokens are ignored."""
+        payload = await self.decode_token(token)
+        if not payload or not payload.get("jti") or not isinstance(payload.get("exp"), (int, float)):
+            return
+        expires_at = datetime.fromtimestamp(payload["exp"], tz=timezone.utc)
+        await self.token_revocation_store.revoke(jti=payload["jti"], expires_at=expires_at)
+
+    async def create_refresh_token(self, user_id: UUID, family_id: UUID | None = None) -> str:
+        """Issue a refresh token, starting a new family unless one is given.
+
+        Only the SHA-256 digest is stored. The token is 256 random bits, so a
+        fast hash is enough and refreshing costs an indexed lookup, not bcrypt.
+        """
+        token = secrets.token_urlsafe(32)
+        await self.refresh_token_repository.create(RefreshToken(
+            user_id=user_id,
+            family_id=family_id or uuid4(),
+            token_hash=self._hash_refresh_token(token),
+            expires_at=datetime.now(timezone.utc) + timedelta(days=self.refresh_token_expire_days),
+        ))
+        return token
+
+    async def rotate_refresh_token(self, refresh_token: str) -> tuple[User, str]:
+        """Consume the refresh token and issue the next one of its family.
+
+        Returns:
+            The user of the session and the new refresh token.
+
+        Raises:
+            RefreshTokenReusedError: If the token was already used. Carries the family
+                to revoke, which the caller must do outside of the failed transaction.
+            InvalidRefreshTokenError: If the token is unknown, expired or revoked.
+            InactiveUserError: If the user was deactivated.
+        """
+        token_hash = self._hash_refresh_token(refresh_token)
+        current = await self.refresh_token_repository.consume(token_hash=token_hash)
+        if current is None:
+            existing = await self.refresh_token_repository.fetch_by_hash(token_hash=token_hash)
+            if existing and existing.used_at is not None and existing.revoked_at is None:
+                raise RefreshTokenReusedError(family_id=existing.family_id)
+            raise InvalidRefreshTokenError()
+
+        user = await self.user_repository.fetch_by_id(record_id=current.user_id)
+        if not user or not user.is_active:
+            raise InactiveUserError("Inactive user")
+        return user, await self.create_refresh_token(user.id, family_id=current.family_id)
+
+    async def revoke_refresh_token_family(self, family_id: UUID) -> None:
+        await self.refresh_token_repository.revoke_family(family_id=family_id)
+
+    async def logout(self, refresh_token: str, access_token: str | None = None) -> None:
+        """Revoke the session of the refresh token and the access token used to log out.
+
+        Unknown tokens are ignored.
+        """
+        if access_token:
+            await self.revoke_access_token(access_token)
+        existing = await self.refresh_token_repository.fetch_by_hash(token_hash=self._hash_refresh_token(refresh_token))
+        if existing:
+            await self.refresh_token_repository.revoke_family(family_id=existing.family_id)
 
+    @staticmethod
+    def _hash_refresh_token(refresh_token: str) -> str:
+        return hashlib.sha256(refresh_token.encode()).hexdigest()
 
@@ -1,8 +1,19 @@
 
 from src.core.infrastructure.repositories.user_repository import UserRepository
-from src.core.domain.models.user import CreateUserDBData, UserResponse, User
+from src.core.infrastructure.repositories.pagination import Page
+from src.core.domain.models.user import (
+    CreateUserData,
+    CreateUserDBData,
+    UserResponse,
+    PartialUserResponse,
+    User,
+    UserField,
+    user_response_model
+)
 from src.core.application.commands.user.create_user_command import CreateUserCommandRequest
 from src.core.application.queries.user.get_users_query import GetUsersQueryRequest
+from src.core.application.queries.user.export_users_query import ExportUsersQueryRequest
+from src.core.application.commands.user.import_users_command import ImportUserRowResult
 from src.core.application.commands.user.change_password_comand import ChangePasswordCommandRequest
 from src.core.application.commands.user.update_user_command import (
     UpdateUserCommandRequest,
@@ -18,17 +29,51 @@ from src.core.domain.exceptions.user import (
     UsernameAlreadyTakenError,
     NoPermissionError,
     InvalidPasswordError,
-    PasswordReuseError
+    PasswordReuseError,
+    StaleUserVersionError
 )
+from src.core.domain.exceptions.conditional import NotModifiedError
 
-from src.core.infrastructure.security.password import get_password_hash, verify_password
+from src.core.infrastructure.security.password import PasswordHasher
+from src.core.infrastructure.cache.ttl_cache import LRUTTLCache
+from src.core.infrastructure.database.unit_of_work import call_after_commit
+from src.utils.utils import etag_matches, make_etag
+from pydantic import TypeAdapter, ValidationError
 from uuid import UUID
 from datetime import datetime, timezone
+from functools import lru_cache
+from typing import Any, AsyncIterator, Sequence
+
+
+USER_RESPONSE_FIELDS = list(UserResponse.model_fields)
+
+
+def _representation_tag(model: type[UserResponse | PartialUserResponse]) -> str:
+    # representations restricted with fields= get their own tags
+    return "" if model is UserResponse else "." + ",".join(model.model_fields)
+
+
+def user_etag(user_id: UUID, version: int, model: type[UserResponse | PartialUserResponse] = UserResponse) -> str:
+    """ETag of a user in the representation of model, every update bumps its version."""
+    return make_etag(f"{user_id}.{version}{_representation_tag(model)}")
+
+
+@lru_cache(maxsize=None)
+def _list_adapter(model: type[UserResponse | PartialUserResponse]) -> TypeAdapter:
+    # a page is validated in a single call instead of once per row
+    return TypeAdapter(list[model])
 
 
 class UserService:
-    def __init__(self, user_repository: UserRepository):
+    def __init__(
+        self,
+        user_repository: UserRepository,
+        password_hasher: PasswordHasher,
+        user_cache: LRUTTLCache[UUID, UserResponse]
+    ):
         self.user_repository = user_repository
+        self.password_hasher = password_hasher
+        self.user_cache = user_cache
     
 
     async def create_user(self, command: CreateUserCommandRequest) -> None:
@@ -38,101 +83,265 @@ class UserService:
             command: The command containing user creation data (username, email, password).
 
         Raises:
-            UserAlreadyExistsError: If a user with the given email already exists.
+            UsernameAlreadyTakenError: If a user with the given username already exists.
+            EmailAlreadyTakenError: If a user with the given email already exists.
             InvalidUserDataError: If the provided data is invalid (e.g., empty username).
         """
-        if not command.username.strip():
-            raise InvalidUserDataError("Username cannot be empty")
-        
-        if command.username.lower() in {"admin", "root"}:
-            raise InvalidUserDataError("Username is reserved and cannot be used")
-        
-        existing_user_by_username = await self.user_repository.fetch_by_username(username=command.username)
-        if existing_user_by_username:
-            raise UserAlreadyExistsError(f"User with this username {command.username} already exists")
-
-        existing_user_by_email = await self.user_repository.fetch_by_email(email=command.email)
-        if existing_user_by_email:
-            raise UserAlreadyExistsError(f"User with email {command.email} already exists")
+        self._validate_new_username(command.username)
 
         user_data = CreateUserDBData(
             username=command.username,
             email=command.email,
-            hashed_password=get_password_hash(command.password)
+            hashed_password=await self.password_hasher.hash(command.password)
         )
 
         return await self.user_repository.create(user_data)
+
+
+    async def import_users(
+        self,
+        records: AsyncIterator[tuple[int, dict[str, Any] | None]],
+        batch_size: int = 1000
+    ) -> list[ImportUserRowResult]:
+        """Import users from parsed upload rows in batches.
+
+        Every batch is validated, its passwords are hashed in parallel and the valid
+        users are bulk loaded, so a bad or conflicting row never rejects the others.
+
+        Args:
+            records: Row numbers with the parsed row, or None for a malformed one.
+            batch_size: Number of rows validated, hashed and loaded at once.
+
+        Returns:
+            The outcome of every row, ordered by row number.
+        """
+        results: list[ImportUserRowResult] = []
+        batch: list[tuple[int, dict[str, Any] | None]] = []
+        async for record in records:
+            batch.append(record)
+            if len(batch) >= batch_size:
+                results.extend(await self._import_batch(batch))
+                batch = []
+        if batch:
+            results.extend(await self._import_batch(batch))
+        return sorted(results, key=lambda result: result.row)
+
+
+    async def _import_batch(self, batch: list[tuple[int, dict[str, Any] | None]]) -> list[ImportUserRowResult]:
+        results: list[ImportUserRowResult] = []
+        valid: list[tuple[int, CreateUserData]] = []
+        for row_no, row in batch:
+            if row is None:
+                results.append(ImportUserRowResult(row=row_no, status="invalid", message="Malformed row"))
+                continue
+            try:
+                data = CreateUserData.model_validate(row)
+                self._validate_new_username(data.username)
+            except ValidationError as e:
+                error = e.errors()[0]
+                message = f"{'.'.join(map(str, error['loc']))}: {error['msg']}" if error["loc"] else error["msg"]
+                results.append(self._invalid_row(row_no, row, message))
+                continue
+            except InvalidUserDataError as e:
+                results.append(self._invalid_row(row_no, row, e.message))
+                continue
+            valid.append((row_no, data))
+
+        hashes = await self.password_hasher.hash_many([data.password for _, data in valid])
+        users = [
+            (row_no, User(username=data.username, email=data.email, hashed_password=hashed_password))
+            for (row_no, data), hashed_password in zip(valid, hashes)
+        ]
+        conflicts = await self.user_repository.bulk_import(records=users)
+
+        for row_no, user in users:
+            if row_no in conflicts:
+                results.append(ImportUserRowResult(
+                    row=row_no, status="conflict", username=user.username, email=user.email, message=conflicts[row_no]
+                ))
+            else:
+                results.append(ImportUserRowResult(row=row_no, status="created", username=user.username, email=user.email))
+        return results
+
+
+    @staticmethod
+    def _invalid_row(row_no: int, row: dict[str, Any], message: str) -> ImportUserRowResult:
+        username, email = row.get("username"), row.get("email")
+        return ImportUserRowResult(
+            row=row_no,
+            status="invalid",
+            username=username if isinstance(username, str) else None,
+            email=email if isinstance(email, str) else None,
+            message=message
+        )
+
+
+    @staticmethod
+    def _validate_new_username(username: str) -> None:
+        if not username.strip():
+            raise InvalidUserDataError("Username cannot be empty")
+        
+        if username.lower() in {"admin", "root"}:
+            raise InvalidUserDataError("Username is reserved and cannot be used")
     
 
-    async def get_user_by_id(self, user_id: UUID) -> UserResponse | None:
-        """Fetch a user by their ID.
+    async def get_user_by_id(
+        self,
+        user_id: UUID,
+        fields: Sequence[UserField] | None = None,
+        if_none_match: str | None = None
+    ) -> tuple[UserResponse | PartialUserResponse, str]:
+        """Fetch a user by their ID, selecting only the columns of the response.
+
+        With if_none_match only the version of the user is read first, an unchanged
+        user is answered without fetching or validating the rest.
 
         Args:
             user_id: The UUID of the user to fetch.
+            fields: Fields of the response, all UserResponse fields when None.
+            if_none_match: The If-None-Match header of the request.
 
         Returns:
-            The User object if found, else None.
+            The user restricted to the requested fields and its ETag.
+
+        Raises:
+            UserNotFoundError: If the user does not exist.
+            NotModifiedError: If the user still matches if_none_match.
         """
-        user = await self.user_repository.fetch_by_id(record_id=user_id)
-        if not user: 
+        model = user_response_model(fields)
+        if if_none_match:
+            current = await self.user_repository.fetch_fields_by_id(record_id=user_id, fields=["version"])
+            if current and etag_matches(if_none_match, etag := user_etag(user_id, current["version"], model)):
+                raise NotModifiedError(etag)
+
+        user = await self.user_repository.fetch_fields_by_id(
+            record_id=user_id,
+            fields=list(dict.fromkeys([*model.model_fields, "version"]))
+        )
+        if not user:
             raise UserNotFoundError(f"User with ID {user_id} does not exist.")
-        
+        return model.model_validate(user), user_etag(user_id, user["version"], model)
+
+
+    async def get_authenticated_user(self, user_id: UUID) -> UserResponse | None:
+        """Fetch the user making a request, from the in-process cache when possible.
+
+        Cached entries are dropped whenever this service changes the user and
+        expire after the cache TTL, which bounds staleness across nodes. A miss
+        is filled from the primary, a lagging replica could otherwise cache a
+        deactivated user as active again for a whole TTL right after the change.
+
+        Args:
+            user_id: The UUID of the user to fetch.
+
+        Returns:
+            The user, or None if it does not exist.
+        """
+        user = self.user_cache.get(user_id)
+        if user is None:
+            record = await self.user_repository.fetch_by_id_from_primary(record_id=user_id)
+            if not record:
+                return None
+            user = UserResponse.model_validate(record)
+            self.user_cache.set(user_id, user)
+        return user
 
-        return UserResponse.model_validate(user)
+
+    def _invalidate_cached_user(self, user_id: UUID) -> None:
+        # dropped again after the commit, in case a concurrent request cached the old row meanwhile
+        self.user_cache.invalidate(user_id)
+        call_after_commit(lambda: self.user_cache.invalidate(user_id))
     
     
-    async def get_users(self, query: GetUsersQueryRequest) -> list[UserResponse]:
-        users = await self.user_repository.fetch_all_filtered(query=query)
-        if not users:
+    async def get_users(self, query: GetUsersQueryRequest, if_none_match: str | None = None) -> tuple[Page, str]:
+        """Fetch one page of users restricted to query.fields.
+
+        With if_none_match the page is first fingerprinted from the ids and versions
+        of its rows, an unchanged page is answered without fetching the users.
+
+        Returns:
+            The page of users and its ETag.
+
+        Raises:
+            UsersNotFoundError: If no user matches the query.
+            NotModifiedError: If the page still matches if_none_match.
+        """
+        model = user_response_model(query.fields)
+        if if_none_match:
+            fingerprint = await self.user_repository.fetch_page_fingerprint(query=query)
+            if etag_matches(if_none_match, etag := make_etag(fingerprint + _representation_tag(model))):
+                raise NotModifiedError(etag)
+
+        page = await self.user_repository.fetch_all_filtered(query=query, fields=list(model.model_fields))
+        if not page.items:
             raise UsersNotFoundError("No users found.")
-        return [UserResponse.model_validate(user) for user in users]
+        etag = make_etag(page.fingerprint + _representation_tag(model))
+        return page._replace(items=_list_adapter(model).validate_python(page.items)), etag
+
+
+    async def export_users(self, query: ExportUsersQueryRequest) -> AsyncIterator[list[dict[str, Any]]]:
+        """Stream users matching the query in batches of plain dicts.
+
+        Args:
+            query: Filters of the export.
+
+        Yields:
+            Batches of users with the public UserResponse fields.
+        """
+        async for batch in self.user_repository.stream_all_filtered(query=query, fields=USER_RESPONSE_FIELDS):
+            yield [dict(row) for row in batch]
 
 
     async def deactivate_user(self, user_id: UUID) -> None:
-        user = await self.user_repository.fetch_by_id(record_id=user_id)
+        user = await self.user_repository.update_fields(
+            record_id=user_id,
+            values={"is_active": False},
+            match={"is_active": True}
+        )
         if not user:
-            raise UserNotFoundError(f"User with ID {user_id} does not exist.")
-        
-        if not user.is_active:
-            raise UserAlreadyInactiveError("User is already inactive.")
-        
-        user.is_active = False
-        await self.user_repository.update(record=user)
+            await self._raise_update_rejected(user_id, require_active=True)
+        self._invalidate_cached_user(user_id)
 
 
     async def update_user(self,
                           user_id: UUID,
                           data: UpdateUserCommandRequest
                           ) -> bool:
-        user = await self.user_repository.fetch_by_id(record_id=user_id)
-        if not user:
-            raise UserNotFoundError(f"User with ID {user_id} does not exist.")
-        
-        if not user.is_active and isinstance(data, UpdateCurrentUserCommandRequest):
-            raise UserAlreadyInactiveError("User is already inactive.")
-        
         update_data = data.model_dump(exclude_unset=True)
+        expected_version = update_data.pop("version", None)
+        require_active = isinstance(data, UpdateCurrentUserCommandRequest)
 
-        if isinstance(data, UpdateCurrentUserCommandRequest):
+        if require_active:
             update_data.pop("is_active", None)
             update_data.pop("is_superuser", None)
 
-        if "email" in update_data and update_data["email"] != user.email:
-            existing_user = await self.user_repository.fetch_by_email(email=update_data["email"])
-            if existing_user and existing_user.id != user.id:
-                raise EmailAlreadyTakenError("This email is already in use.")
-        
-        if "username" in update_data and update_data["username"] != user.username:
-            existing_user = await self.user_repository.fetch_by_username(username=update_data["username"])
-            if existing_user and existing_user.id != user.id:
-                raise UsernameAlreadyTakenError("This username is already in use.")
+        # a taken email or username is reported by the unique constraints
+        user = await self.user_repository.update_fields(
+            record_id=user_id,
+            values=update_data,
+            expected_version=expected_version,
+            match={"is_active": True} if require_active else None
+        )
+        if not user:
+            await self._raise_update_rejected(user_id, require_active=require_active)
+        self._invalidate_cached_user(user_id)
+        return True
 
 
-        for key, value in update_data.items():
-            setattr(user, key, value)
-        
-        await self.user_repository.update(record=user)
-        return True
+    async def _raise_update_rejected(self, user_id: UUID, require_active: bool) -> None:
+        """Explain why a conditional update matched no row.
+
+        Raises:
+            UserNotFoundError: If the user does not exist.
+            UserAlreadyInactiveError: If an active user was required.
+            StaleUserVersionError: If the user changed since the expected version.
+        """
+        user = await self.user_repository.fetch_by_id(record_id=user_id)
+        if not user:
+            raise UserNotFoundError(f"User with ID {user_id} does not exist.")
+        if require_active and not user.is_active:
+            raise UserAlreadyInactiveError("User is already inactive.")
+        raise StaleUserVersionError()
     
     async def delete_user(self, user_id: UUID) -> bool:
         user = await self.user_repository.fetch_by_id(record_id=user_id)
@@ -146,20 +355,51 @@ class UserService:
         if user.is_superuser:
             raise NoPermissionError("No sufficient permissions to delete a user")
         
-        return await self.user_repository.delete(record_id=user_id)
+        deleted = await self.user_repository.delete(record_id=user_id)
+        self._invalidate_cached_user(user_id)
+        return deleted
     
 
+    async def rehash_password(self, user_id: UUID, hashed_password: str, expected_version: int) -> bool:
+        """Store a new hash of the unchanged password, e.g. after a login under an outdated scheme.
+
+        The version is bumped like for any other change, so the cached user is dropped.
+
+        Args:
+            user_id: The UUID of the user.
+            hashed_password: The new hash of the current password.
+            expected_version: Version of the user the hash was verified against.
+
+        Returns:
+            False if the user changed concurrently, the rehash is then skipped.
+        """
+        updated_user = await self.user_repository.update_fields(
+            record_id=user_id,
+            values={"hashed_password": hashed_password},
+            expected_version=expected_version
+        )
+        if not updated_user:
+            return False
+        self._invalidate_cached_user(user_id)
+        return True
+
     async def change_user_password(self, user_id: UUID, command: ChangePasswordCommandRequest):
         user: User = await self.user_repository.fetch_by_id(record_id=user_id)
 
         if not user:
             raise UserNotFoundError(f"User with ID {user_id} does not exist.")
         
-        if not verify_password(command.old_password, user.hashed_password):
+        if not await self.password_hasher.verify(command.old_password, user.hashed_password):
             raise InvalidPasswordError("Old password is incorrect.")
         
-        if verify_password(command.new_password, user.hashed_password):
+        if await self.password_hasher.verify(command.new_password, user.hashed_password):
             raise PasswordReuseError("New password must be different from the old password.")
         
-        user.hashed_password = get_password_hash(command.new_password)
-        await self.user_repository.update(user)
\ No newline at end of file
+        updated_user = await self.user_repository.update_fields(
+            record_id=user_id,
+            values={"hashed_password": await self.password_hasher.hash(command.new_password)},
+            expected_version=user.version
+        )
+        if not updated_user:
+            raise StaleUserVersionError("The password was changed concurrently, try again")
+        self._invalidate_cached_user(user_id)
\ No newline at end of file
@@ -1,9 +1,13 @@
 
+import logging
 from fastapi import HTTPException
 from functools import wraps
 from src.utils.exceptions import CommandExecutionError, HttpAwareException
 
 
+logger = logging.getLogger(__name__)
+
+
 def handle_exceptions(func):
     @wraps(func)
     async def wrapper(*args, **kwargs):
@@ -12,9 +16,10 @@ def handle_exceptions(func):
         except CommandExecutionError as e:
             cause = e.cause
             if isinstance(cause, HttpAwareException):
-                raise HTTPException(status_code=cause.status_code, detail=cause.message)
-            print(e)
+                raise HTTPException(status_code=cause.status_code, detail=cause.message, headers=cause.headers)
+            logger.warning("%s failed: %s", func.__name__, e, exc_info=cause)
             raise HTTPException(status_code=400, detail=str(e))
         except Exception as e:
+            logger.exception("Unhandled error in %s", func.__name__)
             raise HTTPException(status_code=500, detail=f"Internal server error: {str(e)}")
     return wrapper
@@ -1,3 +1,5 @@
+import math
+
 from src.utils.exceptions import HttpAwareException
 
 
@@ -8,3 +10,44 @@ class InvalidCredentialsError(HttpAwareException):
     def __init__(self, message: str = "Invalid credentials"):
         super().__init__(message)
         self.message = message
+
+
+class PasswordHasherBusyError(HttpAwareException):
+    """Raised when the password hashing pool is saturated and the request is shed."""
+    status_code = 503
+
+    def __init__(self, message: str = "Too many concurrent password operations, try again later"):
+        super().__init__(message)
+        self.message = message
+
+
+
+class InvalidRefreshTokenError(HttpAwareException):
+    """Raised when the refresh token is unknown, expired, already used or revoked."""
+    status_code = 401
+
+    def __init__(self, message: str = "Invalid refresh token"):
+        super().__init__(message)
+        self.message = message
+
+
+class RefreshTokenReusedError(HttpAwareException):
+    """Raised when an already used refresh token is presented again, which revokes its whole family."""
+    status_code = 401
+
+    def __init__(self, message: str = "Refresh token reuse detected, the session has been revoked", family_id=None):
+        super().__init__(message)
+        self.message = message
+        self.family_id = family_id
+
+
+class TooManyLoginAttemptsError(HttpAwareException):
+    """Raised when the email or client address exceeded the failed login limit, before any hashing."""
+    status_code = 429
+
+    def __init__(self, message: str = "Too many failed login attempts, try again later", retry_after: float = 0):
+        super().__init__(message)
+        self.message = message
+        self.retry_after = max(math.ceil(retry_after), 1)
+        self.headers = {"Retry-After": str(self.retry_after)}
+
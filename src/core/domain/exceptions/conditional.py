@@ -0,0 +1,12 @@
+from src.utils.exceptions import HttpAwareException
+
+
+class NotModifiedError(HttpAwareException):
+    """Raised when the resource still matches the ETag sent in If-None-Match."""
+    status_code = 304
+
+    def __init__(self, etag: str, message: str = "Not modified"):
+        super().__init__(message)
+        self.message = message
+        self.etag = etag
+        self.headers = {"ETag": etag, "Cache-Control": "private, no-cache"}
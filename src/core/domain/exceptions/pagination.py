@@ -0,0 +1,10 @@
+from src.utils.exceptions import HttpAwareException
+
+
+class InvalidCursorError(HttpAwareException):
+    """Raised when the pagination cursor is malformed or issued for another sort."""
+    status_code = 400
+
+    def __init__(self, message: str = "Invalid pagination cursor"):
+        super().__init__(message)
+        self.message = message
@@ -51,6 +51,7 @@ class UserAlreadyInactiveError(InactiveUserError):
 
 
 class EmailAlreadyTakenError(HttpAwareException):
+    """Raised when the email is already used by another user."""
     status_code = 409
 
     def __init__(self, message: str = "Email is already in use"):
@@ -59,6 +60,7 @@ class EmailAlreadyTakenError(HttpAwareException):
 
 
 class UsernameAlreadyTakenError(HttpAwareException):
+    """Raised when the username is already used by another user."""
     status_code = 409
 
     def __init__(self, message: str = "Username is already in use"):
@@ -86,4 +88,21 @@ class PasswordReuseError(HttpAwareException):
 
     def __init__(self, message: str = "New password must be different from the old password."):
         super().__init__(message)
-        self.message = message
\ No newline at end of file
+        self.message = message
+
+class StaleUserVersionError(HttpAwareException):
+    """Raised when the user was modified by someone else since the given version was read."""
+    status_code = 409
+
+    def __init__(self, message: str = "The user was modified concurrently, reload it and try again"):
+        super().__init__(message)
+        self.message = message
+
+
+class UnsupportedImportFormatError(HttpAwareException):
+    """Raised when the uploaded users file is neither CSV nor NDJSON."""
+    status_code = 415
+
+    def __init__(self, message: str = "Upload users as text/csv or application/x-ndjson"):
+        super().__init__(message)
+        self.message = message
@@ -1,11 +1,60 @@
 from pydantic import BaseModel, Field
-from uuid import UUID
+from sqlmodel import SQLModel, Field as SQLField
+from sqlalchemy import Column, DateTime, ForeignKey, Index, Uuid
+from datetime import datetime, timezone
+from uuid import UUID, uuid4
 from typing import Optional
 
 class Token(BaseModel):
     access_token: str
     token_type: str = Field(default="bearer")
+    refresh_token: Optional[str] = None
 
 class TokenPayload(BaseModel):
     sub: UUID
-    exp: Optional[int] = None
\ No newline at end of file
+    exp: Optional[int] = None
+    jti: Optional[str] = None
+
+class RefreshToken(SQLModel, table=True):
+    """Refresh token stored by its SHA-256 digest, never in plain text.
+
+    Every refresh consumes the token and issues the next one of the same family.
+    Presenting an already used token means it leaked, so the whole family is revoked.
+    """
+    __tablename__ = "refresh_token"
+
+    id: UUID = SQLField(default_factory=uuid4, primary_key=True)
+    user_id: UUID = SQLField(sa_column=Column(Uuid, ForeignKey("user.id", ondelete="CASCADE"), nullable=False, index=True))
+    family_id: UUID = SQLField(index=True)
+    token_hash: str = SQLField(unique=True, index=True)
+    created_at: datetime = SQLField(sa_column=Column(DateTime(timezone=True), nullable=False), default_factory=lambda: datetime.now(timezone.utc))
+    expires_at: datetime = SQLField(sa_column=Column(DateTime(timezone=True), nullable=False))
+    used_at: Optional[datetime] = SQLField(default=None, sa_column=Column(DateTime(timezone=True), nullable=True))
+    revoked_at: Optional[datetime] = SQLField(default=None, sa_column=Column(DateTime(timezone=True), nullable=True))
+
+class RevokedToken(SQLModel, table=True):
+    """Access token revoked before its expiry, identified by its jti claim.
+
+    Rows are only needed until the token would have expired anyway, then they are pruned.
+    """
+    __tablename__ = "revoked_token"
+
+    jti: str = SQLField(primary_key=True)
+    expires_at: datetime = SQLField(sa_column=Column(DateTime(timezone=True), nullable=False, index=True))
+    revoked_at: datetime = SQLField(sa_column=Column(DateTime(timezone=True), nullable=False), default_factory=lambda: datetime.now(timezone.utc))
+
+
+class LoginAttempt(SQLModel, table=True):
+    """Failed login attempt counted by the shared login throttle.
+
+    The key is the throttled subject, "email:<address>" or "ip:<address>".
+    Rows older than the throttle window are pruned.
+    """
+    __tablename__ = "login_attempt"
+    __table_args__ = (
+        Index("ix_login_attempt_key_attempted_at", "key", "attempted_at"),
+    )
+
+    id: Optional[int] = SQLField(default=None, primary_key=True)
+    key: str
+    attempted_at: datetime = SQLField(sa_column=Column(DateTime(timezone=True), nullable=False, index=True), default_factory=lambda: datetime.now(timezone.utc))
@@ -1,14 +1,17 @@
 from sqlmodel import SQLModel, Field
 from uuid import UUID, uuid4
-from pydantic import EmailStr, BaseModel, field_validator
+from pydantic import EmailStr, BaseModel, create_model, field_validator
 from datetime import datetime, timezone
-from sqlalchemy import Column, DateTime
+from functools import lru_cache
+from sqlalchemy import Column, DateTime, Index
 
-from typing import TypeAlias, Optional
+from typing import Literal, Sequence, TypeAlias, Optional
 from uuid import UUID
 
 
 UserId: TypeAlias = UUID
+# fields of UserResponse which can be requested with fields=
+UserField = Literal["id", "username", "email", "is_active", "is_superuser", "version"]
 
 class PasswordValidatorMixin(BaseModel):
     @field_validator("password", check_fields=False)
@@ -41,14 +44,26 @@ class UserData(BaseModel):
 
 class User(SQLModel, UserData, table=True):
     """User model in the database."""
+    __table_args__ = (
+        # (sort column, id) indexes backing keyset pagination of the user listing
+        Index("ix_user_created_at_id", "created_at", "id"),
+        Index("ix_user_updated_at_id", "updated_at", "id"),
+        Index("ix_user_is_active_id", "is_active", "id"),
+        Index("ix_user_is_superuser_id", "is_superuser", "id"),
+        Index("ix_user_email_id", "email", "id"),
+        Index("ix_user_username_id", "username", "id"),
+    )
+
     id: UserId = Field(default_factory=uuid4, primary_key=True)
     hashed_password: Optional[str]
-    created_at: datetime = Field(sa_column=Column(DateTime(timezone=True)), default_factory=lambda: datetime.now(timezone.utc))
-    updated_at: datetime = Field(sa_column=Column(DateTime(timezone=True)), default_factory=lambda: datetime.now(timezone.utc))
+    created_at: datetime = Field(sa_column=Column(DateTime(timezone=True), nullable=False), default_factory=lambda: datetime.now(timezone.utc))
+    updated_at: datetime = Field(sa_column=Column(DateTime(timezone=True), nullable=False), default_factory=lambda: datetime.now(timezone.utc))
     username: str = Field(index=True, unique=True)
     email: EmailStr = Field(unique=True)
     is_active: bool = Field(default=True)
     is_superuser: bool = Field(default=False)
+    # bumped by every update, compared by optimistic concurrency checks
+    version: int = Field(default=1, sa_column_kwargs={"server_default": "1"})
 
 class CreateUserData(UserData, PasswordValidatorMixin):
     """Model for creating a new user."""
@@ -57,17 +72,48 @@ class CreateUserData(UserData, PasswordValidatorMixin):
 class CreateUserDBData(UserData):
     hashed_password: str
 
-class UserResponse(BaseModel):
+class PartialUserResponse(BaseModel):
+    """UserResponse restricted to the fields requested with fields=.
+
+    UserResponse derives from it, so a response holding either kind of user
+    validates them with an isinstance check.
+    """
+
+    class Config:
+        from_attributes = True
+
+
+class UserResponse(PartialUserResponse):
     id: UserId
     username: str
-    email: EmailStr
+    # validated as EmailStr on the way in, read back from the database it only needs the schema
+    email: str = Field(schema_extra={"json_schema_extra": {"format": "email"}})
     is_active: bool
     is_superuser: bool
+    version: int
 
     class Config:
         from_attributes = True
 
 
+@lru_cache(maxsize=None)
+def _partial_user_response(fields: tuple[UserField, ...]) -> type[PartialUserResponse]:
+    definitions = {name: (UserResponse.model_fields[name].annotation, UserResponse.model_fields[name]) for name in fields}
+    return create_model("PartialUserResponse", __base__=PartialUserResponse, **definitions)
+
+
+def user_response_model(fields: Sequence[UserField] | None = None) -> type[UserResponse | PartialUserResponse]:
+    """Returns the model of a user restricted to fields, in the UserResponse field order.
+
+    Every field set builds its model once. UserResponse itself is returned when
+    no fields or all of them are requested.
+    """
+    selected = tuple(name for name in UserResponse.model_fields if fields is None or name in fields)
+    if len(selected) == len(UserResponse.model_fields):
+        return UserResponse
+    return _partial_user_response(selected)
+
+
 class UserLogin(BaseModel):
     email: str
     password: str
@@ -76,6 +122,10 @@ class UserLogin(BaseModel):
 class UpdateCurrentUser(UserData):
     email: Optional[EmailStr] = None
     username: Optional[str] = None
+    version: Optional[int] = Field(
+        default=None,
+        description="Version of the user the changes are based on. The update is rejected if the user changed since."
+    )
 
 
 class UpdateUserByAdmin(UpdateCurrentUser):
@@ -0,0 +1,45 @@
+import hashlib
+import math
+
+
+class BloomFilter:
+    """Probabilistic set answering "definitely not present" without false negatives.
+
+    Sized for the expected number of items and false positive rate. Each item
+    costs one blake2b digest, split into two halves that derive all bit positions
+    (Kirsch-Mitzenmacher double hashing). Items cannot be removed, so a filter
+    over a shrinking set has to be rebuilt.
+    """
+
+    def __init__(self, capacity: int = 100000, error_rate: float = 0.01):
+        """Initializes the filter
+
+        Args:
+            capacity (int, optional): Expected number of items. Defaults to 100000.
+            error_rate (float, optional): False positive rate at capacity. Defaults to 0.01.
+        """
+        capacity = max(capacity, 1)
+        self.capacity = capacity
+        self.error_rate = error_rate
+        self.size = max(int(-capacity * math.log(error_rate) / math.log(2) ** 2), 8)
+        self.hash_count = max(round(self.size / capacity * math.log(2)), 1)
+        self._bits = bytearray((self.size + 7) // 8)
+        self.count = 0
+
+    def _positions(self, item: str) -> list[int]:
+        digest = hashlib.blake2b(item.encode(), digest_size=16).digest()
+        first = int.from_bytes(digest[:8], "little")
+        second = int.from_bytes(digest[8:], "little") | 1
+        return [(first + i * second) % self.size for i in range(self.hash_count)]
+
+    def add(self, item: str) -> None:
+        for position in self._positions(item):
+            self._bits[position >> 3] |= 1 << (position & 7)
+        self.count += 1
+
+    def __contains__(self, item: str) -> bool:
+        bits = self._bits
+        return all(bits[position >> 3] & (1 << (position & 7)) for position in self._positions(item))
+
+    def __len__(self) -> int:
+        return self.count
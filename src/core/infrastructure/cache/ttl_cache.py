@@ -0,0 +1,88 @@
+import time
+from collections import OrderedDict
+
+from pydantic import BaseModel
+
+
+class CacheStats(BaseModel):
+    """Snapshot of an in-process cache used to size it from real traffic."""
+    size: int
+    max_size: int
+    hits: int
+    misses: int
+    hit_ratio: float
+    evictions: int
+    expirations: int
+    invalidations: int
+
+
+class LRUTTLCache[KeyType, ValueType]:
+    """Bounded in-process cache dropping the least recently used entry when full.
+
+    Every entry expires after the default TTL or its own one, so entries changed
+    on another node are served stale for at most that long. Not thread-safe, it is
+    meant to be used from the event loop only.
+    """
+
+    def __init__(self, max_size: int = 10000, ttl: float = 30.0):
+        """Initializes the cache
+
+        Args:
+            max_size (int, optional): Maximum number of entries. Defaults to 10000.
+            ttl (float, optional): Default lifetime of an entry in seconds. Defaults to 30.0.
+        """
+        self.max_size = max_size
+        self.ttl = ttl
+        self._entries: OrderedDict[KeyType, tuple[float, ValueType]] = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.expirations = 0
+        self.invalidations = 0
+
+    def get(self, key: KeyType) -> ValueType | None:
+        entry = self._entries.get(key)
+        if entry is None:
+            self.misses += 1
+            return None
+        expires_at, value = entry
+        if expires_at <= time.monotonic():
+            del self._entries[key]
+            self.expirations += 1
+            self.misses += 1
+            return None
+        self._entries.move_to_end(key)
+        self.hits += 1
+        return value
+
+    def set(self, key: KeyType, value: ValueType, ttl: float | None = None) -> None:
+        """Stores the value for ttl seconds, or for the default TTL when not given."""
+        ttl = self.ttl if ttl is None else ttl
+        if ttl <= 0 or self.max_size <= 0:
+            return
+        self._entries[key] = (time.monotonic() + ttl, value)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_size:
+            self._entries.popitem(last=False)
+            self.evictions += 1
+
+    def invalidate(self, key: KeyType) -> None:
+        if self._entries.pop(key, None) is not None:
+            self.invalidations += 1
+
+    def clear(self) -> None:
+        self.invalidations += len(self._entries)
+        self._entries.clear()
+
+    def stats(self) -> CacheStats:
+        lookups = self.hits + self.misses
+        return CacheStats(
+            size=len(self._entries),
+            max_size=self.max_size,
+            hits=self.hits,
+            misses=self.misses,
+            hit_ratio=round(self.hits / lookups, 4) if lookups else 0.0,
+            evictions=self.evictions,
+            expirations=self.expirations,
+            invalidations=self.invalidations,
+        )
@@ -2,20 +2,58 @@ from dependency_injector import containers, providers
 
 from src.core.application.services.auth_service import AuthService
 from src.core.application.handlers.auth.login_user_handler import LoginUserHandler
+from src.core.application.handlers.auth.refresh_token_handler import RefreshTokenHandler
+from src.core.application.handlers.auth.logout_user_handler import LogoutUserHandler
+from src.core.infrastructure.repositories.refresh_token_repository import RefreshTokenRepository
 
 
 class AuthContainer(containers.DeclarativeContainer):
-    settings = providers.Dependency()
+    settings = providers.Configuration()
+    db = providers.Dependency()
     user_repository = providers.Dependency()
+    user_service = providers.Dependency()
+    unit_of_work = providers.Dependency()
+    password_hasher = providers.Dependency()
+    token_cache = providers.Dependency()
+    token_revocation_store = providers.Dependency()
+    login_throttle = providers.Dependency()
+    jwt_keys = providers.Dependency()
+
+    refresh_token_repository = providers.Singleton(
+        RefreshTokenRepository,
+        db=db,
+    )
 
     # Services
-    auth_service = providers.Factory(
+    auth_service = providers.Singleton(
         AuthService,
         user_repository=user_repository,
+        user_service=user_service,
+        password_hasher=password_hasher,
+        token_cache=token_cache,
+        refresh_token_repository=refresh_token_repository,
+        token_revocation_store=token_revocation_store,
+        jwt_keys=jwt_keys,
+        access_token_expire_minutes=settings.ACCESS_TOKEN_EXPIRE_MINUTES,
+        refresh_token_expire_days=settings.REFRESH_TOKEN_EXPIRE_DAYS,
     )
 
     # Handlers
-    login_user_handler = providers.Factory(
+    login_user_handler = providers.Singleton(
         LoginUserHandler,
         auth_service=auth_service,
+        unit_of_work=unit_of_work,
+        login_throttle=login_throttle,
+    )
+
+    refresh_token_handler = providers.Singleton(
+        RefreshTokenHandler,
+        auth_service=auth_service,
+        unit_of_work=unit_of_work,
+    )
+
+    logout_user_handler = providers.Singleton(
+        LogoutUserHandler,
+        auth_service=auth_service,
+        unit_of_work=unit_of_work,
     )
@@ -0,0 +1,25 @@
+from dependency_injector import containers, providers
+
+from src.core.application.handlers.batch.batch_handler import BatchHandler
+
+
+class BatchContainer(containers.DeclarativeContainer):
+    unit_of_work = providers.Dependency()
+    create_user_handler = providers.Dependency()
+    update_user_handler = providers.Dependency()
+    deactivate_user_handler = providers.Dependency()
+    delete_user_handler = providers.Dependency()
+    get_user_by_id_handler = providers.Dependency()
+    get_users_handler = providers.Dependency()
+
+    # Handlers
+    batch_handler = providers.Singleton(
+        BatchHandler,
+        unit_of_work=unit_of_work,
+        create_user_handler=create_user_handler,
+        update_user_handler=update_user_handler,
+        deactivate_user_handler=deactivate_user_handler,
+        delete_user_handler=delete_user_handler,
+        get_user_by_id_handler=get_user_by_id_handler,
+        get_users_handler=get_users_handler,
+    )
@@ -3,10 +3,21 @@ import logging.config
 from contextlib import asynccontextmanager
 from typing import ParamSpec, TypeVar, AsyncIterator
 from src.core.infrastructure.database.db import Database
+from src.core.infrastructure.database.unit_of_work import UnitOfWork
 from src.core.infrastructure.repositories.user_repository import UserRepository
+from src.core.infrastructure.security.password import PasswordHasher, build_crypt_context
+from src.core.infrastructure.cache.ttl_cache import LRUTTLCache
+from src.core.infrastructure.repositories.revoked_token_repository import RevokedTokenRepository
+from src.core.infrastructure.security.revocation import TokenRevocationStore
+from src.core.infrastructure.security.jwt_keys import JWTKeySet
+from src.core.infrastructure.modules.registry import ModuleRegistry
+from src.core.infrastructure.repositories.login_attempt_repository import LoginAttemptRepository
+from src.core.infrastructure.security.login_throttle import LoginThrottle, MemoryAttemptLog, DatabaseAttemptLog
 from src.core.infrastructure.containers.user_container import UserContainer
 from src.core.infrastructure.containers.auth_container import AuthContainer
+from src.core.infrastructure.containers.batch_container import BatchContainer
 from config.settings import Settings
+from src.utils.logging import start_queue_listeners, stop_queue_listeners
 
 from dependency_injector import containers, providers
 
@@ -20,8 +31,10 @@ R = TypeVar("R")
 async def initialized_resources(
     container: containers.DeclarativeContainer,
 ) -> AsyncIterator[None]:
-    
+    start_queue_listeners()
     await container.db().init_db()
+    await container.token_revocation_store().start()
+    await container.module_registry().startup()
 
     init_resources = container.init_resources()
     if inspect.isawaitable(init_resources):
@@ -33,7 +46,11 @@ async def initialized_resources(
     if inspect.isawaitable(shutdown_resources):
         await shutdown_resources
 
+    await container.module_registry().shutdown()
+    await container.token_revocation_store().stop()
+    container.password_hasher().shutdown()
     await container.db().shutdown()
+    stop_queue_listeners()
 
 
 class AutomationHubContainer(containers.DeclarativeContainer):
@@ -42,9 +59,13 @@ class AutomationHubContainer(containers.DeclarativeContainer):
         modules=["__main__",
                  "src.core.api.v1.endpoints.user",
                  "src.core.api.v1.endpoints.auth",
+                 "src.core.api.v1.endpoints.system",
+                 "src.core.api.v1.endpoints.batch",
+                 "src.core.api.well_known",
                  "src.core.api.v1.dependencies.common_dependencies",
                  "src.core.api.v1.dependencies.user_dependencies",
-                 "src.core.api.v1.dependencies.auth_dependencies"]
+                 "src.core.api.v1.dependencies.auth_dependencies",
+                 "src.core.api.v1.dependencies.batch_dependencies"]
     )
 
     settings = providers.Configuration()
@@ -60,19 +81,130 @@ class AutomationHubContainer(containers.DeclarativeContainer):
         Database, 
         db_url=settings.db_url,
         retry_attempts=5,
-        retry_delay=2.0
+        retry_delay=2.0,
+        pool_size=settings.db_pool_size,
+        max_overflow=settings.db_max_overflow,
+        pool_timeout=settings.db_pool_timeout,
+        pool_recycle=settings.db_pool_recycle,
+        pool_pre_ping=settings.db_pool_pre_ping,
+        statement_cache_size=settings.db_statement_cache_size,
+        prepared_statement_cache_size=settings.db_prepared_statement_cache_size,
+        replica_urls=settings.db_replica_urls
+    )
+
+    unit_of_work = providers.Singleton(
+        UnitOfWork,
+        db=db
+    )
+
+    password_context = providers.Singleton(
+        build_crypt_context,
+        schemes=settings.password_schemes,
+        bcrypt_rounds=settings.password_bcrypt_rounds,
+        argon2_time_cost=settings.password_argon2_time_cost,
+        argon2_memory_cost=settings.password_argon2_memory_cost,
+        argon2_parallelism=settings.password_argon2_parallelism
+    )
+
+    password_hasher = providers.Singleton(
+        PasswordHasher,
+        context=password_context,
+        max_workers=settings.password_hash_workers,
+        max_pending=settings.password_hash_max_pending,
+        acquire_timeout=settings.password_hash_acquire_timeout
+    )
+    user_cache = providers.Singleton(
+        LRUTTLCache,
+        max_size=settings.user_cache_size,
+        ttl=settings.user_cache_ttl
+    )
+
+    token_cache = providers.Singleton(
+        LRUTTLCache,
+        max_size=settings.token_cache_size,
+        ttl=settings.token_cache_ttl
+    )
+
+    jwt_keys = providers.Singleton(
+        JWTKeySet,
+        algorithm=settings.ALGORITHM,
+        secret_key=settings.SECRET_KEY,
+        private_keys=settings.jwt_private_keys
     )
+
+    token_revocation_store = providers.Singleton(
+        TokenRevocationStore,
+        repository=providers.Factory(RevokedTokenRepository, db=db),
+        capacity=settings.token_revocation_capacity,
+        error_rate=settings.token_revocation_error_rate,
+        refresh_interval=settings.token_revocation_refresh_interval
+    )
+
+    login_attempt_log = providers.Selector(
+        settings.login_throttle_backend,
+        memory=providers.Singleton(
+            MemoryAttemptLog,
+            max_keys=settings.login_throttle_max_keys,
+            max_per_key=providers.Callable(
+                max,
+                settings.login_throttle_max_attempts_per_email,
+                settings.login_throttle_max_attempts_per_ip
+            )
+        ),
+        postgres=providers.Singleton(
+            DatabaseAttemptLog,
+            repository=providers.Factory(LoginAttemptRepository, db=db),
+            window=settings.login_throttle_window
+        )
+    )
+
+    login_throttle = providers.Singleton(
+        LoginThrottle,
+        attempt_log=login_attempt_log,
+        window=settings.login_throttle_window,
+        max_attempts_per_email=settings.login_throttle_max_attempts_per_email,
+        max_attempts_per_ip=settings.login_throttle_max_attempts_per_ip
+    )
+
+    module_registry = providers.Singleton(
+        ModuleRegistry,
+        enabled=settings.modules_enabled,
+        preload=settings.modules_preload
+    )
+
     #Repositories
     users = providers.Container(
         UserContainer,
         settings=settings,
-        db=db
+        db=db,
+        unit_of_work=unit_of_work,
+        password_hasher=password_hasher,
+        user_cache=user_cache
     )
 
     auth = providers.Container(
         AuthContainer,
         settings=settings,
-        user_repository=users.user_repository
+        db=db,
+        user_repository=users.user_repository,
+        user_service=users.user_service,
+        unit_of_work=unit_of_work,
+        password_hasher=password_hasher,
+        token_cache=token_cache,
+        token_revocation_store=token_revocation_store,
+        login_throttle=login_throttle,
+        jwt_keys=jwt_keys
+    )
+
+    batch = providers.Container(
+        BatchContainer,
+        unit_of_work=unit_of_work,
+        create_user_handler=users.create_user_handler,
+        update_user_handler=users.update_user_handler,
+        deactivate_user_handler=users.deactivate_user_handler,
+        delete_user_handler=users.delete_user_handler,
+        get_user_by_id_handler=users.get_user_by_id_handler,
+        get_users_handler=users.get_users_handler
     )
 
 
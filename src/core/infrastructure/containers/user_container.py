@@ -5,6 +5,8 @@ from src.core.application.services.user_service import UserService
 from src.core.application.handlers.user.create_user_handler import CreateUserHandler
 from src.core.application.handlers.user.get_user_by_id_handler import GetUserByIdHandler
 from src.core.application.handlers.user.get_users_handler import GetUsersHandler
+from src.core.application.handlers.user.export_users_handler import ExportUsersHandler
+from src.core.application.handlers.user.import_users_handler import ImportUsersHandler
 from src.core.application.handlers.user.deactivate_user_handler import DeactivateUserHandler
 from src.core.application.handlers.user.update_user_handler import UpdateUserHandler
 from src.core.application.handlers.user.delete_user_handler import DeleteUserHandler
@@ -14,17 +16,22 @@ from src.core.application.handlers.user.change_password_handler import ChangePas
 class UserContainer(containers.DeclarativeContainer):
     settings = providers.Dependency()
     db = providers.Dependency()
+    unit_of_work = providers.Dependency()
+    password_hasher = providers.Dependency()
+    user_cache = providers.Dependency()
 
 
-    user_repository = providers.Factory(
+    user_repository = providers.Singleton(
         UserRepository, 
         db=db
         )
 
     # Services
-    user_service = providers.Factory(
+    user_service = providers.Singleton(
         UserService, 
-        user_repository=user_repository
+        user_repository=user_repository,
+        password_hasher=password_hasher,
+        user_cache=user_cache
         
         )
     
@@ -35,37 +42,53 @@ class UserContainer(containers.DeclarativeContainer):
 
 
     # Handlers
-    create_user_handler = providers.Factory(
+    create_user_handler = providers.Singleton(
         CreateUserHandler,
-        user_service=user_service
+        user_service=user_service,
+        unit_of_work=unit_of_work
     )
 
-    get_user_by_id_handler = providers.Factory(
+    get_user_by_id_handler = providers.Singleton(
         GetUserByIdHandler,
         user_service=user_service
     )
 
-    get_users_handler = providers.Factory(
+    get_users_handler = providers.Singleton(
         GetUsersHandler,
         user_service=user_service
     )
 
-    deactivate_user_handler = providers.Factory(
-        DeactivateUserHandler,
+    export_users_handler = providers.Singleton(
+        ExportUsersHandler,
         user_service=user_service
     )
 
-    update_user_handler = providers.Factory(
+    import_users_handler = providers.Singleton(
+        ImportUsersHandler,
+        user_service=user_service,
+        unit_of_work=unit_of_work
+    )
+
+    deactivate_user_handler = providers.Singleton(
+        DeactivateUserHandler,
+        user_service=user_service,
+        unit_of_work=unit_of_work
+    )
+
+    update_user_handler = providers.Singleton(
         UpdateUserHandler,
-        user_service=user_service
+        user_service=user_service,
+        unit_of_work=unit_of_work
     )
 
-    delete_user_handler = providers.Factory(
+    delete_user_handler = providers.Singleton(
         DeleteUserHandler,
-        user_service=user_service
+        user_service=user_service,
+        unit_of_work=unit_of_work
     )
 
-    change_password_handler = providers.Factory(
+    change_password_handler = providers.Singleton(
         ChangePasswordHandler,
-        user_service=user_service
+        user_service=user_service,
+        unit_of_work=unit_of_work
     )
\ No newline at end of file
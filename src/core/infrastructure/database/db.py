@@ -1,36 +1,104 @@
 import logging
 import asyncio
+import itertools
 from contextlib import asynccontextmanager
 from typing import AsyncIterator
 
 from sqlmodel import SQLModel
 from sqlmodel.ext.asyncio.session import AsyncSession
-from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+from sqlalchemy.ext.asyncio import AsyncEngine, async_sessionmaker, create_async_engine
 from sqlalchemy.exc import OperationalError
 
+from src.core.infrastructure.database.pool import InstrumentedAsyncQueuePool, PoolStats, DatabasePoolStats
+
 
 logger = logging.getLogger(__name__)
 
 class Database:
     """A class that manages the database connection"""
 
-    def __init__(self, db_url: str, retry_attempts: int = 5, retry_delay: float = 2.0):
+    def __init__(self,
+                 db_url: str,
+                 retry_attempts: int = 5,
+                 retry_delay: float = 2.0,
+                 pool_size: int = 10,
+                 max_overflow: int = 20,
+                 pool_timeout: float = 30.0,
+                 pool_recycle: int = 1800,
+                 pool_pre_ping: bool = True,
+                 statement_cache_size: int = 100,
+                 prepared_statement_cache_size: int = 100,
+                 replica_urls: list[str] | None = None):
         """Initializes the database
 
         Args:
             db_url (str): URL of the database
             retry_attempts (int, optional): Number of connection retries in case of error. Defaults to 5.
             retry_delay (float, optional): Time between retries (in seconds). Defaults to 2.0.
+            pool_size (int, optional): Number of connections kept open in the pool. Defaults to 10.
+            max_overflow (int, optional): Connections allowed above pool_size during spikes. Defaults to 20.
+            pool_timeout (float, optional): Seconds to wait for a free connection. Defaults to 30.0.
+            pool_recycle (int, optional): Seconds after which a connection is replaced. Defaults to 1800.
+            pool_pre_ping (bool, optional): Test connections on checkout. Defaults to True.
+            statement_cache_size (int, optional): asyncpg statement cache size, 0 for pgbouncer. Defaults to 100.
+            prepared_statement_cache_size (int, optional): SQLAlchemy asyncpg prepared statement cache size. Defaults to 100.
+            replica_urls (list[str], optional): URLs of read replicas used by the query side. Defaults to None.
         """
 
-        self.db_url = db_url.replace("postgresql://", "postgresql+asyncpg://")
+        self.db_url = self._normalize_url(db_url)
         self.retry_attempts = retry_attempts
         self.retry_delay = retry_delay
+        self.engine_options = {
+            "pool_size": pool_size,
+            "max_overflow": max_overflow,
+            "pool_timeout": pool_timeout,
+            "pool_recycle": pool_recycle,
+            "pool_pre_ping": pool_pre_ping,
+            "statement_cache_size": statement_cache_size,
+            "prepared_statement_cache_size": prepared_statement_cache_size,
+        }
 
-
-        self.engine = create_async_engine(self.db_url, echo=False, future=True)
+        self.engine = self._create_engine(self.db_url)
         self.session_factory = async_sessionmaker(self.engine, expire_on_commit=False, class_=AsyncSession)
 
+        self.replica_engines = [self._create_engine(self._normalize_url(url)) for url in replica_urls or []]
+        self.replica_session_factories = [
+            async_sessionmaker(engine, expire_on_commit=False, class_=AsyncSession)
+            for engine in self.replica_engines
+        ]
+        self._replica_cycle = itertools.cycle(self.replica_session_factories)
+
+    @staticmethod
+    def _normalize_url(db_url: str) -> str:
+        return db_url.replace("postgresql://", "postgresql+asyncpg://")
+
+    def _create_engine(self, db_url: str) -> AsyncEngine:
+        """Creates an engine with the instrumented pool and the configured pool options."""
+        options = self.engine_options
+        connect_args = {}
+        if db_url.startswith("postgresql+asyncpg://"):
+            connect_args = {
+                "statement_cache_size": options["statement_cache_size"],
+                "prepared_statement_cache_size": options["prepared_statement_cache_size"],
+            }
+
+        return create_async_engine(
+            db_url,
+            echo=False,
+            future=True,
+            poolclass=InstrumentedAsyncQueuePool,
+            pool_size=options["pool_size"],
+            max_overflow=options["max_overflow"],
+            pool_timeout=options["pool_timeout"],
+            pool_recycle=options["pool_recycle"],
+            pool_pre_ping=options["pool_pre_ping"],
+            connect_args=connect_args,
+        )
+
+    @property
+    def has_replicas(self) -> bool:
+        return bool(self.replica_session_factories)
+
     async def init_db(self) -> None:
         """It initializes the database and creates tables if there are none."""
         attempt = 0
@@ -63,13 +131,41 @@ class Database:
                 raise e
             finally:
                 await session.close()
+
+    @asynccontextmanager
+    async def read_session(self) -> AsyncIterator[AsyncSession]:
+        """Contextual session on the next read replica, round-robin.
+
+        Falls back to the primary when no replicas are configured.
+
+        :yield: Asynchronous SQLAlchemy session.
+        """
+        if not self.has_replicas:
+            async with self.session() as session:
+                yield session
+            return
+
+        async with next(self._replica_cycle)() as session:
+            try:
+                yield session
+            finally:
+                await session.close()
     
 
+    def pool_stats(self) -> DatabasePoolStats:
+        """Returns current pool usage and acquisition metrics of the primary and the replicas."""
+        return DatabasePoolStats(
+            primary=self.engine.pool.stats(),
+            replicas=[engine.pool.stats() for engine in self.replica_engines],
+        )
+
+
     async def shutdown(self) -> None:
-        """Close database connection with timeout safety"""
-        try:
-            await asyncio.wait_for(self.engine.dispose(), timeout=5.0)
-            logger.info("✅ Database connection closed gracefully")
-        except asyncio.TimeoutError:
-            logger.warning("⚠️ Database disposal timed out - forcing shutdown")
-            self.engine.sync_engine.dispose()
\ No newline at end of file
+        """Close database connections with timeout safety"""
+        for engine in [self.engine, *self.replica_engines]:
+            try:
+                await asyncio.wait_for(engine.dispose(), timeout=5.0)
+                logger.info("✅ Database connection closed gracefully")
+            except asyncio.TimeoutError:
+                logger.warning("⚠️ Database disposal timed out - forcing shutdown")
+                engine.sync_engine.dispose()
\ No newline at end of file
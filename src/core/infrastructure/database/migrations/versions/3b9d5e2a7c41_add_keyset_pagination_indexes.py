@@ -0,0 +1,53 @@
+"""add keyset pagination indexes
+
+Revision ID: 3b9d5e2a7c41
+Revises: 8c630e319a72
+Create Date: 2025-05-10 18:12:40.512803
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '3b9d5e2a7c41'
+down_revision: Union[str, None] = '8c630e319a72'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # Row comparisons used by keyset pagination do not work with NULLs
+    op.execute('UPDATE "user" SET created_at = now() WHERE created_at IS NULL')
+    op.execute('UPDATE "user" SET updated_at = created_at WHERE updated_at IS NULL')
+    op.alter_column('user', 'created_at',
+               existing_type=sa.DateTime(timezone=True),
+               nullable=False)
+    op.alter_column('user', 'updated_at',
+               existing_type=sa.DateTime(timezone=True),
+               nullable=False)
+    op.create_index('ix_user_created_at_id', 'user', ['created_at', 'id'], unique=False)
+    op.create_index('ix_user_updated_at_id', 'user', ['updated_at', 'id'], unique=False)
+    op.create_index('ix_user_is_active_id', 'user', ['is_active', 'id'], unique=False)
+    op.create_index('ix_user_is_superuser_id', 'user', ['is_superuser', 'id'], unique=False)
+    op.create_index('ix_user_email_id', 'user', ['email', 'id'], unique=False)
+    op.create_index('ix_user_username_id', 'user', ['username', 'id'], unique=False)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_user_username_id', table_name='user')
+    op.drop_index('ix_user_email_id', table_name='user')
+    op.drop_index('ix_user_is_superuser_id', table_name='user')
+    op.drop_index('ix_user_is_active_id', table_name='user')
+    op.drop_index('ix_user_updated_at_id', table_name='user')
+    op.drop_index('ix_user_created_at_id', table_name='user')
+    op.alter_column('user', 'updated_at',
+               existing_type=sa.DateTime(timezone=True),
+               nullable=True)
+    op.alter_column('user', 'created_at',
+               existing_type=sa.DateTime(timezone=True),
+               nullable=True)
@@ -0,0 +1,38 @@
+"""create login attempt table
+
+Revision ID: a91c47e0d2b8
+Revises: 5d3f8b1c6a24
+Create Date: 2025-05-27 18:41:09.264310
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+import sqlmodel
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'a91c47e0d2b8'
+down_revision: Union[str, None] = '5d3f8b1c6a24'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table('login_attempt',
+    sa.Column('id', sa.Integer(), nullable=False),
+    sa.Column('key', sqlmodel.sql.sqltypes.AutoString(), nullable=False),
+    sa.Column('attempted_at', sa.DateTime(timezone=True), nullable=False),
+    sa.PrimaryKeyConstraint('id')
+    )
+    op.create_index('ix_login_attempt_key_attempted_at', 'login_attempt', ['key', 'attempted_at'], unique=False)
+    op.create_index(op.f('ix_login_attempt_attempted_at'), 'login_attempt', ['attempted_at'], unique=False)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index(op.f('ix_login_attempt_attempted_at'), table_name='login_attempt')
+    op.drop_index('ix_login_attempt_key_attempted_at', table_name='login_attempt')
+    op.drop_table('login_attempt')
@@ -0,0 +1,28 @@
+"""add user version column
+
+Revision ID: c4e1a9f27b63
+Revises: 3b9d5e2a7c41
+Create Date: 2025-05-17 11:04:26.318954
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'c4e1a9f27b63'
+down_revision: Union[str, None] = '3b9d5e2a7c41'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.add_column('user', sa.Column('version', sa.Integer(), server_default='1', nullable=False))
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_column('user', 'version')
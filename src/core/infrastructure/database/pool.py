@@ -0,0 +1,80 @@
+import time
+
+from pydantic import BaseModel
+from sqlalchemy.exc import TimeoutError as PoolTimeoutError
+from sqlalchemy.pool import AsyncAdaptedQueuePool, PoolProxiedConnection
+
+
+class PoolStats(BaseModel):
+    """Snapshot of the connection pool used to size it from real traffic."""
+    size: int
+    max_overflow: int
+    checked_out: int
+    idle: int
+    overflow: int
+    acquisitions: int
+    timeouts: int
+    avg_wait_ms: float
+    max_wait_ms: float
+
+
+class DatabasePoolStats(BaseModel):
+    """Pool snapshots of the primary and every read replica."""
+    primary: PoolStats
+    replicas: list[PoolStats] = []
+
+
+class PoolMetrics:
+    """Counters collected while connections are acquired from the pool."""
+
+    def __init__(self):
+        self.acquisitions = 0
+        self.timeouts = 0
+        self.total_wait = 0.0
+        self.max_wait = 0.0
+
+    def record_acquire(self, wait: float) -> None:
+        self.acquisitions += 1
+        self.total_wait += wait
+        self.max_wait = max(self.max_wait, wait)
+
+    def record_timeout(self) -> None:
+        self.timeouts += 1
+
+
+class InstrumentedAsyncQueuePool(AsyncAdaptedQueuePool):
+    """AsyncAdaptedQueuePool measuring how long callers wait for a connection."""
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.metrics = PoolMetrics()
+
+    def recreate(self) -> "InstrumentedAsyncQueuePool":
+        pool = super().recreate()
+        pool.metrics = self.metrics
+        return pool
+
+    def connect(self) -> PoolProxiedConnection:
+        started = time.perf_counter()
+        try:
+            connection = super().connect()
+        except PoolTimeoutError:
+            self.metrics.record_timeout()
+            raise
+        self.metrics.record_acquire(time.perf_counter() - started)
+        return connection
+
+    def stats(self) -> PoolStats:
+        metrics = self.metrics
+        avg_wait = metrics.total_wait / metrics.acquisitions if metrics.acquisitions else 0.0
+        return PoolStats(
+            size=self.size(),
+            max_overflow=self._max_overflow,
+            checked_out=self.checkedout(),
+            idle=self.checkedin(),
+            overflow=max(self.overflow(), 0),
+            acquisitions=metrics.acquisitions,
+            timeouts=metrics.timeouts,
+            avg_wait_ms=round(avg_wait * 1000, 3),
+            max_wait_ms=round(metrics.max_wait * 1000, 3),
+        )
@@ -0,0 +1,117 @@
+from contextlib import asynccontextmanager
+from contextvars import ContextVar
+from typing import AsyncIterator, Callable
+
+from sqlmodel.ext.asyncio.session import AsyncSession
+
+from src.core.infrastructure.database.db import Database
+
+
+class ActiveUnit:
+    """Session bound to the current context and whether reads must stay on the primary."""
+
+    def __init__(self, session: AsyncSession, pinned_to_primary: bool = True):
+        self.session = session
+        self.pinned_to_primary = pinned_to_primary
+        self.after_commit: list[Callable[[], None]] = []
+
+    def committed(self) -> None:
+        """Runs the callbacks registered for after the commit."""
+        callbacks, self.after_commit = self.after_commit, []
+        for callback in callbacks:
+            callback()
+
+
+_current_unit: ContextVar[ActiveUnit | None] = ContextVar("current_unit", default=None)
+
+
+def get_current_unit() -> ActiveUnit | None:
+    """Returns the unit of work active in this context, if any."""
+    return _current_unit.get()
+
+
+def get_current_session() -> AsyncSession | None:
+    """Returns the session bound to the active unit of work, if any."""
+    unit = _current_unit.get()
+    return unit.session if unit is not None else None
+
+
+def call_after_commit(callback: Callable[[], None]) -> None:
+    """Runs the callback once the active unit of work commits, or at once without one.
+
+    Used to drop in-process caches only when the change is visible to other sessions.
+    A rolled back unit of work discards its callbacks.
+    """
+    unit = _current_unit.get()
+    if unit is None:
+        callback()
+    else:
+        unit.after_commit.append(callback)
+
+
+@asynccontextmanager
+async def bind_session(session: AsyncSession, pinned_to_primary: bool = True) -> AsyncIterator[ActiveUnit]:
+    """Binds the session to the current context so nested repository calls reuse it."""
+    token = _current_unit.set(ActiveUnit(session, pinned_to_primary=pinned_to_primary))
+    try:
+        yield _current_unit.get()
+    finally:
+        _current_unit.reset(token)
+
+
+class UnitOfWork:
+    """Shares one session and one transaction between all repositories used inside it.
+
+    The session is bound to the current context, so the unit of work itself is stateless
+    and may be shared between requests. Nested units of work join the outermost one,
+    which is the only one allowed to commit or rollback.
+    """
+
+    def __init__(self, db: Database):
+        """Initializes the unit of work
+
+        Args:
+            db (Database): Database providing the session factory.
+        """
+        self.db = db
+
+    @asynccontextmanager
+    async def begin(self, pin_primary: bool = True, requires_new: bool = False) -> AsyncIterator[AsyncSession]:
+        """Opens a transaction or joins the one already active in this context.
+
+        Args:
+            pin_primary (bool, optional): Route every following read in this unit to the
+                primary, so a command reads its own writes. Query-side scopes such as
+                the request unit pass False to keep reads on the replicas. Defaults to True.
+            requires_new (bool, optional): Always open a separate transaction, committed
+                even if the surrounding one rolls back afterwards. Defaults to False.
+
+        :yield: Asynchronous SQLAlchemy session shared by the repositories.
+        """
+        unit = get_current_unit()
+        if unit is not None and not requires_new:
+            if pin_primary:
+                unit.pinned_to_primary = True
+            yield unit.session
+            return
+
+        async with self.db.session() as session:
+            async with bind_session(session, pinned_to_primary=pin_primary) as unit:
+                yield session
+            await session.commit()
+            unit.committed()
+
+    @asynccontextmanager
+    async def savepoint(self) -> AsyncIterator[AsyncSession]:
+        """Runs the block in a savepoint of the transaction active in this context.
+
+        An exception raised in the block rolls back only the changes made inside it
+        and leaves the surrounding transaction usable, the exception is propagated.
+        Callbacks registered for after the commit are kept, they only drop caches.
+        Opens a unit of work pinned to the primary when none is active.
+
+        :yield: Asynchronous SQLAlchemy session shared by the repositories.
+        """
+        async with self.begin() as session:
+            async with session.begin_nested():
+                yield session
@@ -0,0 +1,165 @@
+import asyncio
+import importlib
+import importlib.util
+import inspect
+import logging
+import pkgutil
+import time
+from importlib.metadata import entry_points
+from pathlib import Path
+from typing import Any, NamedTuple, Sequence
+
+from dependency_injector import containers, providers
+from fastapi import FastAPI
+from fastapi.params import Depends
+from pydantic import BaseModel
+from starlette.types import Receive, Scope, Send
+
+
+logger = logging.getLogger(__name__)
+
+MODULES_PACKAGE = "src.modules"
+ENTRY_POINT_GROUP = "automation_hub.modules"
+# every module exposes `router` here and optionally a `container` class
+ROUTER_MODULE = "api.v1.router"
+
+
+class ModuleSpec(NamedTuple):
+    """Module found at startup, nothing of it is imported yet."""
+    name: str
+    package: str
+    source: str
+
+
+class ModuleStats(BaseModel):
+    """State of a discovered module."""
+    name: str
+    package: str
+    source: str
+    loaded: bool
+    load_ms: float | None = None
+
+
+def discover_modules(package: str = MODULES_PACKAGE, group: str = ENTRY_POINT_GROUP) -> dict[str, ModuleSpec]:
+    """Finds the modules of the hub without importing them.
+
+    Subpackages of src.modules providing api/v1/router.py are found in the package
+    layout, modules installed as separate distributions through the entry point
+    group, whose value is the module package. The package layout wins on a name clash.
+    """
+    modules = {}
+    root = importlib.util.find_spec(package)
+    for location in root.submodule_search_locations if root else []:
+        for info in pkgutil.iter_modules([location]):
+            router_file = Path(location, info.name, *ROUTER_MODULE.split(".")).with_suffix(".py")
+            if info.ispkg and router_file.is_file():
+                modules[info.name] = ModuleSpec(info.name, f"{package}.{info.name}", "package")
+
+    for entry_point in entry_points(group=group):
+        modules.setdefault(entry_point.name, ModuleSpec(entry_point.name, entry_point.value, "entry_point"))
+    return modules
+
+
+class LazyModuleApp:
+    """ASGI app of one module, imported and wired on the first request it receives.
+
+    The module router is served by its own FastAPI app mounted under the module
+    prefix, with its OpenAPI docs at <prefix>/docs. A module container declaring
+    a `hub` DependenciesContainer gets the hub container to reach the database,
+    the unit of work and the other shared singletons.
+    """
+
+    def __init__(self, spec: ModuleSpec, hub_container: containers.Container, dependencies: Sequence[Depends] = ()):
+        self.spec = spec
+        self.hub_container = hub_container
+        self.dependencies = list(dependencies)
+        self.container: containers.Container | None = None
+        self.load_ms: float | None = None
+        self._app: FastAPI | None = None
+        self._lock = asyncio.Lock()
+
+    @property
+    def loaded(self) -> bool:
+        return self._app is not None
+
+    async def load(self) -> FastAPI:
+        if self._app is None:
+            async with self._lock:
+                if self._app is None:
+                    self._app = self._build()
+        return self._app
+
+    def _build(self) -> FastAPI:
+        started = time.perf_counter()
+        router_module = importlib.import_module(f"{self.spec.package}.{ROUTER_MODULE}")
+
+        container_class = getattr(router_module, "container", None)
+        if container_class is not None:
+            kwargs = {}
+            if "hub" in container_class.providers:
+                hub_providers = {name: provider for name, provider in self.hub_container.providers.items() if not name.startswith("__")}
+                kwargs["hub"] = providers.DependenciesContainer(**hub_providers)
+            self.container = container_class(**kwargs)
+            self.container.wire()
+
+        app = FastAPI(title=f"{self.spec.name} module", dependencies=self.dependencies)
+        app.include_router(router_module.router)
+
+        self.load_ms = round((time.perf_counter() - started) * 1000, 3)
+        logger.info(f"✅ Module {self.spec.name} loaded in {self.load_ms} ms")
+        return app
+
+    async def shutdown(self) -> None:
+        if self.container is None:
+            return
+        shutdown_resources = self.container.shutdown_resources()
+        if inspect.isawaitable(shutdown_resources):
+            await shutdown_resources
+        self.container.unwire()
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        app = await self.load()
+        await app(scope, receive, send)
+
+    def stats(self) -> ModuleStats:
+        return ModuleStats(**self.spec._asdict(), loaded=self.loaded, load_ms=self.load_ms)
+
+
+class ModuleRegistry:
+    """Mounts every discovered module under /v1/<name> without importing it.
+
+    Startup only lists the module packages, so it costs the same whatever the
+    number of modules. Each module pays its import on its first request, or at
+    startup for all of them when preload is enabled.
+    """
+
+    def __init__(self, enabled: list[str] | None = None, preload: bool = False):
+        """Initializes the registry
+
+        Args:
+            enabled (list[str], optional): Names of the modules to mount, all discovered when None. Defaults to None.
+            preload (bool, optional): Load every module at startup instead of on first use. Defaults to False.
+        """
+        self.enabled = enabled
+        self.preload = preload
+        self.modules: dict[str, LazyModuleApp] = {}
+
+    def mount(self, app: FastAPI, hub_container: Any, prefix: str = "/v1", dependencies: Sequence[Depends] = ()) -> None:
+        for name, spec in discover_modules().items():
+            if self.enabled is not None and name not in self.enabled:
+                continue
+            module = LazyModuleApp(spec, hub_container, dependencies)
+            self.modules[name] = module
+            app.mount(f"{prefix}/{name}", module, name=f"module:{name}")
+
+    async def startup(self) -> None:
+        if self.preload:
+            for module in self.modules.values():
+                await module.load()
+
+    async def shutdown(self) -> None:
+        for module in self.modules.values():
+            await module.shutdown()
+
+    def stats(self) -> list[ModuleStats]:
+        return [module.stats() for module in self.modules.values()]
@@ -1,10 +1,14 @@
 from typing import Any, Callable, Sequence, Optional, AsyncIterable, TypeVar, ParamSpec
 from sqlmodel.ext.asyncio.session import AsyncSession
 from sqlmodel import select
+from sqlalchemy import ColumnElement, delete, literal_column, update
+from sqlalchemy.dialects.postgresql import insert
 from sqlalchemy.exc import IntegrityError
 from pydantic import BaseModel, Field
 from functools import wraps
 from src.core.infrastructure.database.db import Database
+from src.core.infrastructure.database.unit_of_work import get_current_unit, bind_session
+from src.core.infrastructure.repositories.pagination import exact_count, total_count_column
 from typing import Protocol
 
 class RepositoryFilters(BaseModel):
@@ -24,26 +28,88 @@ class GenericRepository[RecordType, RecordIdType, FilterType](Protocol):
         ...
     async def fetch(self, record_id: RecordIdType) -> RecordType | None:
         ...
+    async def fetch_by_id_from_primary(self, record_id: RecordIdType) -> RecordType | None:
+        ...
     async def fetch_many(self, filters: FilterType | None = None) -> tuple[int, AsyncIterable[RecordType]]:
         ...
     async def update(self, record: RecordType) -> None:
         ...
+    async def update_fields(self, record_id: RecordIdType, values: dict[str, Any], expected_version: int | None = None) -> RecordType | None:
+        ...
     async def update_or_create(self, record: RecordType) -> bool:
         ...
+    async def upsert_many(self, records: Sequence[RecordType | BaseModel]) -> Sequence[RecordIdType]:
+        ...
+    async def delete(self, record_id: RecordIdType) -> bool:
+        ...
+    async def delete_many(self, record_ids: Sequence[RecordIdType] | None = None, filters: FilterType | None = None) -> Sequence[RecordIdType]:
+        ...
 
 P = ParamSpec("P")
 R = TypeVar("R")
 
+async def _call_with_session(func: Callable[P, R], self: Any, session: AsyncSession, *args: P.args, **kwargs: P.kwargs) -> R:
+    if 'session' in func.__annotations__:
+        return await func(self, session, *args, **kwargs)
+    return await func(self, *args, **kwargs)
+
 #TODO move with_session function to the utils
 def with_session(func: Callable[P, R]) -> Callable[P, R]:
+    """Runs the repository method in the session of the active unit of work.
+
+    Outside of a unit of work a short-lived session is opened and committed
+    once the method returns, so repository methods only flush their changes.
+    Writing pins the unit to the primary so later reads see the changes.
+    """
     @wraps(func)
     async def wrapper(self: Any, *args: P.args, **kwargs: P.kwargs) -> R:
         if not hasattr(self, 'db'):
             raise AttributeError("Repository must have 'db' attribute")
+        unit = get_current_unit()
+        if unit is not None:
+            unit.pinned_to_primary = True
+            return await _call_with_session(func, self, unit.session, *args, **kwargs)
         async with self.db.session() as session:
-            if 'session' in func.__annotations__:
-                return await func(self, session, *args, **kwargs)
-            return await func(self, *args, **kwargs)
+            async with bind_session(session) as unit:
+                result = await _call_with_session(func, self, session, *args, **kwargs)
+            await session.commit()
+            unit.committed()
+            return result
+    return wrapper
+
+def with_read_session(func: Callable[P, R]) -> Callable[P, R]:
+    """Runs a query-side repository method on a read replica.
+
+    Reads stay in the active unit of work when it is pinned to the primary
+    (a command already ran in this context) or when there are no replicas.
+    """
+    @wraps(func)
+    async def wrapper(self: Any, *args: P.args, **kwargs: P.kwargs) -> R:
+        if not hasattr(self, 'db'):
+            raise AttributeError("Repository must have 'db' attribute")
+        unit = get_current_unit()
+        if unit is not None and (unit.pinned_to_primary or not self.db.has_replicas):
+            return await _call_with_session(func, self, unit.session, *args, **kwargs)
+        async with self.db.read_session() as session:
+            return await _call_with_session(func, self, session, *args, **kwargs)
+    return wrapper
+
+def with_primary_read_session(func: Callable[P, R]) -> Callable[P, R]:
+    """Runs a read which must see the latest state of the primary, without pinning the unit.
+
+    The session of the active unit of work is on the primary, so it is reused as is;
+    unlike with_session the following reads of the unit keep going to the replicas.
+    Outside of a unit of work a short-lived session on the primary is opened.
+    """
+    @wraps(func)
+    async def wrapper(self: Any, *args: P.args, **kwargs: P.kwargs) -> R:
+        if not hasattr(self, 'db'):
+            raise AttributeError("Repository must have 'db' attribute")
+        unit = get_current_unit()
+        if unit is not None:
+            return await _call_with_session(func, self, unit.session, *args, **kwargs)
+        async with self.db.session() as session:
+            return await _call_with_session(func, self, session, *args, **kwargs)
     return wrapper
 
 class BaseRepository[RecordType, RecordIdType, FilterType](GenericRepository[RecordType, RecordIdType, FilterType]):
@@ -61,11 +127,9 @@ class BaseRepository[RecordType, RecordIdType, FilterType](GenericRepository[Rec
             if isinstance(record, BaseModel):
                 record = self.model(**record.model_dump())
             session.add(record)
-            await session.commit()
-            await session.refresh(record)
+            await session.flush()
             return record.id
         except IntegrityError as e:
-            await session.rollback()
             raise self._map_integrity_error(e) from e
     
     @with_session
@@ -74,31 +138,40 @@ class BaseRepository[RecordType, RecordIdType, FilterType](GenericRepository[Rec
         try:
             records = [self.model(**record.model_dump()) if isinstance(record, BaseModel) else record for record in records]
             session.add_all(records)
-            await session.commit()
+            await session.flush()
             return [record.id for record in records]
         except IntegrityError as e:
-            await session.rollback()
             raise self._map_integrity_error(e) from e
     
-    @with_session
+    @with_read_session
     async def fetch_by_id(self, session: AsyncSession, record_id: RecordIdType) -> RecordType | None:
         """Retrieves the record by ID."""
         return await session.get(self.model, record_id)
+
+    @with_primary_read_session
+    async def fetch_by_id_from_primary(self, session: AsyncSession, record_id: RecordIdType) -> RecordType | None:
+        """Retrieves the record by ID from the primary, for reads a lagging replica must not answer."""
+        return await session.get(self.model, record_id)
     
-    @with_session
+    @with_read_session
     async def fetch_many(self, session: AsyncSession, filters: FilterType | None = None) -> tuple[int, Sequence[RecordType]]:
-        """Retrieves multiple records with filtering capabilities."""
-        query = select(self.model)
-        if filters:
-            for field, value in filters.model_dump(exclude_none=True).items():
-                if hasattr(self.model, field):
-                    query = query.where(getattr(self.model, field) == value)
-            if hasattr(filters, "page") and hasattr(filters, "size"):
-                span_start, span_end = filters.get_page_span_indexes()
-                query = query.offset(span_start).limit(filters.size)
+        """Retrieves multiple records with filtering capabilities.
+
+        Returns the total number of matching records, counted by a window function
+        in the same query, together with the requested page.
+        """
+        conditions = self._filter_conditions_from(filters)
+        span_start = 0
+        query = select(self.model, total_count_column(self.model, conditions, keyset=False)).where(*conditions)
+        if filters and hasattr(filters, "page") and hasattr(filters, "size"):
+            span_start, span_end = filters.get_page_span_indexes()
+            query = query.offset(span_start).limit(filters.size)
         result = await session.exec(query)
-        items = result.scalars().all()
-        return len(items), items
+        rows = result.all()
+        if not rows:
+            total = await exact_count(session, self.model, conditions) if span_start else 0
+            return total, []
+        return rows[0][1], [row[0] for row in rows]
     
     @with_session
     async def update(self, session: AsyncSession, record: RecordType) -> None:
@@ -106,20 +179,127 @@ class BaseRepository[RecordType, RecordIdType, FilterType](GenericRepository[Rec
         from datetime import datetime, timezone
         if hasattr(record, "updated_at"):
             record.updated_at = datetime.now(timezone.utc)
+        if hasattr(record, "version"):
+            record.version += 1
         session.add(record)
-        await session.commit()
+        await session.flush()
+
+    @with_session
+    async def update_fields(
+        self,
+        session: AsyncSession,
+        record_id: RecordIdType,
+        values: dict[str, Any],
+        expected_version: int | None = None,
+        match: dict[str, Any] | None = None
+    ) -> RecordType | None:
+        """Updates only the given columns with a single UPDATE ... RETURNING.
+
+        The record does not have to be loaded first. On models with a version
+        column the version is bumped, and expected_version makes the update
+        conditional, so a concurrent change is detected instead of overwritten.
+
+        Args:
+            session (AsyncSession): The async database session.
+            record_id (RecordIdType): ID of the record to update.
+            values (dict[str, Any]): New values of the changed columns.
+            expected_version (int, optional): Version the changes are based on.
+            match (dict[str, Any], optional): Values the record must still have to be updated.
+
+        Returns:
+            The updated record, or None if no record matched the ID, version and match.
+        """
+        from datetime import datetime, timezone
+        values = dict(values)
+        conditions = [self.model.id == record_id]
+        conditions.extend(getattr(self.model, field) == value for field, value in (match or {}).items())
+        if hasattr(self.model, "updated_at"):
+            values["updated_at"] = datetime.now(timezone.utc)
+        if hasattr(self.model, "version"):
+            values["version"] = self.model.version + 1
+            if expected_version is not None:
+                conditions.append(self.model.version == expected_version)
+        try:
+            result = await session.exec(
+                update(self.model).where(*conditions).values(**values).returning(self.model),
+                execution_options={"populate_existing": True}
+            )
+            return result.scalars().first()
+        except IntegrityError as e:
+            raise self._map_integrity_error(e) from e
     
     @with_session
     async def update_or_create(self, session: AsyncSession, record: RecordType) -> bool:
-        """Updates the record if it exists, otherwise creates a new one."""
-        existing_record = await self.fetch(session, record.id)
-        if existing_record:
-            session.add(record)
-            await session.commit()
-            return True
-        else:
-            await self.create(session, record)
-            return False
+        """Updates the record if it exists, otherwise creates a new one.
+
+        Runs a single INSERT ... ON CONFLICT DO UPDATE, so the record is written
+        in one round-trip whether or not it already exists.
+
+        Returns:
+            True if an existing record was updated, False if a new one was created.
+        """
+        try:
+            statement = self._upsert_statement([self._upsert_values(record)])
+            # xmax is only set on a row version written by the conflicting UPDATE;
+            # populate_existing refreshes the object if the session already holds it
+            result = await session.exec(
+                statement.returning(self.model, literal_column("xmax") != 0),
+                execution_options={"populate_existing": True}
+            )
+            return result.one()[1]
+        except IntegrityError as e:
+            raise self._map_integrity_error(e) from e
+
+    @with_session
+    async def upsert_many(
+        self,
+        session: AsyncSession,
+        records: Sequence[RecordType | BaseModel],
+        batch_size: int = 1000
+    ) -> Sequence[RecordIdType]:
+        """Inserts or updates multiple records with one statement per batch.
+
+        Args:
+            session (AsyncSession): The async database session.
+            records (Sequence[RecordType | BaseModel]): Records to write, matched by primary key.
+            batch_size (int, optional): Rows written by a single statement. Defaults to 1000.
+
+        Returns:
+            IDs of all written records.
+        """
+        record_ids = []
+        try:
+            for start in range(0, len(records), batch_size):
+                values = [self._upsert_values(record) for record in records[start:start + batch_size]]
+                result = await session.exec(
+                    self._upsert_statement(values).returning(self.model),
+                    execution_options={"populate_existing": True}
+                )
+                record_ids.extend(record.id for record in result.scalars().all())
+        except IntegrityError as e:
+            raise self._map_integrity_error(e) from e
+        return record_ids
+
+    def _upsert_values(self, record: RecordType | BaseModel) -> dict[str, Any]:
+        if not isinstance(record, self.model):
+            record = self.model(**record.model_dump())
+        from datetime import datetime, timezone
+        if hasattr(record, "updated_at"):
+            record.updated_at = datetime.now(timezone.utc)
+        return {column.name: getattr(record, column.name) for column in self.model.__table__.columns}
+
+    def _upsert_statement(self, values: list[dict[str, Any]]):
+        table = self.model.__table__
+        primary_key = [column.name for column in table.primary_key.columns]
+        statement = insert(self.model).values(values)
+        updated = {
+            column.name: statement.excluded[column.name]
+            for column in table.columns
+            if column.name not in primary_key and column.name != "created_at"
+        }
+        if "version" in table.columns:
+            updated["version"] = table.columns.version + 1
+        return statement.on_conflict_do_update(index_elements=primary_key, set_=updated)
     
     def _map_integrity_error(self, error: IntegrityError) -> Exception:
         """Map IntegrityError to a domain-specific exception. Subclasses should override."""
@@ -127,22 +307,57 @@ class BaseRepository[RecordType, RecordIdType, FilterType](GenericRepository[Rec
     
     @with_session
     async def delete(self, session: AsyncSession, record_id: RecordIdType) -> bool:
-        """Deletes a record from the database by record_id."""
+        """Deletes a record from the database by record_id.
+
+        Returns:
+            True if the record existed and was deleted.
+        """
         try:
-            record = await session.get(self.model, record_id)
-            
-            if not record:
-                return False
-            
-            await session.delete(record)
-            await session.commit()
-            
-            deleted_record = await session.get(self.model, record_id)
-            if deleted_record:
-                return False
-            
-            return True
-        except Exception as e:
-            await session.rollback()
-            print(f"Error occurred during deletion: {str(e)}")
-            return False
\ No newline at end of file
+            result = await session.exec(
+                delete(self.model).where(self.model.id == record_id).returning(self.model.id)
+            )
+            return result.first() is not None
+        except IntegrityError as e:
+            raise self._map_integrity_error(e) from e
+
+    @with_session
+    async def delete_many(
+        self,
+        session: AsyncSession,
+        record_ids: Sequence[RecordIdType] | None = None,
+        filters: FilterType | None = None
+    ) -> Sequence[RecordIdType]:
+        """Deletes the records with the given IDs and/or matching the filters in one statement.
+
+        Args:
+            session (AsyncSession): The async database session.
+            record_ids (Sequence[RecordIdType], optional): IDs of the records to delete.
+            filters (FilterType, optional): Equality filters on the model fields.
+
+        Returns:
+            IDs of the deleted records.
+
+        Raises:
+            ValueError: If neither IDs nor any filter on a model field is given,
+                which would delete the whole table.
+        """
+        conditions = self._filter_conditions_from(filters)
+        if record_ids is not None:
+            if not record_ids:
+                return []
+            conditions.append(self.model.id.in_(record_ids))
+        if not conditions:
+            raise ValueError("delete_many requires record_ids or filters on model fields")
+        try:
+            result = await session.exec(delete(self.model).where(*conditions).returning(self.model.id))
+            return result.scalars().all()
+        except IntegrityError as e:
+            raise self._map_integrity_error(e) from e
+
+    def _filter_conditions_from(self, filters: FilterType | None) -> list[ColumnElement]:
+        conditions = []
+        if filters:
+            for field, value in filters.model_dump(exclude_none=True).items():
+                if hasattr(self.model, field):
+                    conditions.append(getattr(self.model, field) == value)
+        return conditions
@@ -0,0 +1,61 @@
+from datetime import timedelta
+from typing import Sequence
+
+from sqlalchemy import delete, func, insert
+from sqlmodel import select
+from sqlmodel.ext.asyncio.session import AsyncSession
+
+from src.core.domain.models.auth import LoginAttempt
+from src.core.infrastructure.database.db import Database
+from src.core.infrastructure.repositories.common_repository import (
+    BaseRepository,
+    RepositoryFilters,
+    with_session,
+)
+
+
+class LoginAttemptFilters(RepositoryFilters):
+    key: str | None = None
+
+
+class LoginAttemptRepository(BaseRepository[LoginAttempt, int, LoginAttemptFilters]):
+    def __init__(self, db: Database):
+        super().__init__(LoginAttempt, db)
+
+    @with_session
+    async def record(self, session: AsyncSession, keys: Sequence[str]) -> None:
+        """Records one attempt for every key, timestamped by the database clock."""
+        await session.exec(insert(LoginAttempt).values([{"key": key, "attempted_at": func.now()} for key in keys]))
+
+    @with_session
+    async def count_in_window(self, session: AsyncSession, keys: Sequence[str], window: float) -> dict[str, tuple[int, float]]:
+        """Counts the attempts of every key within the last window seconds.
+
+        Served by the (key, attempted_at) index and always read on the primary,
+        a lagging replica would let a burst through.
+
+        Returns:
+            Number of attempts and age in seconds of the oldest one, keyed by the key.
+        """
+        result = await session.exec(
+            select(
+                LoginAttempt.key,
+                func.count(),
+                func.extract("epoch", func.now() - func.min(LoginAttempt.attempted_at)),
+            )
+            .where(LoginAttempt.key.in_(keys), LoginAttempt.attempted_at > func.now() - timedelta(seconds=window))
+            .group_by(LoginAttempt.key)
+        )
+        return {key: (count, float(age)) for key, count, age in result.all()}
+
+    @with_session
+    async def prune(self, session: AsyncSession, window: float) -> int:
+        """Deletes the attempts which left the window.
+
+        Returns:
+            Number of deleted attempts.
+        """
+        result = await session.exec(
+            delete(LoginAttempt).where(LoginAttempt.attempted_at <= func.now() - timedelta(seconds=window))
+        )
+        return result.rowcount
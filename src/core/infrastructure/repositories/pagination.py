@@ -0,0 +1,174 @@
+import base64
+import hashlib
+import json
+from datetime import datetime
+from typing import Any, Mapping, NamedTuple, Sequence
+from uuid import UUID
+
+from sqlalchemy import DateTime, Uuid, asc, desc, func, literal_column, select, tuple_
+from sqlalchemy.ext.compiler import compiles
+from sqlalchemy.sql import ClauseElement, ColumnElement, Executable, Select
+from sqlmodel.ext.asyncio.session import AsyncSession
+
+from src.core.domain.exceptions.pagination import InvalidCursorError
+
+
+class Page(NamedTuple):
+    """One page of records with the cursor to the next page and the total count."""
+    items: Sequence[Any]
+    next_cursor: str | None = None
+    total: int | None = None
+    # changes whenever a record of the page, the next cursor or the total changes
+    fingerprint: str | None = None
+
+
+def encode_cursor(sort_by: str, sort_order: str, value: Any, record_id: Any) -> str:
+    """Encodes the position after the last returned row as an opaque cursor."""
+    if isinstance(value, (datetime, UUID)):
+        value = value.isoformat() if isinstance(value, datetime) else str(value)
+    payload = {"s": sort_by, "o": sort_order, "v": value, "id": str(record_id)}
+    raw = json.dumps(payload, separators=(",", ":")).encode()
+    return base64.urlsafe_b64encode(raw).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str, sort_by: str, sort_order: str) -> tuple[Any, str]:
+    """Decodes the cursor and checks it was issued for the same sort.
+
+    Raises:
+        InvalidCursorError: If the cursor is malformed or belongs to another sort.
+    """
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        payload = json.loads(base64.urlsafe_b64decode(padded))
+        position = payload["s"], payload["o"], payload["v"], payload["id"]
+    except (ValueError, TypeError, KeyError) as e:
+        raise InvalidCursorError("Malformed pagination cursor") from e
+
+    cursor_sort_by, cursor_sort_order, value, record_id = position
+    if cursor_sort_by != sort_by or cursor_sort_order != sort_order:
+        raise InvalidCursorError("Cursor was issued for a different sort_by or sort_order")
+    return value, record_id
+
+
+def _coerce(column: Any, value: Any) -> Any:
+    """Restores the python type of a value read back from the cursor."""
+    if value is None:
+        return None
+    try:
+        if isinstance(column.type, DateTime):
+            return datetime.fromisoformat(value)
+        if isinstance(column.type, Uuid):
+            return UUID(value)
+    except ValueError as e:
+        raise InvalidCursorError("Malformed pagination cursor") from e
+    return value
+
+
+def apply_keyset(
+    stmt: Select,
+    model: type,
+    sort_by: str,
+    sort_order: str,
+    cursor: str | None,
+    limit: int,
+) -> Select:
+    """Orders the statement by (sort column, id) and seeks past the cursor.
+
+    One extra row is requested so the caller can tell whether a next page exists.
+    """
+    id_column = model.id
+    sort_column = getattr(model, sort_by)
+    descending = sort_order != "asc"
+    direction = desc if descending else asc
+
+    if cursor is not None:
+        value, record_id = decode_cursor(cursor, sort_by, sort_order)
+        record_id = _coerce(id_column, record_id)
+        if sort_column is id_column:
+            stmt = stmt.where(id_column < record_id if descending else id_column > record_id)
+        else:
+            position = tuple_(sort_column, id_column)
+            after = tuple_(_coerce(sort_column, value), record_id)
+            stmt = stmt.where(position < after if descending else position > after)
+
+    if sort_column is id_column:
+        stmt = stmt.order_by(direction(id_column))
+    else:
+        stmt = stmt.order_by(direction(sort_column), direction(id_column))
+    return stmt.limit(limit + 1)
+
+
+def next_page_cursor(records: Sequence[Any], sort_by: str, sort_order: str, limit: int) -> tuple[Sequence[Any], str | None]:
+    """Trims the look-ahead row and returns the page with the cursor to the next one."""
+    if len(records) <= limit:
+        return records, None
+    page = records[:limit]
+    last = page[-1]
+    if isinstance(last, Mapping):
+        return page, encode_cursor(sort_by, sort_order, last[sort_by], last["id"])
+    return page, encode_cursor(sort_by, sort_order, getattr(last, sort_by), last.id)
+
+
+def page_fingerprint(records: Sequence[Any], total: int | None = None) -> str:
+    """Digest of the ids and versions of the records, the look-ahead row included, and the total.
+
+    Every update bumps the version of a record and its id is part of its sort key,
+    so the digest changes with the content of the page and with its next cursor.
+    """
+    digest = hashlib.blake2b(digest_size=16)
+    for record in records:
+        if isinstance(record, Mapping):
+            record_id, version = record["id"], record["version"]
+        else:
+            record_id, version = record.id, record.version
+        digest.update(f"{record_id}:{version},".encode())
+    digest.update(f"total:{total}".encode())
+    return digest.hexdigest()
+
+
+class Explain(Executable, ClauseElement):
+    """EXPLAIN (FORMAT JSON) of a statement, keeping its bound parameters."""
+    inherit_cache = False
+
+    def __init__(self, statement: Select):
+        self.statement = statement
+
+
+@compiles(Explain, "postgresql")
+def _compile_explain(element: Explain, compiler: Any, **kw: Any) -> str:
+    return "EXPLAIN (FORMAT JSON) " + compiler.process(element.statement, **kw)
+
+
+def total_count_column(model: type, conditions: Sequence[ColumnElement], keyset: bool) -> ColumnElement:
+    """Exact total of the filtered rows, computed by the page query itself.
+
+    A window function counts the rows before OFFSET/LIMIT are applied, but it would
+    only see the rows after the cursor, so keyset pages use a scalar subquery instead.
+    """
+    if not keyset:
+        return func.count().over().label("total")
+    count = select(func.count()).select_from(model).where(*conditions).correlate(None)
+    return count.scalar_subquery().label("total")
+
+
+async def exact_count(session: AsyncSession, model: type, conditions: Sequence[ColumnElement]) -> int:
+    """Counts the filtered rows with a separate COUNT(*) query."""
+    result = await session.exec(select(func.count()).select_from(model).where(*conditions))
+    return result.scalar_one()
+
+
+async def estimate_count(session: AsyncSession, model: type, conditions: Sequence[ColumnElement]) -> int:
+    """Estimates the number of filtered rows from the planner statistics.
+
+    Costs a single EXPLAIN instead of a scan, at the price of being only as accurate
+    as the last ANALYZE. Backends without a planner estimate fall back to an exact count.
+    """
+    if session.bind.dialect.name != "postgresql":
+        return await exact_count(session, model, conditions)
+
+    explain = Explain(select(literal_column("1")).select_from(model).where(*conditions))
+    result = await session.exec(explain)
+    plan = result.scalar_one()
+    if isinstance(plan, str):
+        plan = json.loads(plan)
+    return int(plan[0]["Plan"]["Plan Rows"])
@@ -0,0 +1,73 @@
+from datetime import datetime, timezone
+from uuid import UUID
+
+from sqlalchemy import func, update
+from sqlmodel import select
+from sqlmodel.ext.asyncio.session import AsyncSession
+
+from src.core.domain.models.auth import RefreshToken
+from src.core.infrastructure.database.db import Database
+from src.core.infrastructure.repositories.common_repository import (
+    BaseRepository,
+    RepositoryFilters,
+    with_read_session,
+    with_session,
+)
+
+
+class RefreshTokenFilters(RepositoryFilters):
+    user_id: UUID | None = None
+    family_id: UUID | None = None
+
+
+class RefreshTokenRepository(BaseRepository[RefreshToken, UUID, RefreshTokenFilters]):
+    def __init__(self, db: Database):
+        super().__init__(RefreshToken, db)
+
+    @with_session
+    async def consume(self, session: AsyncSession, token_hash: str) -> RefreshToken | None:
+        """Marks the token as used if it is still valid, in one indexed UPDATE ... RETURNING.
+
+        Concurrent refreshes with the same token cannot both succeed, only the
+        first UPDATE matches the unused row.
+
+        Args:
+            session: The async database session.
+            token_hash: SHA-256 digest of the presented token.
+
+        Returns:
+            The consumed token, or None if it is unknown, used, revoked or expired.
+        """
+        result = await session.exec(
+            update(RefreshToken)
+            .where(
+                RefreshToken.token_hash == token_hash,
+                RefreshToken.used_at.is_(None),
+                RefreshToken.revoked_at.is_(None),
+                RefreshToken.expires_at > func.now(),
+            )
+            .values(used_at=datetime.now(timezone.utc))
+            .returning(RefreshToken),
+            execution_options={"populate_existing": True}
+        )
+        return result.scalars().first()
+
+    @with_read_session
+    async def fetch_by_hash(self, session: AsyncSession, token_hash: str) -> RefreshToken | None:
+        result = await session.exec(select(RefreshToken).where(RefreshToken.token_hash == token_hash))
+        return result.first()
+
+    @with_session
+    async def revoke_family(self, session: AsyncSession, family_id: UUID) -> int:
+        """Revokes every token of the family still active.
+
+        Returns:
+            Number of revoked tokens.
+        """
+        result = await session.exec(
+            update(RefreshToken)
+            .where(RefreshToken.family_id == family_id, RefreshToken.revoked_at.is_(None))
+            .values(revoked_at=datetime.now(timezone.utc))
+            .returning(RefreshToken.id)
+        )
+        return len(result.scalars().all())
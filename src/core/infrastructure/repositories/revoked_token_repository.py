@@ -0,0 +1,58 @@
+from datetime import datetime
+
+from sqlalchemy import delete, func
+from sqlalchemy.dialects.postgresql import insert
+from sqlmodel import select
+from sqlmodel.ext.asyncio.session import AsyncSession
+
+from src.core.domain.models.auth import RevokedToken
+from src.core.infrastructure.database.db import Database
+from src.core.infrastructure.repositories.common_repository import (
+    BaseRepository,
+    RepositoryFilters,
+    with_primary_read_session,
+    with_session,
+)
+
+
+class RevokedTokenFilters(RepositoryFilters):
+    pass
+
+
+class RevokedTokenRepository(BaseRepository[RevokedToken, str, RevokedTokenFilters]):
+    def __init__(self, db: Database):
+        super().__init__(RevokedToken, db)
+
+    @with_session
+    async def revoke(self, session: AsyncSession, jti: str, expires_at: datetime) -> None:
+        """Adds the token to the denylist, revoking it twice is a no-op."""
+        await session.exec(
+            insert(RevokedToken)
+            .values(jti=jti, expires_at=expires_at, revoked_at=func.now())
+            .on_conflict_do_nothing(index_elements=[RevokedToken.jti])
+        )
+
+    @with_primary_read_session
+    async def is_revoked(self, session: AsyncSession, jti: str) -> bool:
+        """Checks the denylist on the primary, a lagging replica could let a revoked token through."""
+        result = await session.exec(
+            select(RevokedToken.jti).where(RevokedToken.jti == jti, RevokedToken.expires_at > func.now())
+        )
+        return result.first() is not None
+
+    @with_primary_read_session
+    async def fetch_active_jtis(self, session: AsyncSession) -> list[str]:
+        result = await session.exec(select(RevokedToken.jti).where(RevokedToken.expires_at > func.now()))
+        return list(result.all())
+
+    @with_session
+    async def prune_expired(self, session: AsyncSession) -> int:
+        """Deletes the entries of tokens which have expired anyway.
+
+        Returns:
+            Number of deleted entries.
+        """
+        result = await session.exec(
+            delete(RevokedToken).where(RevokedToken.expires_at <= func.now()).returning(RevokedToken.jti)
+        )
+        return len(result.scalars().all())
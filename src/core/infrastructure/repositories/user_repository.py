@@ -1,14 +1,29 @@
 
 from sqlmodel.ext.asyncio.session import AsyncSession
-from sqlmodel import select, asc, desc
+from sqlmodel import select
+from sqlalchemy import ColumnElement, RowMapping, or_, text
+from sqlalchemy import Select, select as sa_select
+from sqlalchemy.dialects.postgresql import insert
 from sqlalchemy.exc import IntegrityError
+from pydantic import BaseModel
 from src.core.infrastructure.repositories.common_repository import BaseRepository, RepositoryFilters
-from src.core.domain.exceptions.user import UserAlreadyExistsError
+from src.core.domain.exceptions.user import UserAlreadyExistsError, EmailAlreadyTakenError, UsernameAlreadyTakenError
 from src.core.domain.models.user import User
 from src.core.infrastructure.database.db import Database
 from src.core.application.queries.user.get_users_query import GetUsersQueryRequest
+from src.core.application.queries.user.export_users_query import ExportUsersQueryRequest
+from typing import Any, AsyncIterator, Callable, Sequence
 from uuid import UUID
-from src.core.infrastructure.repositories.common_repository import with_session
+from src.core.infrastructure.repositories.common_repository import with_read_session, with_session
+from src.core.infrastructure.repositories.pagination import (
+    Page,
+    apply_keyset,
+    estimate_count,
+    exact_count,
+    next_page_cursor,
+    page_fingerprint,
+    total_count_column,
+)
 
 class UserFilters(RepositoryFilters):
     username: str | None = None
@@ -16,10 +31,55 @@ class UserFilters(RepositoryFilters):
 
 
 class UserRepository(BaseRepository[User, UUID, UserFilters]):
+    # names PostgreSQL gave the unique constraints of the user table
+    _CONSTRAINT_ERRORS = {
+        "ix_user_username": UsernameAlreadyTakenError,
+        "user_email_key": EmailAlreadyTakenError,
+    }
+
     def __init__(self, db: Database):
         super().__init__(User, db)
-    
+
     @with_session
+    async def create(self, session: AsyncSession, record: User | BaseModel) -> UUID:
+        """Creates a new user with a single INSERT ... ON CONFLICT DO NOTHING RETURNING.
+
+        Uniqueness is enforced by the constraints rather than by checking first,
+        so there is no race between the check and the insert. A second query is
+        only run when the insert was skipped, to tell which value is taken.
+        The transaction stays usable after a conflict.
+
+        Args:
+            session: The async database session.
+            record: The user, or data of the user to create.
+
+        Returns:
+            The ID of the created user.
+
+        Raises:
+            UsernameAlreadyTakenError: If the username is already in use.
+            EmailAlreadyTakenError: If the email is already in use.
+        """
+        if not isinstance(record, User):
+            record = User(**record.model_dump())
+        values = {column.name: getattr(record, column.name) for column in User.__table__.columns}
+        result = await session.exec(
+            insert(User).values(**values).on_conflict_do_nothing().returning(User.id)
+        )
+        user_id = result.scalar_one_or_none()
+        if user_id is not None:
+            return user_id
+
+        result = await session.exec(
+            select(User.username == record.username)
+            .where(or_(User.username == record.username, User.email == record.email))
+            .limit(1)
+        )
+        if result.first():
+            raise UsernameAlreadyTakenError(f"User with this username {record.username} already exists")
+        raise EmailAlreadyTakenError(f"User with email {record.email} already exists")
+    
+    @with_read_session
     async def fetch_by_email(self, session: AsyncSession, email: str) -> User | None:
         """Retrieves a user by their email.
 
@@ -35,42 +95,256 @@ class UserRepository(BaseRepository[User, UUID, UserFilters]):
         return result.first()
     
 
-    @with_session
+    @with_read_session
     async def fetch_by_username(self, session: AsyncSession, username: str) -> User | None:
         statement = select(User).where(User.username == username)
         result = await session.exec(statement)
         return result.first()
+
+    @with_read_session
+    async def fetch_fields_by_id(self, session: AsyncSession, record_id: UUID, fields: Sequence[str]) -> dict[str, Any] | None:
+        """Retrieves only the given columns of a user, without building the ORM instance.
+
+        Args:
+            session: The async database session.
+            record_id: The ID of the user to fetch.
+            fields: Names of the User columns to select.
+
+        Returns:
+            The selected columns keyed by field name if found, else None.
+        """
+        statement = sa_select(*[getattr(User, field) for field in fields]).where(User.id == record_id)
+        result = await session.exec(statement)
+        row = result.mappings().first()
+        return dict(row) if row is not None else None
     
-    @with_session
+    @with_read_session
     async def fetch_all_filtered(
         self,
         session: AsyncSession,
-        query: GetUsersQueryRequest
-    ) -> list[User]:
-        stmt = select(User)
+        query: GetUsersQueryRequest,
+        fields: Sequence[str] | None = None
+    ) -> Page:
+        """Retrieves one page of users, the cursor to the next page and the total.
 
-        if query.search:
-            stmt = stmt.where(User.email.ilike(f"%{query.search}%"))
-        
-        if query.is_active is not None:
-            stmt = stmt.where(User.is_active == query.is_active)
-        
-        if query.is_superuser is not None:
-            stmt =stmt.where(User.is_superuser == query.is_superuser)
+        Rows are ordered by the sort column plus id. With a cursor the query seeks
+        past the last seen row instead of skipping, so deep pages stay cheap.
+        The total is counted according to query.count: in the page query itself
+        (exact), from planner statistics (estimated) or not at all (none).
+        With fields only those columns are selected and the users are returned as
+        dicts, skipping the identity map and the ORM instances.
+
+        Args:
+            session: The async database session.
+            query: Filters, sorting, pagination and count strategy of the listing.
+            fields: Names of the User columns to select, whole User records when None.
+
+        Returns:
+            Page with the users, the next cursor (None on the last page), the total
+            and the fingerprint of the page.
+        """
+        sort_by = query.sort_by or "id"
+        if fields is None:
+            entities = [User]
+        else:
+            # the cursor and the fingerprint are built from these columns of the rows
+            names = list(dict.fromkeys([*fields, sort_by, "id", "version"]))
+            entities = [getattr(User, name) for name in names]
+        # sqlalchemy's select keeps rows even for a single column, sqlmodel's would return scalars
+        stmt = self._page_statement(select if fields is None else sa_select, entities, query)
+
+        result = await session.exec(stmt)
+        rows = result.all() if fields is None else result.mappings().all()
+
+        total = await self._page_total(session, query, rows)
+        if query.count == "exact" and fields is None:
+            rows = [row[0] for row in rows]
+
+        fingerprint = page_fingerprint(rows, total)
+        users, next_cursor = next_page_cursor(rows, sort_by, query.sort_order, query.limit)
+        if fields is not None:
+            users = [{name: row[name] for name in fields} for row in users]
+        return Page(items=list(users), next_cursor=next_cursor, total=total, fingerprint=fingerprint)
 
-        if query.sort_by and hasattr(User, query.sort_by):
-            column = getattr(User, query.sort_by)
-            stmt = stmt.order_by(asc(column) if query.sort_order == "asc" else desc(column))
-        
-        stmt = stmt.offset(query.skip).limit(query.limit)
+    @with_read_session
+    async def fetch_page_fingerprint(self, session: AsyncSession, query: GetUsersQueryRequest) -> str:
+        """Fingerprint of the page fetch_all_filtered would return for the query.
 
+        Runs the same page query selecting only the id and version of the rows, so
+        an unchanged page is recognized without transferring or building the users.
+
+        Args:
+            session: The async database session.
+            query: Filters, sorting, pagination and count strategy of the listing.
+
+        Returns:
+            The fingerprint of the page, equal to Page.fingerprint.
+        """
+        stmt = self._page_statement(sa_select, [User.id, User.version], query)
         result = await session.exec(stmt)
-        users = result.all()
-        return users
-                                 
+        rows = result.mappings().all()
+        return page_fingerprint(rows, await self._page_total(session, query, rows))
+
+    async def _page_total(self, session: AsyncSession, query: GetUsersQueryRequest, rows: Sequence[Any]) -> int | None:
+        """Total of the listing according to query.count, taken from the rows of the page query.
+
+        With count="exact" the rows carry the total in their last column. An empty page
+        past the first one carries none, so the matching users are counted separately.
+        """
+        if query.count == "estimated":
+            return await estimate_count(session, User, self._filter_conditions(query))
+        if query.count != "exact":
+            return None
+        if rows:
+            row = rows[0]
+            return row["total"] if isinstance(row, RowMapping) else row[-1]
+        if query.cursor is not None or query.skip:
+            return await exact_count(session, User, self._filter_conditions(query))
+        return 0
+
+    def _page_statement(self, select_function: Callable[..., Select], entities: list[Any], query: GetUsersQueryRequest) -> Select:
+        """Page query of the listing selecting entities, with the look-ahead row and the exact total."""
+        conditions = self._filter_conditions(query)
+        keyset = query.cursor is not None
+        if query.count == "exact":
+            entities = [*entities, total_count_column(User, conditions, keyset=keyset)]
+        stmt = select_function(*entities).where(*conditions)
+        stmt = apply_keyset(stmt, User, query.sort_by or "id", query.sort_order, query.cursor, query.limit)
+        if not keyset and query.skip:
+            stmt = stmt.offset(query.skip)
+        return stmt
+
+    async def stream_all_filtered(
+        self,
+        query: GetUsersQueryRequest | ExportUsersQueryRequest,
+        fields: Sequence[str],
+        batch_size: int = 1000
+    ) -> AsyncIterator[Sequence[RowMapping]]:
+        """Streams the matching users in batches through a server-side cursor.
+
+        Only the requested columns are selected and no ORM objects are built, so
+        memory stays bounded by batch_size whatever the size of the table. The
+        stream owns its read session because it usually outlives the request scope.
+
+        Args:
+            query: Filters of the listing.
+            fields: Names of the User columns to select.
+            batch_size: Number of rows fetched from the cursor at once.
+
+        Yields:
+            Batches of row mappings keyed by field name.
+        """
+        columns = [getattr(User, field) for field in fields]
+        stmt = (
+            select(*columns)
+            .where(*self._filter_conditions(query))
+            .order_by(User.id)
+            .execution_options(yield_per=batch_size)
+        )
+        async with self.db.read_session() as session:
+            result = await session.stream(stmt)
+            async for batch in result.mappings().partitions():
+                yield batch
+
+    _IMPORT_COLUMNS = ("id", "username", "email", "hashed_password", "created_at", "updated_at", "is_active", "is_superuser")
+    # conflict reason by (the username is taken, the taking user was inserted by this import)
+    _IMPORT_CONFLICTS = {
+        (True, False): "Username is already in use",
+        (False, False): "Email is already in use",
+        (True, True): "Username appears more than once in the upload",
+        (False, True): "Email appears more than once in the upload",
+    }
+
+    @with_session
+    async def bulk_import(self, session: AsyncSession, records: Sequence[tuple[int, User]]) -> dict[int, str]:
+        """Loads users through COPY into a staging table and merges them into the user table.
+
+        Rows are copied into a temporary table dropped on commit, then inserted in row
+        order with ON CONFLICT DO NOTHING, so existing users and duplicates within the
+        upload are skipped instead of aborting the whole batch. The ids of the inserted
+        users are kept until the commit, so a row clashing with a user inserted earlier
+        in the same import, in this batch or a previous one, is reported as a duplicate
+        of the upload rather than as a value already in use.
+
+        Args:
+            session: The async database session.
+            records: Row numbers of the upload with the users to insert.
+
+        Returns:
+            Conflict reason for every row number that was not inserted.
+        """
+        if not records:
+            return {}
+
+        columns = ", ".join(self._IMPORT_COLUMNS)
+        # executed through the session first, so the staging tables live in its transaction
+        await session.exec(text(
+            'CREATE TEMP TABLE IF NOT EXISTS user_import (row_no integer, LIKE "user" INCLUDING DEFAULTS) ON COMMIT DROP'
+        ))
+        await session.exec(text(
+            "CREATE TEMP TABLE IF NOT EXISTS user_import_created (id uuid PRIMARY KEY) ON COMMIT DROP"
+        ))
+        await session.exec(text("TRUNCATE user_import"))
+
+        connection = await session.connection()
+        raw_connection = await connection.get_raw_connection()
+        await raw_connection.driver_connection.copy_records_to_table(
+            "user_import",
+            records=[
+                (row_no, *(getattr(user, column) for column in self._IMPORT_COLUMNS))
+                for row_no, user in records
+            ],
+            columns=["row_no", *self._IMPORT_COLUMNS],
+        )
+
+        await session.exec(text(
+            f"""
+            WITH inserted AS (
+                INSERT INTO "user" ({columns}) SELECT {columns} FROM user_import ORDER BY row_no
+                ON CONFLICT DO NOTHING
+                RETURNING id
+            )
+            INSERT INTO user_import_created SELECT id FROM inserted
+            """
+        ))
+        # the user holding the username, else the email, of every skipped row
+        result = await session.exec(text(
+            """
+            SELECT staged.row_no,
+                   taken.username = staged.username AS username_taken,
+                   taken.id IN (SELECT id FROM user_import_created) AS duplicate
+            FROM user_import staged
+            LEFT JOIN LATERAL (
+                SELECT u.id, u.username FROM "user" u
+                WHERE u.username = staged.username OR u.email = staged.email
+                ORDER BY u.username = staged.username DESC
+                LIMIT 1
+            ) taken ON true
+            WHERE staged.id NOT IN (SELECT id FROM user_import_created)
+            """
+        ))
+        return {
+            row_no: self._IMPORT_CONFLICTS.get((username_taken, duplicate), "User already exists")
+            for row_no, username_taken, duplicate in result.all()
+        }
+
+    def _filter_conditions(self, query: GetUsersQueryRequest | ExportUsersQueryRequest) -> list[ColumnElement]:
+        conditions = []
+        if query.search:
+            conditions.append(User.email.ilike(f"%{query.search}%"))
+
+        if query.is_active is not None:
+            conditions.append(User.is_active == query.is_active)
+
+        if query.is_superuser is not None:
+            conditions.append(User.is_superuser == query.is_superuser)
+        return conditions
     
     def _map_integrity_error(self, error: IntegrityError) -> Exception:
-        """Map IntegrityError to UserAlreadyExistsError for unique constraint violations."""
-        if "unique constraint" in str(error).lower():
+        """Map unique violations to the error of the violated constraint."""
+        constraint_name = getattr(error.orig.__cause__, "constraint_name", None)
+        if constraint_name in self._CONSTRAINT_ERRORS:
+            return self._CONSTRAINT_ERRORS[constraint_name]()
+        if getattr(error.orig, "sqlstate", None) == "23505":
             return UserAlreadyExistsError("User with this email or username already exists")
         return error
@@ -0,0 +1,96 @@
+import base64
+import hashlib
+import json
+import os
+from typing import Any
+
+from jose import JWTError, jwk, jwt
+from jose.backends.base import Key
+
+
+ASYMMETRIC_ALGORITHMS = ("RS256", "RS384", "RS512", "ES256", "ES384", "ES512")
+
+
+def _thumbprint(public_jwk: dict[str, Any]) -> str:
+    """RFC 7638 thumbprint of the public key, used as its kid."""
+    required = {name: public_jwk[name] for name in ("crv", "e", "kty", "n", "x", "y") if name in public_jwk}
+    canonical = json.dumps(required, separators=(",", ":"), sort_keys=True).encode()
+    return base64.urlsafe_b64encode(hashlib.sha256(canonical).digest()).decode().rstrip("=")
+
+
+def _read_pem(value: str) -> str:
+    """Returns the PEM itself or the contents of the file it points to."""
+    if value.lstrip().startswith("-----BEGIN"):
+        return value
+    with open(os.path.expanduser(value)) as file:
+        return file.read()
+
+
+class JWTKeySet:
+    """Keys signing and verifying the access tokens.
+
+    With an asymmetric algorithm the first private key signs new tokens and every
+    configured key verifies them, so a key is rotated in three steps: append the new
+    key (published in the JWKS, not yet signing), move it to the front once module
+    workers refreshed their JWKS, drop the old one when its last token expired.
+    Module workers verify tokens locally against the published public keys.
+    With HS256 the shared secret both signs and verifies and nothing is published.
+    """
+
+    def __init__(self, algorithm: str = "HS256", secret_key: str | None = None, private_keys: list[str] | None = None):
+        """Initializes the key set
+
+        Args:
+            algorithm (str, optional): JWS algorithm of the tokens. Defaults to "HS256".
+            secret_key (str, optional): Shared secret of the HMAC algorithms. Defaults to None.
+            private_keys (list[str], optional): PEM private keys or paths to them, the first one signs. Defaults to None.
+
+        Raises:
+            RuntimeError: If an asymmetric algorithm is configured without private keys.
+        """
+        self.algorithm = algorithm
+        self.asymmetric = algorithm in ASYMMETRIC_ALGORITHMS
+        self._verification_keys: dict[str, Key] = {}
+        self._public_jwks: list[dict[str, Any]] = []
+
+        if not self.asymmetric:
+            self._signing_key: Key | str = secret_key
+            self.signing_kid: str | None = None
+            return
+
+        if not private_keys:
+            raise RuntimeError(f"{algorithm} requires at least one private key in jwt_private_keys")
+        for index, value in enumerate(private_keys):
+            private_key = jwk.construct(_read_pem(value), algorithm)
+            public_key = private_key.public_key()
+            public_jwk = public_key.to_dict()
+            kid = _thumbprint(public_jwk)
+            if index == 0:
+                self._signing_key = private_key
+                self.signing_kid = kid
+            self._verification_keys[kid] = public_key
+            self._public_jwks.append({**public_jwk, "kid": kid, "use": "sig", "alg": algorithm})
+
+    def encode(self, claims: dict[str, Any]) -> str:
+        headers = {"kid": self.signing_kid} if self.signing_kid else None
+        return jwt.encode(claims, self._signing_key, algorithm=self.algorithm, headers=headers)
+
+    def decode(self, token: str) -> dict[str, Any]:
+        """Verifies the token with the key named by its kid.
+
+        Raises:
+            JWTError: If the token is malformed, expired, signed by an unknown key or
+                its signature does not match.
+        """
+        if not self.asymmetric:
+            return jwt.decode(token, self._signing_key, algorithms=[self.algorithm])
+
+        kid = jwt.get_unverified_header(token).get("kid")
+        key = self._verification_keys.get(kid)
+        if key is None:
+            raise JWTError("Token signed by an unknown key")
+        return jwt.decode(token, key, algorithms=[self.algorithm])
+
+    def jwks(self) -> dict[str, list[dict[str, Any]]]:
+        """Public keys in the JWK Set format, empty for the HMAC algorithms."""
+        return {"keys": self._public_jwks}
@@ -0,0 +1,232 @@
+import time
+from collections import OrderedDict, deque
+from typing import Protocol, Sequence
+
+from pydantic import BaseModel
+
+from src.core.domain.exceptions.auth import TooManyLoginAttemptsError
+from src.core.infrastructure.repositories.login_attempt_repository import LoginAttemptRepository
+
+
+class LoginThrottleStats(BaseModel):
+    """Snapshot of the login throttle used to tune its limits from real traffic."""
+    backend: str
+    window: float
+    max_attempts_per_email: int
+    max_attempts_per_ip: int
+    tracked_keys: int | None = None
+    in_flight: int
+    checks: int
+    rejected: int
+    rejected_by_email: int
+    rejected_by_ip: int
+    failures_recorded: int
+
+
+class AttemptLog(Protocol):
+    name: str
+
+    async def count(self, keys: Sequence[str], window: float) -> dict[str, tuple[int, float]]:
+        """Number of attempts within the window and age of the oldest one, keyed by the key."""
+        ...
+    async def record(self, keys: Sequence[str]) -> None:
+        ...
+    def tracked_keys(self) -> int | None:
+        ...
+
+
+class MemoryAttemptLog:
+    """Sliding window log of attempt timestamps kept in this process.
+
+    Every key keeps at most max_per_key latest timestamps and the least recently
+    attempted keys are dropped above max_keys, so a flood of distinct emails or
+    addresses cannot exhaust memory. Each worker counts its own attempts only.
+    """
+    name = "memory"
+
+    def __init__(self, max_keys: int = 100000, max_per_key: int = 50):
+        """Initializes the log
+
+        Args:
+            max_keys (int, optional): Maximum number of tracked keys. Defaults to 100000.
+            max_per_key (int, optional): Timestamps kept per key, the highest limit is enough. Defaults to 50.
+        """
+        self.max_keys = max_keys
+        self.max_per_key = max_per_key
+        self._attempts: OrderedDict[str, deque[float]] = OrderedDict()
+
+    async def count(self, keys: Sequence[str], window: float) -> dict[str, tuple[int, float]]:
+        now = time.monotonic()
+        counts = {}
+        for key in keys:
+            attempts = self._attempts.get(key)
+            if attempts is None:
+                continue
+            while attempts and attempts[0] <= now - window:
+                attempts.popleft()
+            if not attempts:
+                del self._attempts[key]
+                continue
+            counts[key] = (len(attempts), now - attempts[0])
+        return counts
+
+    async def record(self, keys: Sequence[str]) -> None:
+        now = time.monotonic()
+        for key in keys:
+            attempts = self._attempts.get(key)
+            if attempts is None:
+                attempts = self._attempts[key] = deque(maxlen=self.max_per_key)
+            else:
+                self._attempts.move_to_end(key)
+            attempts.append(now)
+        while len(self._attempts) > self.max_keys:
+            self._attempts.popitem(last=False)
+
+    def tracked_keys(self) -> int | None:
+        return len(self._attempts)
+
+
+class DatabaseAttemptLog:
+    """Sliding window log shared by all workers through the login_attempt table.
+
+    Costs one indexed query per login and one insert per failure. Attempts which
+    left the window are deleted at most once per window.
+    """
+    name = "postgres"
+
+    def __init__(self, repository: LoginAttemptRepository, window: float = 300.0):
+        """Initializes the log
+
+        Args:
+            repository (LoginAttemptRepository): Repository of the login_attempt table.
+            window (float, optional): Age in seconds after which attempts are pruned. Defaults to 300.0.
+        """
+        self.repository = repository
+        self.window = window
+        self._last_prune = time.monotonic()
+
+    async def count(self, keys: Sequence[str], window: float) -> dict[str, tuple[int, float]]:
+        return await self.repository.count_in_window(keys=keys, window=window)
+
+    async def record(self, keys: Sequence[str]) -> None:
+        await self.repository.record(keys=keys)
+        if time.monotonic() - self._last_prune >= self.window:
+            self._last_prune = time.monotonic()
+            await self.repository.prune(window=self.window)
+
+    def tracked_keys(self) -> int | None:
+        return None
+
+
+class LoginThrottle:
+    """Limits failed logins per email and per client address in a sliding window.
+
+    The check runs before the password is verified, so a credential stuffing burst
+    is rejected without spending any hashing time. Failed attempts are counted, and
+    so are the attempts of this process still being verified: the check reserves a
+    slot until release(), so a concurrent burst is cut at the limit instead of being
+    hashed in full before its first failure is recorded. A user logging in correctly
+    is never throttled by their own finished sessions.
+    """
+
+    def __init__(
+        self,
+        attempt_log: AttemptLog,
+        window: float = 300.0,
+        max_attempts_per_email: int = 5,
+        max_attempts_per_ip: int = 50,
+    ):
+        """Initializes the throttle
+
+        Args:
+            attempt_log (AttemptLog): Where attempts are counted, in process or in Postgres.
+            window (float, optional): Length of the sliding window in seconds. Defaults to 300.0.
+            max_attempts_per_email (int, optional): Failed attempts allowed per email in the window. Defaults to 5.
+            max_attempts_per_ip (int, optional): Failed attempts allowed per client address in the window. Defaults to 50.
+        """
+        self.attempt_log = attempt_log
+        self.window = window
+        self.max_attempts_per_email = max_attempts_per_email
+        self.max_attempts_per_ip = max_attempts_per_ip
+        self.checks = 0
+        self.rejected = 0
+        self.rejected_by_email = 0
+        self.rejected_by_ip = 0
+        self.failures_recorded = 0
+        self._in_flight: dict[str, int] = {}
+
+    def _limits(self, email: str, client_ip: str | None) -> dict[str, int]:
+        limits = {f"email:{email.strip().lower()}": self.max_attempts_per_email}
+        if client_ip:
+            limits[f"ip:{client_ip}"] = self.max_attempts_per_ip
+        return limits
+
+    async def check(self, email: str, client_ip: str | None = None) -> None:
+        """Rejects the attempt if the email or the address is over its limit, else reserves it a slot.
+
+        An accepted attempt must be released once verified, after record_failure when it failed.
+
+        Raises:
+            TooManyLoginAttemptsError: With the seconds until the oldest counted
+                attempt leaves the window.
+        """
+        self.checks += 1
+        limits = self._limits(email, client_ip)
+        # reserved before the first await, so concurrent attempts always see each other
+        pending = {key: self._in_flight.get(key, 0) for key in limits}
+        self._reserve(limits)
+        try:
+            counts = await self.attempt_log.count(list(limits), self.window)
+        except BaseException:
+            self._unreserve(limits)
+            raise
+
+        exceeded = [key for key, limit in limits.items() if counts.get(key, (0, 0.0))[0] + pending[key] >= limit]
+        if not exceeded:
+            return
+
+        self._unreserve(limits)
+        self.rejected += 1
+        for key in exceeded:
+            if key.startswith("email:"):
+                self.rejected_by_email += 1
+            else:
+                self.rejected_by_ip += 1
+        # a limit reached by attempts still in flight only, frees up as soon as they finish
+        retry_after = max(self.window - counts[key][1] if key in counts else 0 for key in exceeded)
+        raise TooManyLoginAttemptsError(retry_after=retry_after)
+
+    def release(self, email: str, client_ip: str | None = None) -> None:
+        """Frees the slot reserved by check once the attempt is verified."""
+        self._unreserve(self._limits(email, client_ip))
+
+    def _reserve(self, keys: Sequence[str]) -> None:
+        for key in keys:
+            self._in_flight[key] = self._in_flight.get(key, 0) + 1
+
+    def _unreserve(self, keys: Sequence[str]) -> None:
+        for key in keys:
+            remaining = self._in_flight.get(key, 0) - 1
+            if remaining > 0:
+                self._in_flight[key] = remaining
+            else:
+                self._in_flight.pop(key, None)
+
+    async def record_failure(self, email: str, client_ip: str | None = None) -> None:
+        self.failures_recorded += 1
+        await self.attempt_log.record(list(self._limits(email, client_ip)))
+
+    def stats(self) -> LoginThrottleStats:
+        return LoginThrottleStats(
+            backend=self.attempt_log.name,
+            window=self.window,
+            max_attempts_per_email=self.max_attempts_per_email,
+            max_attempts_per_ip=self.max_attempts_per_ip,
+            tracked_keys=self.attempt_log.tracked_keys(),
+            in_flight=sum(value for key, value in self._in_flight.items() if key.startswith("email:")),
+            checks=self.checks,
+            rejected=self.rejected,
+            rejected_by_email=self.rejected_by_email,
+            rejected_by_ip=self.rejected_by_ip,
+            failures_recorded=self.failures_recorded,
+        )
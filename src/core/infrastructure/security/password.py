@@ -1,9 +1,196 @@
+import asyncio
+import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Sequence, TypeVar
+
 from passlib.context import CryptContext
+from pydantic import BaseModel
+
+from src.core.domain.exceptions.auth import PasswordHasherBusyError
 
 pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
 
+T = TypeVar("T")
+
+
+def build_crypt_context(
+    schemes: Sequence[str] = ("bcrypt",),
+    bcrypt_rounds: int = 12,
+    argon2_time_cost: int = 3,
+    argon2_memory_cost: int = 65536,
+    argon2_parallelism: int = 4,
+) -> CryptContext:
+    """Builds the passlib context hashing new passwords with the first scheme.
+
+    The other schemes are only kept to verify existing hashes and are reported
+    as outdated by needs_update(), like hashes made with a lower cost than
+    configured, so they get replaced on the next successful login.
+    argon2 requires the argon2-cffi package.
+
+    Args:
+        schemes (Sequence[str], optional): Accepted schemes, preferred one first. Defaults to ("bcrypt",).
+        bcrypt_rounds (int, optional): bcrypt cost factor (log2 of the iterations). Defaults to 12.
+        argon2_time_cost (int, optional): argon2id passes over memory. Defaults to 3.
+        argon2_memory_cost (int, optional): argon2id memory in KiB. Defaults to 65536.
+        argon2_parallelism (int, optional): argon2id lanes. Defaults to 4.
+    """
+    schemes = list(schemes)
+    settings = {}
+    if "bcrypt" in schemes:
+        settings.update(bcrypt__rounds=bcrypt_rounds, bcrypt__min_rounds=bcrypt_rounds)
+    if "argon2" in schemes:
+        from passlib.hash import argon2
+        if not argon2.has_backend():
+            raise RuntimeError("The argon2 password scheme requires the argon2-cffi package")
+        settings.update(
+            argon2__type="ID",
+            argon2__time_cost=argon2_time_cost,
+            argon2__min_rounds=argon2_time_cost,
+            argon2__memory_cost=argon2_memory_cost,
+            argon2__parallelism=argon2_parallelism,
+        )
+    return CryptContext(schemes=schemes, default=schemes[0], deprecated="auto", **settings)
+
 def get_password_hash(password: str) -> str:
     return pwd_context.hash(password)
 
 def verify_password(plain_password: str, hashed_password: str) -> bool:
     return pwd_context.verify(plain_password, hashed_password)
+
+
+class PasswordHasherStats(BaseModel):
+    """Snapshot of the password hashing pool used to size it from real traffic."""
+    workers: int
+    max_pending: int
+    pending: int
+    queued: int
+    running: int
+    completed: int
+    rejected: int
+    avg_queue_wait_ms: float
+    max_queue_wait_ms: float
+    avg_hash_ms: float
+
+
+class PasswordHasher:
+    """Hashes and verifies passwords on a bounded worker pool instead of the event loop.
+
+    bcrypt releases the GIL, so a thread pool scales with the number of workers.
+    At most max_pending jobs may be queued or running. Further callers wait up to
+    acquire_timeout for a free slot and are then rejected, so a login burst is
+    shed instead of piling up behind the pool while every other request waits.
+    """
+
+    def __init__(
+        self,
+        context: CryptContext = pwd_context,
+        max_workers: int | None = None,
+        max_pending: int = 64,
+        acquire_timeout: float = 5.0
+    ):
+        """Initializes the hasher
+
+        Args:
+            context (CryptContext, optional): Schemes and cost used to hash and verify. Defaults to pwd_context.
+            max_workers (int, optional): Hashing threads. Defaults to the number of CPUs.
+            max_pending (int, optional): Jobs allowed to be queued or running at once. Defaults to 64.
+            acquire_timeout (float, optional): Seconds a caller waits for a free slot. Defaults to 5.0.
+        """
+        self.context = context
+        self.max_workers = max_workers or os.cpu_count() or 1
+        self.max_pending = max(max_pending, self.max_workers)
+        self.acquire_timeout = acquire_timeout
+        self._executor = ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix="password-hash")
+        self._slots = asyncio.Semaphore(self.max_pending)
+        self._lock = threading.Lock()
+        self._pending = 0
+        self._running = 0
+        self._completed = 0
+        self._rejected = 0
+        self._total_wait = 0.0
+        self._max_wait = 0.0
+        self._total_run = 0.0
+
+    async def hash(self, password: str) -> str:
+        return await self._submit(self.context.hash, password)
+
+    async def verify(self, plain_password: str, hashed_password: str) -> bool:
+        return await self._submit(self.context.verify, plain_password, hashed_password)
+
+    async def verify_and_update(self, plain_password: str, hashed_password: str) -> tuple[bool, str | None]:
+        """Verifies the password and rehashes it if the hash uses an outdated scheme or cost.
+
+        Returns:
+            Whether the password matches, and the new hash to store or None.
+        """
+        return await self._submit(self.context.verify_and_update, plain_password, hashed_password)
+
+    async def hash_many(self, passwords: Sequence[str]) -> list[str]:
+        """Hashes many passwords, keeping at most one job per worker in flight.
+
+        Bulk jobs never hold more than max_workers slots, so interactive
+        callers are served between their hashes.
+        """
+        hashes: list[str] = []
+        for start in range(0, len(passwords), self.max_workers):
+            chunk = passwords[start:start + self.max_workers]
+            hashes.extend(await asyncio.gather(
+                *(self._submit(self.context.hash, password, timeout=None) for password in chunk)
+            ))
+        return hashes
+
+    async def _submit(self, func: Callable[..., T], *args: str, timeout: float | None = -1) -> T:
+        timeout = self.acquire_timeout if timeout == -1 else timeout
+        try:
+            await asyncio.wait_for(self._slots.acquire(), timeout)
+        except TimeoutError:
+            with self._lock:
+                self._rejected += 1
+            raise PasswordHasherBusyError()
+
+        submitted = time.perf_counter()
+        with self._lock:
+            self._pending += 1
+        try:
+            loop = asyncio.get_running_loop()
+            return await loop.run_in_executor(self._executor, self._run, submitted, func, *args)
+        finally:
+            with self._lock:
+                self._pending -= 1
+            self._slots.release()
+
+    def _run(self, submitted: float, func: Callable[..., T], *args: str) -> T:
+        started = time.perf_counter()
+        with self._lock:
+            self._running += 1
+            wait = started - submitted
+            self._total_wait += wait
+            self._max_wait = max(self._max_wait, wait)
+        try:
+            return func(*args)
+        finally:
+            with self._lock:
+                self._running -= 1
+                self._completed += 1
+                self._total_run += time.perf_counter() - started
+
+    def stats(self) -> PasswordHasherStats:
+        with self._lock:
+            started = self._completed + self._running
+            return PasswordHasherStats(
+                workers=self.max_workers,
+                max_pending=self.max_pending,
+                pending=self._pending,
+                queued=max(self._pending - self._running, 0),
+                running=self._running,
+                completed=self._completed,
+                rejected=self._rejected,
+                avg_queue_wait_ms=round(self._total_wait / started * 1000, 3) if started else 0.0,
+                max_queue_wait_ms=round(self._max_wait * 1000, 3),
+                avg_hash_ms=round(self._total_run / self._completed * 1000, 3) if self._completed else 0.0,
+            )
+
+    def shutdown(self) -> None:
+        self._executor.shutdown(wait=False, cancel_futures=True)
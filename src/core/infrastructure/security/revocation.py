@@ -0,0 +1,156 @@
+import asyncio
+import logging
+import time
+from collections import deque
+from datetime import datetime
+
+from pydantic import BaseModel
+
+from src.core.infrastructure.cache.bloom_filter import BloomFilter
+from src.core.infrastructure.repositories.revoked_token_repository import RevokedTokenRepository
+
+
+logger = logging.getLogger(__name__)
+
+
+class TokenRevocationStats(BaseModel):
+    """Snapshot of the revocation denylist used to size the filter from real traffic."""
+    entries: int
+    capacity: int
+    checks: int
+    filter_negatives: int
+    db_lookups: int
+    false_positives: int
+    rebuilds: int
+    pruned: int
+    last_rebuild_at: datetime | None = None
+
+
+class TokenRevocationStore:
+    """Denylist of revoked access tokens with Postgres as the source of truth.
+
+    A bloom filter over the revoked jtis sits in front of the table. A token not
+    in the filter is certainly not revoked and the check never reaches the database,
+    only filter hits - revoked tokens and the rare false positive - are looked up.
+    Local revocations are added to the filter at once, revocations made by other
+    nodes are picked up by the periodic rebuild, which also prunes expired entries.
+    """
+
+    def __init__(
+        self,
+        repository: RevokedTokenRepository,
+        capacity: int = 100000,
+        error_rate: float = 0.01,
+        refresh_interval: float = 60.0,
+    ):
+        """Initializes the store
+
+        Args:
+            repository (RevokedTokenRepository): Repository of the revoked_token table.
+            capacity (int, optional): Minimal number of entries the filter is sized for. Defaults to 100000.
+            error_rate (float, optional): False positive rate of the filter. Defaults to 0.01.
+            refresh_interval (float, optional): Seconds between rebuilds of the filter. Defaults to 60.0.
+        """
+        self.repository = repository
+        self.capacity = capacity
+        self.error_rate = error_rate
+        self.refresh_interval = refresh_interval
+        self._filter: BloomFilter | None = None
+        # (monotonic time, jti) of the local revocations since the previous rebuild started
+        self._recently_revoked: deque[tuple[float, str]] = deque()
+        self._task: asyncio.Task | None = None
+        self.checks = 0
+        self.filter_negatives = 0
+        self.db_lookups = 0
+        self.false_positives = 0
+        self.rebuilds = 0
+        self.pruned = 0
+        self.last_rebuild_at: datetime | None = None
+
+    async def is_revoked(self, jti: str) -> bool:
+        self.checks += 1
+        if self._filter is not None and jti not in self._filter:
+            self.filter_negatives += 1
+            return False
+
+        # filter hit or not built yet - ask the source of truth
+        self.db_lookups += 1
+        revoked = await self.repository.is_revoked(jti=jti)
+        if not revoked and self._filter is not None:
+            self.false_positives += 1
+        return revoked
+
+    async def revoke(self, jti: str, expires_at: datetime) -> None:
+        """Revokes the token until it expires.
+
+        The filter is updated before the commit, so a rolled back revocation only
+        costs a database lookup for that token until the next rebuild. The jti is
+        also kept for the following rebuilds, in case its transaction commits
+        after their snapshot of the table.
+        """
+        await self.repository.revoke(jti=jti, expires_at=expires_at)
+        if self._filter is not None:
+            self._filter.add(jti)
+        self._recently_revoked.append((time.monotonic(), jti))
+
+    async def rebuild(self) -> None:
+        """Prunes expired entries and swaps in a filter built from the table.
+
+        The local revocations made since the previous rebuild started are added
+        as well: the snapshot misses those whose transaction had not committed yet,
+        whether they were made during this rebuild or just before it.
+        """
+        started = time.monotonic()
+        self.pruned += await self.repository.prune_expired()
+        jtis = await self.repository.fetch_active_jtis()
+        bloom = BloomFilter(capacity=max(self.capacity, 2 * len(jtis)), error_rate=self.error_rate)
+        for jti in jtis:
+            bloom.add(jti)
+        for _, jti in self._recently_revoked:
+            bloom.add(jti)
+        self._filter = bloom
+        # the ones made before this rebuild are committed by the next snapshot
+        while self._recently_revoked and self._recently_revoked[0][0] < started:
+            self._recently_revoked.popleft()
+        self.rebuilds += 1
+        self.last_rebuild_at = datetime.now().astimezone()
+
+    async def _refresh_periodically(self) -> None:
+        while True:
+            await asyncio.sleep(self.refresh_interval)
+            try:
+                await self.rebuild()
+            except Exception:
+                # keep serving from the previous filter, new revocations are still added to it
+                logger.exception("Rebuilding the token revocation filter failed")
+
+    async def start(self) -> None:
+        """Builds the filter and schedules its periodic rebuild."""
+        try:
+            await self.rebuild()
+        except Exception:
+            logger.exception("Building the token revocation filter failed, checks fall back to the database")
+        self._task = asyncio.create_task(self._refresh_periodically())
+
+    async def stop(self) -> None:
+        if self._task is None:
+            return
+        self._task.cancel()
+        try:
+            await self._task
+        except asyncio.CancelledError:
+            pass
+        self._task = None
+
+    def stats(self) -> TokenRevocationStats:
+        return TokenRevocationStats(
+            entries=len(self._filter) if self._filter is not None else 0,
+            capacity=self._filter.capacity if self._filter is not None else self.capacity,
+            checks=self.checks,
+            filter_negatives=self.filter_negatives,
+            db_lookups=self.db_lookups,
+            false_positives=self.false_positives,
+            rebuilds=self.rebuilds,
+            pruned=self.pruned,
+            last_rebuild_at=self.last_rebuild_at,
+        )
@@ -1,10 +1,13 @@
-from fastapi import FastAPI, APIRouter
+from fastapi import FastAPI, APIRouter, Depends
+from fastapi.responses import ORJSONResponse
 from fastapi.middleware.cors import CORSMiddleware
 from contextlib import asynccontextmanager
 from typing import AsyncIterator
 from dependency_injector.containers import DeclarativeContainer
 from src.core.infrastructure.containers.common_container import initialized_resources, create_container
 from src.core.api.v1.router import router as v1_router
+from src.core.api.well_known import router as well_known_router
+from src.core.api.v1.dependencies.common_dependencies import request_unit_of_work
 
 
 class FastAPIWithContainer(FastAPI):
@@ -34,12 +37,12 @@ def create_app() -> FastAPI:
     app = FastAPIWithContainer(
         title=settings["title"],
         lifespan=lifespan,
+        default_response_class=ORJSONResponse,
         tags=[
             {
                 "name": "General",
                 "description": "General operations",
             },
-            #tutaj dodać routers
         ]
     )
 
@@ -53,7 +56,15 @@ def create_app() -> FastAPI:
 
     app.container = container
     app.include_router(router)
+    app.include_router(well_known_router)
     app.include_router(v1_router, prefix="/v1")
+    # modules are only listed here, each one is imported on its first request
+    container.module_registry().mount(
+        app,
+        hub_container=container,
+        prefix="/v1",
+        dependencies=[Depends(request_unit_of_work)]
+    )
 
     return app
 
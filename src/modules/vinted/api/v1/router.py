@@ -0,0 +1,4 @@
+from fastapi import APIRouter
+
+
+router = APIRouter(tags=["Vinted"])
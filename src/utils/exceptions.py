@@ -8,6 +8,7 @@ class CommandExecutionError(Exception):
 
 class HttpAwareException(Exception):
     status_code: int = 400
+    headers: dict[str, str] | None = None
 
     def __init__(self, message: str):
         super().__init__(message)
@@ -0,0 +1,138 @@
+import copy
+import json
+import logging
+import logging.handlers
+import random
+import threading
+import time
+from datetime import datetime, timezone
+from typing import Any
+
+
+# attributes every LogRecord has, anything else was passed in `extra`
+_RECORD_ATTRIBUTES = frozenset(vars(logging.LogRecord("", 0, "", 0, "", None, None))) | {"message", "asctime", "taskName"}
+
+
+def _level_number(level: int | str) -> int:
+    return level if isinstance(level, int) else logging.getLevelNamesMapping()[level.upper()]
+
+
+class JsonFormatter(logging.Formatter):
+    """Formats records as one JSON object per line.
+
+    Fields passed in `extra` are emitted next to the standard ones, values which
+    are not JSON serializable are rendered with str().
+    """
+
+    def format(self, record: logging.LogRecord) -> str:
+        entry: dict[str, Any] = {
+            "ts": datetime.fromtimestamp(record.created, tz=timezone.utc).isoformat(timespec="milliseconds"),
+            "level": record.levelname,
+            "logger": record.name,
+            "message": record.getMessage(),
+        }
+        for name, value in vars(record).items():
+            if name not in _RECORD_ATTRIBUTES:
+                entry[name] = value
+        if record.exc_info:
+            entry["exc_info"] = self.formatException(record.exc_info)
+        elif record.exc_text:
+            entry["exc_info"] = record.exc_text
+        if record.stack_info:
+            entry["stack_info"] = self.formatStack(record.stack_info)
+        return json.dumps(entry, default=str, ensure_ascii=False)
+
+
+class LocalQueueHandler(logging.handlers.QueueHandler):
+    """QueueHandler for a listener in the same process.
+
+    The base class formats the record and drops its traceback before enqueueing,
+    which costs the caller the formatting it tries to avoid. Here only the message
+    is merged with its arguments, formatting and writing happen on the listener thread.
+    """
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        record = copy.copy(record)
+        record.message = record.getMessage()
+        record.msg = record.message
+        record.args = None
+        return record
+
+
+class RateLimitFilter(logging.Filter):
+    """Token bucket per logger, dropping records above rate per second.
+
+    The first record let through after a drop carries the number of dropped ones
+    in `suppressed`, so a flood stays visible without flooding the output.
+    Records at or above always_level are never dropped.
+    """
+
+    def __init__(self, rate: float = 100.0, burst: int = 200, always_level: int | str = logging.CRITICAL):
+        super().__init__()
+        self.rate = rate
+        self.burst = burst
+        self.always_level = _level_number(always_level)
+        self._buckets: dict[str, tuple[float, float]] = {}
+        self._suppressed: dict[str, int] = {}
+        self._lock = threading.Lock()
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        if record.levelno >= self.always_level:
+            return True
+        now = time.monotonic()
+        with self._lock:
+            tokens, updated = self._buckets.get(record.name, (self.burst, now))
+            tokens = min(self.burst, tokens + (now - updated) * self.rate)
+            if tokens < 1:
+                self._buckets[record.name] = (tokens, now)
+                self._suppressed[record.name] = self._suppressed.get(record.name, 0) + 1
+                return False
+            self._buckets[record.name] = (tokens - 1, now)
+            suppressed = self._suppressed.pop(record.name, 0)
+        if suppressed:
+            record.suppressed = suppressed
+        return True
+
+
+class SamplingFilter(logging.Filter):
+    """Keeps a random fraction of the records below level, for noisy paths.
+
+    Kept records carry `sample_rate` so counts can be scaled back up.
+    """
+
+    def __init__(self, rate: float = 0.1, level: int | str = logging.WARNING):
+        super().__init__()
+        self.rate = rate
+        self.level = _level_number(level)
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        if record.levelno >= self.level:
+            return True
+        if random.random() >= self.rate:
+            return False
+        record.sample_rate = self.rate
+        return True
+
+
+def _queue_listeners() -> list[logging.handlers.QueueListener]:
+    listeners = []
+    for name in logging.getHandlerNames():
+        listener = getattr(logging.getHandlerByName(name), "listener", None)
+        if isinstance(listener, logging.handlers.QueueListener):
+            listeners.append(listener)
+    return listeners
+
+
+def start_queue_listeners() -> None:
+    """Starts the writer threads of the queue handlers created by dictConfig.
+
+    Records logged before are kept in the queue and written once started.
+    """
+    for listener in _queue_listeners():
+        listener.start()
+
+
+def stop_queue_listeners() -> None:
+    """Writes the queued records and stops the writer threads."""
+    for listener in _queue_listeners():
+        listener.stop()
@@ -1,4 +1,28 @@
 from src.utils.exceptions import HttpAwareException
 
 def generate_openapi_responses(*error_classes: type[HttpAwareException]) -> dict:
-    return {err.status_code: {"description": err.__doc__ or err.__name__} for err in error_classes}
+    responses = {}
+    for err in error_classes:
+        description = err.__doc__ or err.__name__
+        if err.status_code in responses:
+            description = f"{responses[err.status_code]['description']} | {description}"
+        responses[err.status_code] = {"description": description}
+    return responses
+
+
+def make_etag(value: object) -> str:
+    """Strong entity tag of the value, quoted as the ETag header requires."""
+    return f'"{value}"'
+
+
+def etag_matches(if_none_match: str | None, etag: str) -> bool:
+    """Whether an If-None-Match header matches the ETag.
+
+    The header is a list of entity tags or "*". If-None-Match compares them
+    weakly, so a W/ prefix added by a proxy still matches.
+    """
+    if not if_none_match:
+        return False
+    if if_none_match.strip() == "*":
+        return True
+    return any(tag.strip().removeprefix("W/") == etag for tag in if_none_match.split(","))